@@ -0,0 +1,159 @@
+"""
+Benchmark: latency added by the metrics and Server-Timing instrumentation
+
+Usage (from src/backend):
+    python benchmarks/bench_metrics_overhead.py [--requests N] [--rounds R]
+
+Sends GET /api/v1/tasks/{id} (one indexed query through TaskService) to two
+otherwise identical apps, in process through the ASGI interface: a baseline
+without any instrumentation, and one with MetricsMiddleware,
+ServerTimingMiddleware, the cursor execute hooks and the service method
+timers. Rounds alternate between the two so drift affects both equally.
+
+End to end the difference is usually within the noise of a shared machine,
+so the cost of the instrumentation itself (both middlewares around an empty
+app, one timed service call and the hooks of one query) is measured
+directly as well.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from core.dependencies import get_session_factory
+from core.metrics import MetricsMiddleware, timed
+from core.request_metrics import ServerTimingMiddleware, _start_query_timer, _stop_query_timer
+from database.connection import Base
+from database.models import Task, User
+from exceptions.handlers import register_exception_handlers
+from routers import tasks
+from services.notification_service import NotificationService
+from services.task_service import TaskService
+
+CURSOR_HOOKS = (("before_cursor_execute", _start_query_timer), ("after_cursor_execute", _stop_query_timer))
+TIMED_METHODS = {
+    service_class: {name: attr for name, attr in vars(service_class).items() if hasattr(attr, "__wrapped__")}
+    for service_class in (TaskService, NotificationService)
+}
+
+def set_instrumented(enabled: bool) -> None:
+    for identifier, hook in CURSOR_HOOKS:
+        if enabled and not event.contains(Engine, identifier, hook):
+            event.listen(Engine, identifier, hook)
+        elif not enabled and event.contains(Engine, identifier, hook):
+            event.remove(Engine, identifier, hook)
+    for service_class, methods in TIMED_METHODS.items():
+        for name, method in methods.items():
+            setattr(service_class, name, method if enabled else method.__wrapped__)
+
+def build_app(session_factory, instrumented: bool) -> FastAPI:
+    app = FastAPI()
+    if instrumented:
+        app.add_middleware(ServerTimingMiddleware)
+        app.add_middleware(MetricsMiddleware)
+    register_exception_handlers(app)
+    app.include_router(tasks.router)
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    return app
+
+async def time_requests(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("/api/v1/tasks/1", headers={"X-User-Id": "1"})
+            response.raise_for_status()
+        return (time.perf_counter() - started) / requests
+
+class FakeExecutionContext:
+    pass
+
+async def instrumentation_cost(iterations: int) -> float:
+    """Seconds added per request with one query, measured without any I/O"""
+    async def empty_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def discard(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+    instrumented_app = MetricsMiddleware(ServerTimingMiddleware(empty_app))
+    costs = []
+    for app in (empty_app, instrumented_app):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await app(dict(scope), None, discard)
+        costs.append(time.perf_counter() - started)
+
+    class BenchService:
+        def plain(self):
+            return None
+        timed_call = timed(plain)
+
+    service = BenchService()
+    for method in (service.plain, service.timed_call):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            method()
+        costs.append(time.perf_counter() - started)
+
+    context = FakeExecutionContext()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        _start_query_timer(None, None, "SELECT 1", None, context, False)
+        _stop_query_timer(None, None, "SELECT 1", None, context, False)
+    costs.append(time.perf_counter() - started)
+
+    bare_app, wrapped_app, plain_call, timed_call, hooks = costs
+    return ((wrapped_app - bare_app) + (timed_call - plain_call) + hooks) / iterations
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    now = datetime(2024, 3, 11, 9, 0)
+    with session_factory() as db:
+        db.add(User(id=1, username="bench", email="bench@test.com", password="x", created_at=now, updated_at=now))
+        db.add(Task(id=1, title="Read", created_by_user_id=1, created_at_utc=now, last_updated_at_utc=now))
+        db.commit()
+
+    apps = {False: build_app(session_factory, False), True: build_app(session_factory, True)}
+    timings = {False: [], True: []}
+    for instrumented in (False, True):
+        set_instrumented(instrumented)
+        await time_requests(apps[instrumented], args.requests // 10)
+    for round_number in range(args.rounds):
+        for instrumented in ((False, True) if round_number % 2 else (True, False)):
+            set_instrumented(instrumented)
+            timings[instrumented].append(await time_requests(apps[instrumented], args.requests))
+    set_instrumented(True)
+
+    baseline = statistics.median(timings[False])
+    instrumented = statistics.median(timings[True])
+    print(f"baseline:     {baseline * 1e6:.0f}us per request")
+    print(f"instrumented: {instrumented * 1e6:.0f}us per request")
+    print(f"overhead:     {(instrumented - baseline) * 1e6:.0f}us ({(instrumented / baseline - 1) * 100:.1f}%)")
+    cost = await instrumentation_cost(args.requests * 20)
+    print(f"instrumentation cost: {cost * 1e6:.1f}us per request ({cost / baseline * 100:.2f}% of baseline)")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
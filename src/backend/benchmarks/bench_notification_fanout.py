@@ -0,0 +1,81 @@
+"""
+Benchmark: per-row notification creation vs bulk fan-out
+
+Usage (from src/backend):
+    python benchmarks/bench_notification_fanout.py [--database-url URL]
+
+Defaults to an in-memory SQLite database; pass a PostgreSQL URL to measure
+real network round trips.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from database.connection import Base
+from database.models import Notification
+from services.notification_service import NotificationService
+
+RECIPIENT_COUNTS = (1_000, 10_000)
+
+TEMPLATE = {
+    "title": "Session starting",
+    "message": "Your study session starts in 5 minutes",
+    "notification_type": "info"
+}
+
+def count_statements(engine) -> list:
+    counter = [0]
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return counter
+
+def run_per_row(service: NotificationService, user_ids: list) -> None:
+    for user_id in user_ids:
+        service.create_notification(
+            {**TEMPLATE, "user_id": user_id, "created_at_utc": datetime.now(timezone.utc)},
+            requesting_user_id=0
+        )
+
+def run_bulk(service: NotificationService, user_ids: list) -> None:
+    service.create_notifications_bulk(TEMPLATE, user_ids, requesting_user_id=0)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    statements = count_statements(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    print(f"{'recipients':>10} {'path':>8} {'seconds':>9} {'rows/s':>10} {'statements':>11}")
+    for recipients in RECIPIENT_COUNTS:
+        user_ids = list(range(1, recipients + 1))
+        for name, runner in (("per-row", run_per_row), ("bulk", run_bulk)):
+            with SessionLocal() as db:
+                db.query(Notification).delete()
+                db.commit()
+                service = NotificationService(db)
+                statements[0] = 0
+                started = time.perf_counter()
+                runner(service, user_ids)
+                elapsed = time.perf_counter() - started
+            print(
+                f"{recipients:>10} {name:>8} {elapsed:>9.3f} "
+                f"{recipients / elapsed:>10.0f} {statements[0]:>11}"
+            )
+
+    Base.metadata.drop_all(bind=engine)
+
+if __name__ == "__main__":
+    main()
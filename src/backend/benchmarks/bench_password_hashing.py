@@ -0,0 +1,59 @@
+"""
+Benchmark: login throughput of the bcrypt hashing pool
+
+Usage (from src/backend):
+    python benchmarks/bench_password_hashing.py [--logins-per-worker N] [--rounds R]
+
+For each pool size every login is a verify_password_async call; the pool
+is warmed up before timing so process start-up is not counted.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.hashing as hashing
+from utils.hashing import PasswordHasher, PasswordHashingPool, pwd_context
+
+WORKER_COUNTS = (1, 2, 4, 8)
+PASSWORD = "benchmarkPassword123!"
+
+async def run_logins(pool: PasswordHashingPool, hashed: str, logins: int) -> float:
+    hashing._hashing_pool = pool
+    # Warm up every worker process
+    await asyncio.gather(*(
+        PasswordHasher.verify_password_async(PASSWORD, hashed) for _ in range(pool.max_workers)
+    ))
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        PasswordHasher.verify_password_async(PASSWORD, hashed) for _ in range(logins)
+    ))
+    elapsed = time.perf_counter() - started
+    assert all(results)
+    return elapsed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins-per-worker", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=None, help="bcrypt cost (library default if unset)")
+    args = parser.parse_args()
+
+    hashed = pwd_context.hash(PASSWORD, rounds=args.rounds) if args.rounds else pwd_context.hash(PASSWORD)
+    print(f"bcrypt hash: {hashed[:7]}... on {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'logins':>7} {'seconds':>8} {'logins/s':>9} {'logins/s/core':>14}")
+    for workers in WORKER_COUNTS:
+        pool = PasswordHashingPool(max_workers=workers, max_concurrency=workers * 2)
+        logins = workers * args.logins_per_worker
+        try:
+            elapsed = asyncio.run(run_logins(pool, hashed, logins))
+        finally:
+            pool.shutdown()
+        rate = logins / elapsed
+        cores = min(workers, os.cpu_count() or 1)
+        print(f"{workers:>7} {logins:>7} {elapsed:>8.2f} {rate:>9.1f} {rate / cores:>14.1f}")
+
+if __name__ == "__main__":
+    main()
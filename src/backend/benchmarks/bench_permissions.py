@@ -0,0 +1,48 @@
+"""
+Microbenchmark: permission checks with compiled bitmasks vs JSON list scans
+
+Usage (from src/backend):
+    python benchmarks/bench_permissions.py [--permissions N] [--checks N]
+
+The list-scan baseline mirrors what a check against the raw Role.permissions
+JSON column costs: deserialize the list, then scan it.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.role_repository import RoleSnapshot
+from utils.permissions import PermissionRegistry
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--permissions", type=int, default=50)
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    permissions = [f"resource_{i}:write" for i in range(args.permissions)]
+    raw_permissions = json.dumps(permissions)
+    wanted = permissions[-1]
+    now = datetime.now(timezone.utc)
+    role = RoleSnapshot(1, "bench", "Benchmark role", frozenset(permissions), True, now, now)
+    registry = PermissionRegistry()
+    registry.has_permission(role, wanted)
+
+    cases = {
+        "json list scan": lambda: wanted in json.loads(raw_permissions),
+        "list scan": lambda: wanted in permissions,
+        "bitmask": lambda: registry.has_permission(role, wanted)
+    }
+
+    print(f"{args.permissions} permissions per role, {args.checks} checks, worst-case position")
+    for name, check in cases.items():
+        seconds = min(timeit.repeat(check, number=args.checks, repeat=3))
+        print(f"{name:>15}: {seconds / args.checks * 1e9:8.1f} ns/check")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: due date reminder pass over a large table of open tasks
+
+Usage (from src/backend):
+    python benchmarks/bench_reminders.py [--tasks N] [--spread-days D] [--batch-size B]
+
+Due dates are spread evenly over --spread-days, so roughly N / D tasks
+fall in the 24h window. Tasks are scanned in keyset chunks through the
+due_date index; the RSS growth shows memory stays bounded by the chunk.
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from database.connection import Base
+from services.reminder_service import ReminderService
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--spread-days", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2024, 3, 11, 9, 0)
+    step_seconds = args.spread_days * 86400 / args.tasks
+
+    try:
+        with sessionmaker(bind=engine)() as db:
+            db.execute(text("""
+                INSERT INTO tasks (title, priority_level, task_status, created_by_user_id, due_date,
+                                   created_at_utc, last_updated_at_utc)
+                WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :tasks)
+                SELECT 'Task ' || n, 'MEDIUM', 'PENDING', n % 1000 + 1,
+                       datetime(:now, '+' || CAST(n * :step AS INTEGER) || ' seconds'),
+                       :now, :now
+                FROM seq
+            """), {"tasks": args.tasks, "now": now.isoformat(" "), "step": step_seconds})
+            db.commit()
+            rss_before = peak_rss_mb()
+
+            started = time.perf_counter()
+            sent = ReminderService(db).send_due_reminders([24], now=now, batch_size=args.batch_size)
+            elapsed = time.perf_counter() - started
+
+            started = time.perf_counter()
+            resent = ReminderService(db).send_due_reminders([24], now=now, batch_size=args.batch_size)
+            rerun_elapsed = time.perf_counter() - started
+            rss_growth = peak_rss_mb() - rss_before
+    finally:
+        Base.metadata.drop_all(bind=engine)
+
+    print(
+        f"tasks={args.tasks}: {sent} reminders in {elapsed:.2f}s ({sent / elapsed:.0f}/s), "
+        f"rerun sent {resent} in {rerun_elapsed * 1000:.0f} ms, "
+        f"peak RSS +{rss_growth:.1f} MB"
+    )
+
+if __name__ == "__main__":
+    main()
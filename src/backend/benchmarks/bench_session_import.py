@@ -0,0 +1,85 @@
+"""
+Benchmark: streaming import of historical sessions from CSV or NDJSON
+
+Usage (from src/backend):
+    python benchmarks/bench_session_import.py [--sessions N] [--format csv|ndjson]
+
+The file is generated in memory, so the rate covers parsing, validation,
+the bulk insert and the study time rollups.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database.connection import Base
+from database.models import User
+from services.session_service import SessionService
+
+FIELDS = ["name", "created_by", "start_time", "end_time", "status", "category"]
+
+def generate_file(count: int, import_format: str) -> io.StringIO:
+    rng = random.Random(1)
+    base = datetime(2020, 1, 1)
+    categories = ["math", "physics", "history", "languages"]
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, FIELDS)
+    if import_format == "csv":
+        writer.writeheader()
+    for i in range(count):
+        start = base + timedelta(seconds=rng.randrange(4 * 365 * 86400))
+        row = {
+            "name": f"Imported session {i}",
+            "created_by": 1,
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=rng.randrange(600, 3 * 3600))).isoformat(),
+            "status": "completed",
+            "category": rng.choice(categories)
+        }
+        if import_format == "csv":
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row) + "\n")
+    buffer.seek(0)
+    return buffer
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    stream = generate_file(args.sessions, args.format)
+
+    try:
+        with sessionmaker(bind=engine)() as db:
+            now = datetime.now()
+            db.add(User(id=1, username="importer", email="importer@example.com", password="x", created_at=now, updated_at=now))
+            db.commit()
+
+            started = time.perf_counter()
+            report = SessionService(db).import_sessions_file(stream, args.format, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - started
+    finally:
+        Base.metadata.drop_all(bind=engine)
+
+    print(
+        f"sessions={args.sessions} format={args.format}: {report.created} created, "
+        f"{len(report.errors)} rejected in {elapsed:.2f}s ({report.created / elapsed:.0f} rows/s)"
+    )
+
+if __name__ == "__main__":
+    main()
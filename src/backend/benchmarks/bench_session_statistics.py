@@ -0,0 +1,117 @@
+"""
+Benchmark: session history statistics, NumPy over raw columns vs a Python loop over ORM rows
+
+Usage (from src/backend):
+    python benchmarks/bench_session_statistics.py [--sizes 10000 100000 1000000]
+
+Both paths read the same user's sessions from the database and compute
+total/mean, daily buckets (split at midnight), streaks and percentiles.
+Fetch and compute time are reported together since avoiding ORM
+instances is half of the win.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from database.connection import Base
+from database.models import Session as StudySession
+from services.analytics_service import AnalyticsService
+
+def generate_sessions(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    base = datetime(2020, 1, 1)
+    for i in range(count):
+        start = base + timedelta(seconds=rng.randrange(5 * 365 * 86400))
+        end = start + timedelta(seconds=rng.randrange(300, 4 * 3600))
+        yield {
+            "name": f"session {i}",
+            "created_by": 1,
+            "start_time": start,
+            "end_time": end,
+            "status": "completed",
+            "category": "general",
+            "created_at": start,
+            "updated_at": start
+        }
+
+def python_statistics(db, user_id: int, today: date) -> dict:
+    sessions = db.query(StudySession).filter(
+        StudySession.created_by == user_id,
+        StudySession.status != "cancelled"
+    ).all()
+
+    durations = []
+    daily = defaultdict(int)
+    for session in sessions:
+        durations.append((session.end_time - session.start_time).total_seconds())
+        cursor = session.start_time
+        while cursor < session.end_time:
+            chunk_end = min(session.end_time, datetime.combine(cursor.date() + timedelta(days=1), datetime.min.time()))
+            daily[cursor.date()] += int((chunk_end - cursor).total_seconds())
+            cursor = chunk_end
+
+    durations.sort()
+    percentiles = {p: durations[min(len(durations) - 1, int(len(durations) * p / 100))] for p in (50, 75, 90, 95)}
+
+    longest = current = 0
+    day, run = min(daily), 0
+    while day <= today:
+        run = run + 1 if daily.get(day) else 0
+        longest = max(longest, run)
+        day += timedelta(days=1)
+    current = run if run else 0
+
+    return {
+        "total": sum(durations),
+        "mean": sum(durations) / len(durations),
+        "percentiles": percentiles,
+        "longest_streak": longest,
+        "current_streak": current
+    }
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    today = date(2025, 1, 1)
+    for size in args.sizes:
+        engine = create_engine(args.database_url)
+        Base.metadata.create_all(bind=engine)
+        try:
+            with sessionmaker(bind=engine)() as db:
+                rows = list(generate_sessions(size))
+                db.execute(insert(StudySession), rows)
+                db.commit()
+                del rows
+
+                numpy_result, numpy_elapsed = timed(lambda: AnalyticsService(db).get_session_statistics(1, today))
+                db.expunge_all()
+                python_result, python_elapsed = timed(lambda: python_statistics(db, 1, today))
+        finally:
+            Base.metadata.drop_all(bind=engine)
+            engine.dispose()
+
+        assert numpy_result.total_seconds == python_result["total"]
+        assert numpy_result.longest_streak == python_result["longest_streak"]
+        print(
+            f"sessions={size}: numpy {numpy_elapsed * 1000:.0f} ms, "
+            f"python {python_elapsed * 1000:.0f} ms ({python_elapsed / numpy_elapsed:.1f}x)"
+        )
+
+if __name__ == "__main__":
+    main()
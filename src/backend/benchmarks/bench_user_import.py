@@ -0,0 +1,64 @@
+"""
+Benchmark: bulk user import (validation, parallel hashing, chunked inserts)
+
+Usage (from src/backend):
+    python benchmarks/bench_user_import.py [--users N] [--rounds R] [--workers W]
+
+bcrypt dominates the cost, so the reported rate scales with the chosen
+cost and the number of hashing workers.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import utils.hashing as hashing
+from database.connection import Base
+from services.user_service import UserService
+from utils.hashing import PasswordHashingPool, configure_bcrypt_rounds
+
+def generate_users(count: int):
+    for i in range(count):
+        yield {
+            "username": f"student{i}",
+            "email": f"student{i}@example.com",
+            "password": f"StudentPassword{i}!"
+        }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    configure_bcrypt_rounds(args.rounds)
+    hashing._hashing_pool = PasswordHashingPool(max_workers=args.workers)
+    # Start the worker processes before timing
+    hashing._hashing_pool.map(hashing._hash_password, ["warm-up"] * args.workers, [args.rounds] * args.workers)
+
+    try:
+        with sessionmaker(bind=engine)() as db:
+            started = time.perf_counter()
+            report = UserService(db).import_users(generate_users(args.users), chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - started
+    finally:
+        hashing._hashing_pool.shutdown()
+        Base.metadata.drop_all(bind=engine)
+
+    print(
+        f"users={args.users} cost={args.rounds} workers={args.workers}: "
+        f"{report.created} created, {len(report.errors)} rejected in {elapsed:.2f}s "
+        f"({report.created / elapsed:.0f} users/s)"
+    )
+
+if __name__ == "__main__":
+    main()
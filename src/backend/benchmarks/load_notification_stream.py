@@ -0,0 +1,147 @@
+"""
+Load test: many idle notification streams held by a single worker
+
+Usage (from src/backend):
+    python benchmarks/load_notification_stream.py [--connections N] [--idle-seconds S]
+
+Starts one uvicorn worker in a child process, opens N Server-Sent Events
+connections to it (one user each) and keeps them idle, reporting the
+worker's RSS and CPU use while idle. It then publishes one notification to
+every user and measures how long delivery takes. Server and clients live in
+separate processes, so each needs roughly N file descriptors.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def raise_file_limit() -> int:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+def process_rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def process_cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    # utime and stime, in clock ticks
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+async def serve(port: int, connections: int) -> None:
+    import uvicorn
+    from main import app
+    from utils.notification_hub import notification_hub
+
+    def publish_to_everyone() -> None:
+        payload = {"id": 0, "title": "Load test", "sent_at": time.time()}
+        notification_hub.publish_many((user_id, payload) for user_id in range(1, connections + 1))
+
+    asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, publish_to_everyone)
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, lifespan="off",
+                            log_level="warning", backlog=4096)
+    await uvicorn.Server(config).serve()
+
+async def open_stream(port: int, user_id: int, limit: asyncio.Semaphore):
+    async with limit:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"GET /api/v1/notifications/stream?user_id={user_id} HTTP/1.1\r\n"
+            f"Host: 127.0.0.1\r\nAccept: text/event-stream\r\n\r\n".encode()
+        )
+        headers = await reader.readuntil(b"\r\n\r\n")
+        if not headers.startswith(b"HTTP/1.1 200"):
+            raise RuntimeError(headers.split(b"\r\n", 1)[0].decode())
+        return reader, writer
+
+async def receive_notification(reader: asyncio.StreamReader) -> float:
+    while True:
+        # Chunked transfer encoding: skip size lines and keep-alive comments
+        line = await reader.readline()
+        if line.startswith(b"data: "):
+            sent_at = json.loads(line[6:])["sent_at"]
+            return time.time() - sent_at
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+async def run_load(server: subprocess.Popen, args: argparse.Namespace) -> None:
+    rss_before = process_rss_mb(server.pid)
+    limit = asyncio.Semaphore(500)
+
+    started = time.perf_counter()
+    streams = await asyncio.gather(*(open_stream(args.port, user_id, limit)
+                                     for user_id in range(1, args.connections + 1)))
+    connect_elapsed = time.perf_counter() - started
+    rss_connected = process_rss_mb(server.pid)
+
+    cpu_before = process_cpu_seconds(server.pid)
+    await asyncio.sleep(args.idle_seconds)
+    idle_cpu = process_cpu_seconds(server.pid) - cpu_before
+
+    receivers = [asyncio.create_task(receive_notification(reader)) for reader, _ in streams]
+    await asyncio.sleep(0.1)
+    server.send_signal(signal.SIGUSR1)
+    latencies = sorted(await asyncio.wait_for(asyncio.gather(*receivers), timeout=60))
+
+    for _, writer in streams:
+        writer.close()
+
+    per_connection_kb = (rss_connected - rss_before) * 1024 / args.connections
+    print(f"connections: {args.connections} opened in {connect_elapsed:.2f}s")
+    print(f"server RSS: {rss_before:.0f}MB idle -> {rss_connected:.0f}MB connected "
+          f"({per_connection_kb:.1f}KB per connection)")
+    print(f"server CPU while idle for {args.idle_seconds:.0f}s: {idle_cpu:.2f}s")
+    print(f"delivered: {len(latencies)}, latency p50 {statistics.median(latencies) * 1000:.0f}ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.0f}ms, "
+          f"max {latencies[-1] * 1000:.0f}ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    file_limit = raise_file_limit()
+    if args.serve:
+        asyncio.run(serve(args.port, args.connections))
+        return
+    if file_limit < args.connections + 100:
+        parser.error(f"--connections needs a file descriptor limit above {args.connections + 100}, have {file_limit}")
+
+    server = subprocess.Popen([
+        sys.executable, os.path.abspath(__file__), "--serve",
+        "--port", str(args.port), "--connections", str(args.connections)
+    ])
+    try:
+        wait_for_port(args.port)
+        asyncio.run(run_load(server, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import PostgresDsn, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from functools import lru_cache
 from dotenv import load_dotenv
 
@@ -10,12 +10,84 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: PostgresDsn
+
+    # Database pool settings, per worker process. With DB_POOL_PRE_PING every
+    # checkout first tests the connection (pessimistic); without it broken
+    # connections are only detected and replaced when a query fails, so keep
+    # DB_POOL_RECYCLE below the server's idle timeout. LIFO reuse keeps the
+    # idle connections few so the server can time out the rest.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_USE_LIFO: bool = False
+
+    # Async database pool settings; recycle, pre-ping and LIFO are shared
+    ASYNC_DB_POOL_SIZE: int = 10
+    ASYNC_DB_MAX_OVERFLOW: int = 20
+    ASYNC_DB_POOL_TIMEOUT: float = 30.0
     
     # Security settings
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # Password hashing settings (None = one worker per CPU core,
+    # concurrency defaults to twice the worker count)
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_MAX_CONCURRENCY: Optional[int] = None
+
+    # bcrypt cost: a fixed PASSWORD_HASH_ROUNDS wins, otherwise the cost is
+    # calibrated at startup to the target verify latency
+    PASSWORD_HASH_ROUNDS: Optional[int] = None
+    PASSWORD_HASH_TARGET_MS: int = 250
+    PASSWORD_HASH_MIN_ROUNDS: int = 10
+    PASSWORD_HASH_MAX_ROUNDS: int = 15
     
+    # Role cache settings; set ROLE_CACHE_INVALIDATION_FILE to a path shared by
+    # all workers so they drop their caches when any of them changes a role
+    ROLE_CACHE_TTL_SECONDS: float = 300.0
+    ROLE_CACHE_MAX_SIZE: int = 1024
+    ROLE_CACHE_INVALIDATION_FILE: Optional[str] = None
+
+    # Due date reminders: every REMINDER_INTERVAL_SECONDS open tasks due within
+    # each window (in hours) get one reminder notification per window
+    REMINDER_SCHEDULER_ENABLED: bool = True
+    REMINDER_INTERVAL_SECONDS: float = 300.0
+    REMINDER_WINDOWS_HOURS: List[int] = [24, 1]
+    REMINDER_BATCH_SIZE: int = 1000
+
+    # Study timers are written to the database at most this often
+    TIMER_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Notification push over SSE/WebSocket: events queued per connection
+    # before the overflow policy ("coalesce" or "drop_oldest") kicks in, and
+    # how often idle SSE streams send a keep-alive comment
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = 100
+    NOTIFICATION_STREAM_OVERFLOW_POLICY: str = "coalesce"
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    # Query profiler: the fraction of statements aggregated by fingerprint,
+    # how many fingerprints are kept, and the duration above which every
+    # statement is logged as a slow query; adjustable at runtime through
+    # /api/v1/admin/query-profiler
+    QUERY_PROFILER_ENABLED: bool = True
+    QUERY_PROFILER_SAMPLE_RATE: float = 0.05
+    QUERY_PROFILER_MAX_FINGERPRINTS: int = 500
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+
+    # Readiness probe: results are cached this long so polling never adds
+    # database load; the worker reports unavailable when the database check
+    # takes longer than the timeout, when this fraction of the pool's
+    # connections (overflow included) is in use, or when the event loop
+    # wakes up later than the allowed lag
+    HEALTH_CHECK_CACHE_TTL_SECONDS: float = 2.0
+    HEALTH_CHECK_DB_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_MAX_POOL_SATURATION: float = 1.0
+    HEALTH_MAX_EVENT_LOOP_LAG_SECONDS: float = 1.0
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+
     # Server settings
     SERVER_HOST: str = "0.0.0.0"
     SERVER_PORT: int = 8000
@@ -23,12 +95,18 @@ class Settings(BaseSettings):
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=True
+        case_sensitive=True,
+        extra="ignore"
     )
 
     def get_database_url(self) -> str:
         return str(self.DATABASE_URL)
 
+    def get_async_database_url(self) -> str:
+        scheme, _, rest = self.get_database_url().partition("://")
+        driver = scheme.split("+", 1)[0]
+        return f"{driver}+asyncpg://{rest}"
+
 @lru_cache()
 def get_settings() -> Settings:
     return Settings()
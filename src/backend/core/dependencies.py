@@ -0,0 +1,112 @@
+from typing import AsyncGenerator, Callable, Dict, Optional, Type, TypeVar
+from fastapi import Depends, Header, HTTPException
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from database.connection import database_connection
+from services.analytics_service import AnalyticsService
+from services.notification_service import NotificationService
+from services.role_service import RoleService
+from services.session_service import SessionService
+from services.task_service import TaskService
+from services.user_service import UserService
+
+S = TypeVar("S")
+
+def get_session_factory() -> Callable[[], Session]:
+    return database_connection.SessionLocal
+
+class RequestServices:
+    """
+    Services of one request, all sharing a single database session
+
+    The session is only created when the first service is requested, and a
+    Session checks out a pooled connection only on its first query, so
+    requests that never reach the database never hold a connection. Each
+    service is built at most once per request.
+    """
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+        self._db: Optional[Session] = None
+        self._services: Dict[type, object] = {}
+
+    @property
+    def opened(self) -> bool:
+        return self._db is not None
+
+    @property
+    def db(self) -> Session:
+        if self._db is None:
+            self._db = self._session_factory()
+        return self._db
+
+    def get(self, service_class: Type[S]) -> S:
+        service = self._services.get(service_class)
+        if service is None:
+            service = self._services[service_class] = service_class(self.db)
+        return service
+
+    @property
+    def sessions(self) -> SessionService:
+        return self.get(SessionService)
+
+    @property
+    def tasks(self) -> TaskService:
+        return self.get(TaskService)
+
+    @property
+    def notifications(self) -> NotificationService:
+        return self.get(NotificationService)
+
+    @property
+    def users(self) -> UserService:
+        return self.get(UserService)
+
+    @property
+    def analytics(self) -> AnalyticsService:
+        return self.get(AnalyticsService)
+
+    @property
+    def roles(self) -> RoleService:
+        return self.get(RoleService)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._services.clear()
+
+async def get_services(
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
+) -> AsyncGenerator[RequestServices, None]:
+    # FastAPI caches dependencies per request, so every dependency below
+    # shares this container. Closing may roll back, which blocks, so it only
+    # leaves the event loop when a session was actually opened.
+    services = RequestServices(session_factory)
+    try:
+        yield services
+    finally:
+        if services.opened:
+            await run_in_threadpool(services.close)
+
+def get_session_service(services: RequestServices = Depends(get_services)) -> SessionService:
+    return services.sessions
+
+def get_task_service(services: RequestServices = Depends(get_services)) -> TaskService:
+    return services.tasks
+
+def get_notification_service(services: RequestServices = Depends(get_services)) -> NotificationService:
+    return services.notifications
+
+def get_current_user_id(x_user_id: Optional[int] = Header(None)) -> int:
+    """ID of the acting user, taken from the X-User-Id header"""
+    if x_user_id is None:
+        raise HTTPException(status_code=401, detail="X-User-Id header is required")
+    return x_user_id
+
+def require_admin(
+    user_id: int = Depends(get_current_user_id),
+    services: RequestServices = Depends(get_services)
+) -> int:
+    """ID of the acting user, who must hold an admin role"""
+    services.roles.verify_admin_access(user_id)
+    return user_id
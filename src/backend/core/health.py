@@ -0,0 +1,155 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from core.config import settings
+from database.connection import DatabaseConnection, database_connection
+import logging
+
+logger = logging.getLogger(__name__)
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a task sleeping for interval_seconds
+
+    Blocking calls on the loop show up as lag. The maximum is kept until the
+    next readiness check takes it, so spikes between polls are not missed.
+    """
+    def __init__(self, interval_seconds: float = 0.5):
+        self.interval_seconds = interval_seconds
+        self.lag_seconds: Optional[float] = None
+        self._max_lag_seconds = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def record(self, lag_seconds: float) -> None:
+        self.lag_seconds = lag_seconds
+        if lag_seconds > self._max_lag_seconds:
+            self._max_lag_seconds = lag_seconds
+
+    def take_max_lag(self) -> float:
+        max_lag, self._max_lag_seconds = self._max_lag_seconds, 0.0
+        return max_lag
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="event-loop-lag")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.record(max(0.0, loop.time() - expected))
+
+class HealthChecker:
+    """
+    Readiness of this worker: database reachable, pool not exhausted, loop responsive
+
+    The result is cached for ttl_seconds, so however many load balancers
+    poll, the database sees at most one check per TTL. A database check
+    that outlives its timeout keeps running in its thread and later probes
+    wait on it instead of starting another one.
+    """
+    def __init__(
+        self,
+        database: DatabaseConnection,
+        lag_monitor: EventLoopLagMonitor,
+        ttl_seconds: float = 2.0,
+        db_timeout_seconds: float = 2.0,
+        max_pool_saturation: float = 1.0,
+        max_event_loop_lag_seconds: float = 1.0
+    ):
+        self.database = database
+        self.lag_monitor = lag_monitor
+        self.ttl_seconds = ttl_seconds
+        self.db_timeout_seconds = db_timeout_seconds
+        self.max_pool_saturation = max_pool_saturation
+        self.max_event_loop_lag_seconds = max_event_loop_lag_seconds
+        self._result: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._db_check: Optional[asyncio.Future] = None
+
+    async def readiness(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self._result is None or now >= self._expires_at:
+            self._result = await self._evaluate()
+            self._expires_at = time.monotonic() + self.ttl_seconds
+        return self._result
+
+    async def _evaluate(self) -> Dict[str, Any]:
+        checks = {
+            "database": await self._check_database(),
+            "pool": self._check_pool(),
+            "event_loop": self._check_event_loop()
+        }
+        ready = all(check["status"] == "ok" for check in checks.values())
+        return {
+            "status": "ok" if ready else "unavailable",
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks
+        }
+
+    async def _check_database(self) -> Dict[str, Any]:
+        if self._db_check is None or self._db_check.done():
+            self._db_check = asyncio.ensure_future(asyncio.to_thread(self._timed_connection_check))
+        try:
+            latency = await asyncio.wait_for(asyncio.shield(self._db_check), self.db_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"Database health check timed out after {self.db_timeout_seconds}s")
+            return {"status": "error", "error": "timed out"}
+        except Exception as error:
+            logger.error(f"Database health check failed: {error}")
+            return {"status": "error", "error": type(error).__name__}
+        return {"status": "ok", "latency_ms": latency * 1000}
+
+    def _timed_connection_check(self) -> float:
+        started = time.perf_counter()
+        self.database.check_connection()
+        return time.perf_counter() - started
+
+    def _check_pool(self) -> Dict[str, Any]:
+        snapshot = self.database.pool_metrics()["sync"]
+        capacity = snapshot["pool_size"] + max(0, snapshot["max_overflow"])
+        saturation = snapshot["in_use"] / capacity if capacity else 0.0
+        return {
+            "status": "ok" if saturation < self.max_pool_saturation else "saturated",
+            "saturation": saturation,
+            "in_use": snapshot["in_use"],
+            "capacity": capacity,
+            "checkout_timeouts": snapshot["checkout_timeouts"]
+        }
+
+    def _check_event_loop(self) -> Dict[str, Any]:
+        if not self.lag_monitor.running:
+            return {"status": "ok", "monitored": False}
+        max_lag = self.lag_monitor.take_max_lag()
+        return {
+            "status": "ok" if max_lag < self.max_event_loop_lag_seconds else "lagging",
+            "monitored": True,
+            "lag_ms": (self.lag_monitor.lag_seconds or 0.0) * 1000,
+            "max_lag_ms": max_lag * 1000
+        }
+
+event_loop_lag_monitor = EventLoopLagMonitor(settings.EVENT_LOOP_LAG_INTERVAL_SECONDS)
+
+health_checker = HealthChecker(
+    database_connection,
+    event_loop_lag_monitor,
+    settings.HEALTH_CHECK_CACHE_TTL_SECONDS,
+    settings.HEALTH_CHECK_DB_TIMEOUT_SECONDS,
+    settings.HEALTH_MAX_POOL_SATURATION,
+    settings.HEALTH_MAX_EVENT_LOOP_LAG_SECONDS
+)
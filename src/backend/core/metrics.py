@@ -0,0 +1,259 @@
+import bisect
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+class _ShardedMetric:
+    """
+    Metric whose samples are kept per thread
+
+    Each thread only ever writes to its own shard, so recording takes no
+    lock; a scrape copies every shard (an atomic dict copy under the GIL)
+    and adds them up. Shards of finished threads are kept.
+    """
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[Tuple, Any]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[Tuple, Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+    def _snapshots(self) -> List[Dict[Tuple, Any]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_ShardedMetric):
+    kind = "counter"
+
+    def inc(self, labels: Tuple = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple, float]:
+        totals: Dict[Tuple, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+class Histogram(_ShardedMetric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, labels: Tuple = ()) -> None:
+        shard = self._shard()
+        # Per-bucket counts followed by the sum of observed values
+        entry = shard.get(labels)
+        if entry is None:
+            entry = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    def values(self) -> Dict[Tuple, List[float]]:
+        totals: Dict[Tuple, List[float]] = {}
+        for shard in self._snapshots():
+            for labels, entry in shard.items():
+                entry = list(entry)
+                total = totals.get(labels)
+                if total is None:
+                    totals[labels] = entry
+                else:
+                    for index, value in enumerate(entry):
+                        total[index] += value
+        return totals
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, entry in sorted(self.values().items()):
+            lines.extend(render_histogram(self.name, self.labelnames, labels, self.buckets, entry[:-1], entry[-1]))
+        return lines
+
+def render_histogram(
+    name: str,
+    labelnames: Sequence[str],
+    labels: Sequence[Any],
+    buckets: Sequence[float],
+    counts: Sequence[int],
+    total: float
+) -> List[str]:
+    """Exposition lines of one histogram series; counts are per bucket, +Inf last"""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(tuple(buckets) + ("+Inf",), counts):
+        cumulative += count
+        bucket_labels = format_labels(tuple(labelnames) + ("le",), tuple(labels) + (bound,))
+        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+    series_labels = format_labels(labelnames, labels)
+    lines.append(f"{name}_sum{series_labels} {total}")
+    lines.append(f"{name}_count{series_labels} {cumulative}")
+    return lines
+
+class MetricsRegistry:
+    """Metrics of this worker process rendered in the Prometheus text format"""
+    def __init__(self):
+        self._metrics: List[_ShardedMetric] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a callable producing exposition lines at scrape time, e.g. for gauges"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Time to handle a request, by route template and response status",
+    ("method", "route", "status")
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "Time the database spent on a statement, by statement type",
+    ("operation",)
+)
+SERVICE_METHOD_DURATION = registry.histogram(
+    "service_method_duration_seconds",
+    "Time spent in a service method, including failed calls",
+    ("service", "method")
+)
+SERVICE_METHOD_ERRORS = registry.counter(
+    "service_method_errors_total",
+    "Service method calls that raised",
+    ("service", "method")
+)
+
+# "Service.method" of the outermost timed call in progress, for the slow query log
+current_service_method: ContextVar[Optional[str]] = ContextVar("current_service_method", default=None)
+
+def timed(method: Callable) -> Callable:
+    """Record the duration of a service method under its class and method name"""
+    labels = tuple(method.__qualname__.split(".")[-2:])
+    name = ".".join(labels)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = current_service_method.set(name) if current_service_method.get() is None else None
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        except Exception:
+            SERVICE_METHOD_ERRORS.inc(labels)
+            raise
+        finally:
+            SERVICE_METHOD_DURATION.observe(time.perf_counter() - started, labels)
+            if token is not None:
+                current_service_method.reset(token)
+    return wrapper
+
+class MetricsMiddleware:
+    """
+    Record the latency and status of every HTTP request
+
+    Requests are labelled by route template, not by raw path, so IDs in
+    URLs don't create new series; paths that match no route share one label.
+    Streamed responses are measured until the body is complete, except
+    text/event-stream ones, which stay open for as long as the client is
+    connected and are measured until their headers are sent.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        recorded = False
+        started = time.perf_counter()
+
+        def record() -> None:
+            nonlocal recorded
+            recorded = True
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                (scope["method"], getattr(route, "path", "unmatched"), status)
+            )
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if Headers(raw=message.get("headers", [])).get("content-type", "").startswith("text/event-stream"):
+                    record()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            if not recorded:
+                record()
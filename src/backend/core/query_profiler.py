@@ -0,0 +1,187 @@
+import functools
+import math
+import random
+import re
+import threading
+from typing import Any, Dict, List, Optional
+from core.config import settings
+from core.metrics import current_service_method
+import logging
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# qmark (sqlite), format/pyformat (psycopg2) and numeric (asyncpg) parameters
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so that executions differing only in values match
+
+    Literals and parameters become ?, value lists such as IN (...) and
+    multi-row VALUES collapse to one (...), and whitespace is squeezed.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = _REPEATED_LISTS.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+class FingerprintStats:
+    """
+    Timings of one fingerprint; p99 comes from a bounded reservoir sample
+
+    Each sample is weighted by 1 / sample_rate at the time it was taken, so
+    count and total estimate all executions even when the rate changes.
+    """
+    __slots__ = ("fingerprint", "sampled", "count", "total", "max", "samples")
+
+    def __init__(self, statement_fingerprint: str):
+        self.fingerprint = statement_fingerprint
+        self.sampled = 0
+        self.count = 0.0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: List[float] = []
+
+    def add(self, seconds: float, weight: float, reservoir_size: int) -> None:
+        self.sampled += 1
+        self.count += weight
+        self.total += seconds * weight
+        if seconds > self.max:
+            self.max = seconds
+        if len(self.samples) < reservoir_size:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self.sampled)
+            if slot < reservoir_size:
+                self.samples[slot] = seconds
+
+    def percentile(self, percent: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": round(self.count),
+            "sampled": self.sampled,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000
+        }
+
+class QueryProfiler:
+    """
+    Sampled per-fingerprint query timings plus a slow query log
+
+    A sample_rate fraction of statements is aggregated by fingerprint; at
+    most max_fingerprints are kept, and a new one evicts the entry with the
+    least total time. Every statement slower than slow_query_threshold_ms is
+    logged with the service method that issued it, sampled or not. Counts
+    and totals are estimates: each sample stands for 1 / sample_rate
+    executions; max and p99 come from the samples themselves.
+    """
+    ORDERINGS = ("total", "p99", "count", "max")
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 0.05,
+        slow_query_threshold_ms: float = 200.0,
+        max_fingerprints: int = 500,
+        reservoir_size: int = 256
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.max_fingerprints = max_fingerprints
+        self.reservoir_size = reservoir_size
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        slow_query_threshold_ms: Optional[float] = None
+    ) -> None:
+        if sample_rate is not None and not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        if slow_query_threshold_ms is not None and slow_query_threshold_ms < 0:
+            raise ValueError("Slow query threshold must not be negative")
+        if enabled is not None:
+            self.enabled = enabled
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if slow_query_threshold_ms is not None:
+            self.slow_query_threshold_ms = slow_query_threshold_ms
+
+    def record(self, statement: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        if seconds * 1000 >= self.slow_query_threshold_ms:
+            self._log_slow_query(statement, seconds)
+        sample_rate = self.sample_rate
+        if sample_rate < 1 and random.random() >= sample_rate:
+            return
+
+        statement_fingerprint = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(statement_fingerprint)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    coldest = min(self._stats.values(), key=lambda entry: entry.total)
+                    del self._stats[coldest.fingerprint]
+                stats = self._stats[statement_fingerprint] = FingerprintStats(statement_fingerprint)
+            stats.add(seconds, 1 / sample_rate, self.reservoir_size)
+
+    def _log_slow_query(self, statement: str, seconds: float) -> None:
+        service_method = current_service_method.get() or "unknown"
+        statement_fingerprint = fingerprint(statement)
+        logger.warning(
+            f"Slow query {seconds * 1000:.1f}ms in {service_method}: {statement_fingerprint}",
+            extra={
+                "duration_ms": seconds * 1000,
+                "service_method": service_method,
+                "fingerprint": statement_fingerprint
+            }
+        )
+
+    def top(self, limit: int = 20, order_by: str = "total") -> List[Dict[str, Any]]:
+        """The limit heaviest fingerprints by total, p99, count or max time"""
+        if order_by not in self.ORDERINGS:
+            raise ValueError(f"Order must be one of: {', '.join(self.ORDERINGS)}")
+        with self._lock:
+            entries = [stats.as_dict() for stats in self._stats.values()]
+        key = {"total": "total_ms", "p99": "p99_ms", "count": "count", "max": "max_ms"}[order_by]
+        return sorted(entries, key=lambda entry: entry[key], reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "slow_query_threshold_ms": self.slow_query_threshold_ms,
+            "fingerprints": len(self._stats),
+            "max_fingerprints": self.max_fingerprints
+        }
+
+query_profiler = QueryProfiler(
+    settings.QUERY_PROFILER_ENABLED,
+    settings.QUERY_PROFILER_SAMPLE_RATE,
+    settings.SLOW_QUERY_THRESHOLD_MS,
+    settings.QUERY_PROFILER_MAX_FINGERPRINTS
+)
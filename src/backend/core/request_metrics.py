@@ -0,0 +1,83 @@
+import functools
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.metrics import DB_QUERY_DURATION
+from core.query_profiler import query_profiler
+
+class RequestMetrics:
+    """Database time spent by one request"""
+    __slots__ = ("db_seconds", "db_queries")
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.db_queries = 0
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.db_queries} queries", '
+            f"app;dur={total_seconds * 1000:.2f}"
+        )
+
+# Set by ServerTimingMiddleware; sync endpoints run in the threadpool with a
+# copy of the request context, so they add to the same RequestMetrics
+current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+@functools.lru_cache(maxsize=1024)
+def statement_operation(statement: str) -> str:
+    """Leading keyword of a statement, e.g. SELECT; keeps metric labels bounded"""
+    keyword = statement.lstrip("( \n\t").split(None, 1)[:1]
+    return keyword[0].upper() if keyword else "OTHER"
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed, (statement_operation(statement),))
+    query_profiler.record(statement, elapsed)
+    metrics = current_request_metrics.get()
+    if metrics is not None:
+        metrics.db_seconds += elapsed
+        metrics.db_queries += 1
+
+class ServerTimingMiddleware:
+    """
+    Report the database and total time of each request in a Server-Timing header
+
+    Time spent producing a streamed body after the headers went out is not
+    included.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = current_request_metrics.set(metrics)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", metrics.server_timing(time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_metrics.reset(token)
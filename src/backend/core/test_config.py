@@ -9,6 +9,9 @@ class TestSettings:
     def get_database_url(self) -> str:
         return "sqlite:///:memory:"  # Use in-memory SQLite for testing
 
+    def get_async_database_url(self) -> str:
+        return "sqlite+aiosqlite:///:memory:"
+
     def get_test_config(self) -> Dict[str, Any]:
         return {
             "TESTING": True,
@@ -1,9 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from core.config import settings
-from typing import Generator
+from database.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,16 @@ logger = logging.getLogger(__name__)
 class Base(DeclarativeBase):
     pass
 
+def pool_options(pool_size: int, max_overflow: int, pool_timeout: float) -> Dict[str, Any]:
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO
+    }
+
 class DatabaseConnection:
     _instance = None
 
@@ -30,15 +42,16 @@ class DatabaseConnection:
             db_url = settings.get_database_url()
             self.engine = create_engine(
                 db_url,
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10
+                poolclass=InstrumentedQueuePool,
+                **pool_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW, settings.DB_POOL_TIMEOUT)
             )
             self.SessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
                 bind=self.engine
             )
+            self._async_engine: Optional[AsyncEngine] = None
+            self._async_session_local: Optional[async_sessionmaker] = None
         except SQLAlchemyError as e:
             logger.error(f"Database connection error: {e}")
             raise
@@ -46,6 +59,57 @@ class DatabaseConnection:
             logger.error(f"Unexpected error during database initialization: {e}")
             raise
 
+    def _initialize_async(self):
+        # Built on first use so processes that never touch the async path
+        # don't need the async driver installed.
+        try:
+            self._async_engine = create_async_engine(
+                settings.get_async_database_url(),
+                poolclass=InstrumentedAsyncQueuePool,
+                **pool_options(
+                    settings.ASYNC_DB_POOL_SIZE,
+                    settings.ASYNC_DB_MAX_OVERFLOW,
+                    settings.ASYNC_DB_POOL_TIMEOUT
+                )
+            )
+            self._async_session_local = async_sessionmaker(
+                bind=self._async_engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Async database connection error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during async database initialization: {e}")
+            raise
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        if self._async_engine is None:
+            self._initialize_async()
+        return self._async_engine
+
+    @property
+    def AsyncSessionLocal(self) -> async_sessionmaker:
+        if self._async_session_local is None:
+            self._initialize_async()
+        return self._async_session_local
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the sync pool, and of the async pool once it exists"""
+        metrics = {"sync": self.engine.pool.metrics.snapshot(self.engine.pool)}
+        if self._async_engine is not None:
+            async_pool = self._async_engine.pool
+            metrics["async"] = async_pool.metrics.snapshot(async_pool)
+        return metrics
+
+    def check_connection(self) -> None:
+        """Run a trivial query on a pooled connection; raises if the database is unreachable"""
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
     def get_db(self) -> Generator[Session, None, None]:
         db = self.SessionLocal()
         try:
@@ -53,5 +117,13 @@ class DatabaseConnection:
         finally:
             db.close()
 
+    async def get_async_db(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.AsyncSessionLocal() as db:
+            yield db
+
+    async def dispose_async(self) -> None:
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+
 # Create singleton instance
 database_connection = DatabaseConnection()
\ No newline at end of file
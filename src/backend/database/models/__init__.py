@@ -4,5 +4,7 @@ from database.models.user_session import UserSession
 from database.models.notification import Notification
 from database.models.task import Task
 from database.models.role import Role
+from database.models.study_time_rollup import StudyTimeRollup
+from database.models.task_reminder import TaskReminder
 
-__all__ = ['User', 'Session', 'UserSession', 'Notification', 'Task', 'Role']
\ No newline at end of file
+__all__ = ['User', 'Session', 'UserSession', 'Notification', 'Task', 'Role', 'StudyTimeRollup', 'TaskReminder']
\ No newline at end of file
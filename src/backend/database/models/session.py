@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
 from sqlalchemy.orm import relationship
 from database.connection import Base
 
@@ -11,6 +11,12 @@ class Session(Base):
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     status = Column(String, nullable=False)
+    category = Column(String, nullable=False, default="general")
+    # Study timer, kept in memory by TimerService and flushed periodically;
+    # elapsed time excludes the running stretch since timer_started_at
+    timer_state = Column(String(20), nullable=False, default="idle", server_default="idle")
+    timer_elapsed_seconds = Column(Float, nullable=False, default=0.0, server_default="0")
+    timer_started_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
 
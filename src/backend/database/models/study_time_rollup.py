@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from database.connection import Base
+
+class StudyTimeRollup(Base):
+    """Seconds studied per user, UTC day and session category"""
+    __tablename__ = "study_time_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    category = Column(String, primary_key=True)
+    seconds = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<StudyTimeRollup(user_id={self.user_id}, day={self.day}, category='{self.category}')>"
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from database.connection import Base
+
+class TaskReminder(Base):
+    """A reminder already sent for a task in a given window, e.g. "24h" """
+    __tablename__ = "task_reminders"
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    window = Column(String(20), primary_key=True)
+    sent_at_utc = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<TaskReminder(task_id={self.task_id}, window='{self.window}')>"
@@ -0,0 +1,160 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds in seconds of the checkout wait buckets
+CHECKOUT_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    """Fixed-bucket histogram; bucket counts in snapshots are cumulative"""
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets: List[Dict[str, Any]] = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + ("+Inf",), self.counts):
+            cumulative += count
+            buckets.append({"le": bound, "count": cumulative})
+        return {"buckets": buckets, "count": self.count, "sum_seconds": self.sum, "max_seconds": self.max}
+
+class PoolMetrics:
+    """Checkout waits and connection lifecycle counts of one pool"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkout_wait = Histogram(CHECKOUT_BUCKETS_SECONDS)
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.peak_in_use = 0
+
+    def record_checkout(self, wait_seconds: float, in_use: int, pool_size: int) -> None:
+        with self._lock:
+            self.checkout_wait.observe(wait_seconds)
+            self.checkouts += 1
+            if in_use > pool_size:
+                self.overflow_checkouts += 1
+            if in_use > self.peak_in_use:
+                self.peak_in_use = in_use
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkout_wait.observe(wait_seconds)
+            self.checkout_timeouts += 1
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool: QueuePool) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # Negative until the pool has opened pool_size connections
+                "overflow": pool.overflow(),
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait": self.checkout_wait.snapshot(),
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                # Enough connections for the busiest moment seen so far; only
+                # a lower bound once checkouts have timed out
+                "suggested_pool_size": max(1, self.peak_in_use)
+            }
+
+class InstrumentedPoolMixin:
+    """
+    Times how long each checkout waits for a connection
+
+    The metrics survive engine.dispose(), which swaps in a recreated pool.
+    """
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        # recreate() passes the old dispatch along, listeners included
+        recreated = "_dispatch" in kwargs
+        super().__init__(*args, **kwargs)
+        if not recreated:
+            self.metrics = PoolMetrics()
+            _listen(self, self.metrics)
+
+    def recreate(self) -> Pool:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started, self.checkedout(), self.size())
+        return connection
+
+def _listen(pool: Pool, metrics: PoolMetrics) -> None:
+    event.listen(pool, "connect", lambda *args: metrics.increment("connects"))
+    event.listen(pool, "invalidate", lambda *args: metrics.increment("invalidations"))
+    event.listen(pool, "soft_invalidate", lambda *args: metrics.increment("soft_invalidations"))
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+POOL_COUNTERS = ("checkouts", "overflow_checkouts", "checkout_timeouts", "connects", "invalidations", "soft_invalidations")
+
+def pool_exposition(snapshots: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Prometheus text lines for the snapshots of DatabaseConnection.pool_metrics"""
+    lines = [
+        "# HELP db_pool_connections Connections of the pool by state",
+        "# TYPE db_pool_connections gauge"
+    ]
+    for pool, snapshot in snapshots.items():
+        lines.append(f'db_pool_connections{{pool="{pool}",state="in_use"}} {snapshot["in_use"]}')
+        lines.append(f'db_pool_connections{{pool="{pool}",state="idle"}} {snapshot["idle"]}')
+    lines += ["# HELP db_pool_overflow Connections open beyond pool_size", "# TYPE db_pool_overflow gauge"]
+    lines += [f'db_pool_overflow{{pool="{pool}"}} {max(0, snapshot["overflow"])}' for pool, snapshot in snapshots.items()]
+    for counter in POOL_COUNTERS:
+        lines += [f"# HELP db_pool_{counter}_total Pool {counter.replace('_', ' ')}", f"# TYPE db_pool_{counter}_total counter"]
+        lines += [f'db_pool_{counter}_total{{pool="{pool}"}} {snapshot[counter]}' for pool, snapshot in snapshots.items()]
+    lines += [
+        "# HELP db_pool_checkout_wait_seconds Time a checkout waited for a connection",
+        "# TYPE db_pool_checkout_wait_seconds histogram"
+    ]
+    for pool, snapshot in snapshots.items():
+        wait = snapshot["checkout_wait"]
+        lines += [
+            f'db_pool_checkout_wait_seconds_bucket{{pool="{pool}",le="{bucket["le"]}"}} {bucket["count"]}'
+            for bucket in wait["buckets"]
+        ]
+        lines.append(f'db_pool_checkout_wait_seconds_sum{{pool="{pool}"}} {wait["sum_seconds"]}')
+        lines.append(f'db_pool_checkout_wait_seconds_count{{pool="{pool}"}} {wait["count"]}')
+    return lines
@@ -0,0 +1,101 @@
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Depth of nested unit_of_work blocks, kept on the session itself so every
+# repository sharing the session sees it
+UNIT_OF_WORK_DEPTH = "unit_of_work_depth"
+
+# Callbacks waiting for the enclosing transaction to commit
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+def in_unit_of_work(db: Session) -> bool:
+    return db.info.get(UNIT_OF_WORK_DEPTH, 0) > 0
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    Run callback once the data written so far is committed
+
+    Inside a unit of work the callback waits for the outermost commit and is
+    dropped on rollback; otherwise the repositories have already committed
+    and it runs right away.
+    """
+    if in_unit_of_work(db):
+        db.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+    else:
+        callback()
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(db: Session) -> None:
+    for callback in db.info.pop(AFTER_COMMIT_CALLBACKS, ()):
+        try:
+            callback()
+        except Exception as error:
+            logger.error(f"After commit callback failed: {str(error)}")
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(db: Session) -> None:
+    db.info.pop(AFTER_COMMIT_CALLBACKS, None)
+
+@contextmanager
+def unit_of_work(db: Session) -> Generator[Session, None, None]:
+    """
+    Run several repository calls in a single transaction
+
+    Repositories only flush while a unit of work is open; the outermost
+    block commits once on success and rolls everything back on error.
+    Nested blocks join the enclosing transaction.
+    """
+    depth = db.info.get(UNIT_OF_WORK_DEPTH, 0)
+    db.info[UNIT_OF_WORK_DEPTH] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except Exception:
+        if depth == 0:
+            logger.warning("Rolling back unit of work")
+            db.rollback()
+        raise
+    finally:
+        db.info[UNIT_OF_WORK_DEPTH] = depth
+
+def commit_or_flush(db: Session, *refresh_instances: Any) -> None:
+    """Flush inside a unit of work, otherwise commit and refresh the given instances"""
+    if in_unit_of_work(db):
+        db.flush()
+        return
+    db.commit()
+    for instance in refresh_instances:
+        db.refresh(instance)
+
+@asynccontextmanager
+async def async_unit_of_work(db: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of unit_of_work"""
+    depth = db.info.get(UNIT_OF_WORK_DEPTH, 0)
+    db.info[UNIT_OF_WORK_DEPTH] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            await db.commit()
+    except Exception:
+        if depth == 0:
+            logger.warning("Rolling back unit of work")
+            await db.rollback()
+        raise
+    finally:
+        db.info[UNIT_OF_WORK_DEPTH] = depth
+
+async def async_commit_or_flush(db: AsyncSession, *refresh_instances: Any) -> None:
+    """Async counterpart of commit_or_flush"""
+    if db.info.get(UNIT_OF_WORK_DEPTH, 0) > 0:
+        await db.flush()
+        return
+    await db.commit()
+    for instance in refresh_instances:
+        await db.refresh(instance)
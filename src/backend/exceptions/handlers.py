@@ -0,0 +1,30 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from exceptions.exceptions import (
+    BaseCustomException,
+    UserNotFoundException,
+    InvalidDataException,
+    SessionNotFoundException,
+    TaskNotFoundException,
+    NotificationNotFoundException,
+    RoleNotFoundException,
+    UnauthorizedAccessError
+)
+
+STATUS_CODES = {
+    UserNotFoundException: 404,
+    SessionNotFoundException: 404,
+    TaskNotFoundException: 404,
+    NotificationNotFoundException: 404,
+    RoleNotFoundException: 404,
+    InvalidDataException: 400,
+    UnauthorizedAccessError: 403
+}
+
+async def custom_exception_handler(request: Request, exc: BaseCustomException) -> JSONResponse:
+    status_code = next((STATUS_CODES[cls] for cls in type(exc).__mro__ if cls in STATUS_CODES), 500)
+    return JSONResponse(status_code=status_code, content={"detail": exc.message})
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Turn the service layer's exceptions into JSON error responses"""
+    app.add_exception_handler(BaseCustomException, custom_exception_handler)
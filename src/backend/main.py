@@ -1,14 +1,56 @@
 from dotenv import load_dotenv
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from core.config import settings
+from core.health import event_loop_lag_monitor
+from core.metrics import MetricsMiddleware
+from core.request_metrics import ServerTimingMiddleware
+from database.connection import database_connection
+from exceptions.handlers import register_exception_handlers
+from routers import admin, exports, health, internal, notifications, sessions, tasks
+from services.reminder_service import ReminderScheduler
+from services.timer_service import get_timer_service
+from utils.hashing import configure_password_hashing, get_password_hashing_pool
 
 load_dotenv()
 
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(configure_password_hashing)
+    reminder_scheduler = ReminderScheduler(
+        database_connection.SessionLocal,
+        settings.REMINDER_WINDOWS_HOURS,
+        settings.REMINDER_INTERVAL_SECONDS,
+        settings.REMINDER_BATCH_SIZE
+    )
+    if settings.REMINDER_SCHEDULER_ENABLED:
+        reminder_scheduler.start()
+    timer_service = get_timer_service()
+    timer_service.start_flush_loop()
+    event_loop_lag_monitor.start()
+    yield
+    await event_loop_lag_monitor.stop()
+    await timer_service.stop_flush_loop()
+    await reminder_scheduler.stop()
+    get_password_hashing_pool().shutdown(wait=False)
+
 # Create FastAPI instance with a route prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+register_exception_handlers(app)
+app.include_router(admin.router)
+app.include_router(exports.router)
+app.include_router(health.router)
+app.include_router(internal.router)
+app.include_router(notifications.router)
+app.include_router(sessions.router)
+app.include_router(tasks.router)
 
 @app.get("/api/v1/")
 def read_root():
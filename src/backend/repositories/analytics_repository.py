@@ -0,0 +1,95 @@
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from database.models import Session as StudySession, StudyTimeRollup
+from database.unit_of_work import commit_or_flush
+
+# (user_id, day, category) -> seconds
+RollupKey = Tuple[int, date, str]
+
+class StudyRollupRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql_insert(StudyTimeRollup)
+        return sqlite_insert(StudyTimeRollup)
+
+    def _epoch_seconds(self, column):
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.extract("epoch", column)
+        # julianday of 1970-01-01T00:00:00
+        return (func.julianday(column) - 2440587.5) * 86400.0
+
+    def add_seconds(self, contributions: Dict[RollupKey, int]) -> None:
+        """Add (or subtract) seconds to the rollup rows, creating them as needed"""
+        rows = [
+            {"user_id": user_id, "day": day, "category": category, "seconds": seconds}
+            for (user_id, day, category), seconds in contributions.items()
+            if seconds
+        ]
+        if not rows:
+            return
+        statement = self._insert()
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "day", "category"],
+            set_={"seconds": StudyTimeRollup.seconds + statement.excluded.seconds}
+        )
+        self.db.connection().execute(statement, rows)
+        commit_or_flush(self.db)
+
+    def get_rollups(self, user_id: int, start_day: date, end_day: date) -> List[Tuple[date, str, int]]:
+        """Rollup rows of a user between two days, both inclusive"""
+        return [
+            (row.day, row.category, row.seconds)
+            for row in self.db.execute(
+                select(StudyTimeRollup.day, StudyTimeRollup.category, StudyTimeRollup.seconds)
+                .where(
+                    StudyTimeRollup.user_id == user_id,
+                    StudyTimeRollup.day >= start_day,
+                    StudyTimeRollup.day <= end_day,
+                    StudyTimeRollup.seconds > 0
+                )
+                .order_by(StudyTimeRollup.day, StudyTimeRollup.category)
+            )
+        ]
+
+    def delete_rollups(self, user_id: Optional[int] = None) -> None:
+        statement = delete(StudyTimeRollup)
+        if user_id is not None:
+            statement = statement.where(StudyTimeRollup.user_id == user_id)
+        self.db.execute(statement)
+        commit_or_flush(self.db)
+
+    def iter_session_times(self, user_id: Optional[int] = None, batch_size: int = 5000) -> Iterator[tuple]:
+        """Stream (created_by, start_time, end_time, status, category) for every session"""
+        statement = select(
+            StudySession.created_by,
+            StudySession.start_time,
+            StudySession.end_time,
+            StudySession.status,
+            StudySession.category
+        ).execution_options(yield_per=batch_size)
+        if user_id is not None:
+            statement = statement.where(StudySession.created_by == user_id)
+        for row in self.db.execute(statement):
+            yield tuple(row)
+
+    def get_session_epoch_times(self, user_id: int, excluded_statuses=()) -> List[Tuple[float, float]]:
+        """
+        (start, end) of a user's sessions as epoch seconds
+
+        The conversion happens in SQL so no datetime or ORM objects are built
+        per row.
+        """
+        statement = select(
+            self._epoch_seconds(StudySession.start_time),
+            self._epoch_seconds(StudySession.end_time)
+        ).where(StudySession.created_by == user_id)
+        if excluded_statuses:
+            statement = statement.where(StudySession.status.not_in(excluded_statuses))
+        return self.db.execute(statement).all()
@@ -0,0 +1,7 @@
+from typing import Any, Dict
+from sqlalchemy import inspect
+
+def column_values(model: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the keys of data that map to columns of model"""
+    columns = inspect(model).column_attrs.keys()
+    return {key: value for key, value in data.items() if key in columns}
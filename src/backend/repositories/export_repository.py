@@ -0,0 +1,37 @@
+from typing import Iterator, List, Sequence, Tuple
+from sqlalchemy import Column, select
+from sqlalchemy.orm import Session
+from database.models import Notification, Session as StudySession, Task
+
+# resource -> (model, owner column)
+EXPORTABLE_MODELS = {
+    "sessions": (StudySession, StudySession.created_by),
+    "tasks": (Task, Task.created_by_user_id),
+    "notifications": (Notification, Notification.user_id),
+}
+
+class ExportRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_columns(self, resource: str) -> List[Column]:
+        model, _ = EXPORTABLE_MODELS[resource]
+        return list(model.__table__.columns)
+
+    def iter_user_rows(self, resource: str, user_id: int, batch_size: int = 1000) -> Iterator[Sequence[Tuple]]:
+        """
+        Stream a user's rows in batches of plain tuples
+
+        Uses a server-side cursor where the driver supports it so only one
+        batch is held in memory at a time.
+        """
+        model, owner_column = EXPORTABLE_MODELS[resource]
+        statement = (
+            select(*model.__table__.columns)
+            .where(owner_column == user_id)
+            .order_by(model.__table__.c.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        # Core execution skips the ORM row loading layer
+        for partition in self.db.connection().execute(statement).tuples().partitions():
+            yield partition
@@ -1,6 +1,31 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import delete, insert, select, tuple_, update
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.models.notification import Notification
+from repositories.common import column_values
+from database.unit_of_work import async_commit_or_flush, commit_or_flush
+
+def select_user_notifications_page(
+    user_id: int,
+    limit: int,
+    include_read: bool = False,
+    cursor: Optional[Tuple[datetime, int]] = None
+):
+    """Build the keyset query for a page of a user's notifications, newest first"""
+    query = select(Notification).where(Notification.user_id == user_id)
+    if not include_read:
+        query = query.where(Notification.is_read == False)
+    if cursor:
+        created_at_utc, notification_id = cursor
+        query = query.where(
+            tuple_(Notification.created_at_utc, Notification.id) < tuple_(created_at_utc, notification_id)
+        )
+    return query.order_by(
+        Notification.created_at_utc.desc(),
+        Notification.id.desc()
+    ).limit(limit)
 
 class NotificationRepository:
     def __init__(self, db: Session):
@@ -14,29 +39,145 @@ class NotificationRepository:
         """Get all notifications for a user"""
         return self.db.query(Notification).filter(Notification.user_id == user_id).all()
 
+    def get_user_notifications_page(
+        self,
+        user_id: int,
+        limit: int,
+        include_read: bool = False,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Notification]:
+        """Get a page of notifications for a user, filtered and ordered in SQL"""
+        query = select_user_notifications_page(user_id, limit, include_read, cursor)
+        return list(self.db.execute(query).scalars().all())
+
     def create_notification(self, notification_data: Dict[str, Any]) -> Notification:
         """Create a new notification"""
         notification = Notification(**notification_data)
         self.db.add(notification)
-        self.db.commit()
-        self.db.refresh(notification)
+        commit_or_flush(self.db, notification)
         return notification
 
+    def create_notifications_bulk(self, notification_data: Dict[str, Any], user_ids: List[int]) -> List[int]:
+        """Create one notification per user in a single multi-row INSERT ... RETURNING"""
+        rows = [{**notification_data, "user_id": user_id} for user_id in user_ids]
+        result = self.db.execute(insert(Notification).returning(Notification.id, sort_by_parameter_order=True), rows)
+        created_ids = list(result.scalars().all())
+        commit_or_flush(self.db)
+        return created_ids
+
+    def create_notifications(self, notifications_data: List[Dict[str, Any]]) -> List[int]:
+        """Create many different notifications in a single multi-row INSERT ... RETURNING"""
+        if not notifications_data:
+            return []
+        result = self.db.execute(insert(Notification).returning(Notification.id, sort_by_parameter_order=True), notifications_data)
+        created_ids = list(result.scalars().all())
+        commit_or_flush(self.db)
+        return created_ids
+
     def update_notification(self, notification_id: int, update_data: Dict[str, Any]) -> Optional[Notification]:
-        """Update a notification"""
-        notification = self.get_notification_by_id(notification_id)
-        if notification:
-            for key, value in update_data.items():
-                setattr(notification, key, value)
-            self.db.commit()
-            self.db.refresh(notification)
+        """Update a notification with a single UPDATE ... RETURNING"""
+        values = column_values(Notification, update_data)
+        if not values:
+            return self.get_notification_by_id(notification_id)
+        notification = self.db.execute(
+            update(Notification)
+            .where(Notification.id == notification_id)
+            .values(**values)
+            .returning(Notification)
+        ).scalars().first()
+        commit_or_flush(self.db)
         return notification
 
+    def mark_all_read(self, user_id: int, before: Optional[datetime] = None) -> int:
+        """Mark every unread notification of a user as read, optionally only older ones"""
+        query = update(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+        if before is not None:
+            query = query.where(Notification.created_at_utc < before)
+        return self._mark_read(query)
+
+    def mark_read(self, notification_ids: List[int], user_id: int) -> int:
+        """Mark the given notifications as read if they belong to the user"""
+        query = update(Notification).where(
+            Notification.id.in_(notification_ids),
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+        return self._mark_read(query)
+
+    def _mark_read(self, query) -> int:
+        result = self.db.execute(
+            query.values(is_read=True).execution_options(synchronize_session="fetch")
+        )
+        commit_or_flush(self.db)
+        return result.rowcount
+
     def delete_notification(self, notification_id: int) -> bool:
-        """Delete a notification"""
-        notification = self.get_notification_by_id(notification_id)
-        if notification:
-            self.db.delete(notification)
-            self.db.commit()
-            return True
-        return False
\ No newline at end of file
+        """Delete a notification with a single DELETE ... RETURNING"""
+        deleted_id = self.db.execute(
+            delete(Notification)
+            .where(Notification.id == notification_id)
+            .returning(Notification.id)
+        ).scalar()
+        commit_or_flush(self.db)
+        return deleted_id is not None
+
+
+class AsyncNotificationRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_notification_by_id(self, notification_id: int) -> Optional[Notification]:
+        """Get a single notification by ID"""
+        return await self.db.get(Notification, notification_id)
+
+    async def get_notifications_by_user_id(self, user_id: int) -> List[Notification]:
+        """Get all notifications for a user"""
+        result = await self.db.execute(
+            select(Notification).where(Notification.user_id == user_id)
+        )
+        return list(result.scalars().all())
+
+    async def get_user_notifications_page(
+        self,
+        user_id: int,
+        limit: int,
+        include_read: bool = False,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Notification]:
+        """Get a page of notifications for a user, filtered and ordered in SQL"""
+        query = select_user_notifications_page(user_id, limit, include_read, cursor)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create_notification(self, notification_data: Dict[str, Any]) -> Notification:
+        """Create a new notification"""
+        notification = Notification(**notification_data)
+        self.db.add(notification)
+        await async_commit_or_flush(self.db, notification)
+        return notification
+
+    async def update_notification(self, notification_id: int, update_data: Dict[str, Any]) -> Optional[Notification]:
+        """Update a notification with a single UPDATE ... RETURNING"""
+        values = column_values(Notification, update_data)
+        if not values:
+            return await self.get_notification_by_id(notification_id)
+        result = await self.db.execute(
+            update(Notification).where(Notification.id == notification_id).values(**values).returning(Notification)
+        )
+        notification = result.scalars().first()
+        await async_commit_or_flush(self.db)
+        return notification
+
+    async def delete_notification(self, notification_id: int) -> bool:
+        """Delete a notification with a single DELETE ... RETURNING"""
+        result = await self.db.execute(
+            delete(Notification)
+            .where(Notification.id == notification_id)
+            .returning(Notification.id)
+        )
+        deleted_id = result.scalar()
+        await async_commit_or_flush(self.db)
+        return deleted_id is not None
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from database.models import Task, TaskReminder
+from database.models.task import TaskStatus
+from database.unit_of_work import commit_or_flush
+
+OPEN_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+class ReminderRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql_insert(TaskReminder)
+        return sqlite_insert(TaskReminder)
+
+    def get_due_tasks_chunk(
+        self,
+        window: str,
+        due_from: datetime,
+        due_until: datetime,
+        limit: int,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Tuple[int, int, str, datetime]]:
+        """
+        Next chunk of open tasks due in [due_from, due_until) without a reminder for window
+
+        Rows are (id, created_by_user_id, title, due_date) in (due_date, id)
+        order; pass the last row's (due_date, id) as cursor for the next
+        chunk. The range scan is served by ix_tasks_due_date.
+        """
+        already_reminded = exists().where(
+            TaskReminder.task_id == Task.id,
+            TaskReminder.window == window
+        )
+        query = select(Task.id, Task.created_by_user_id, Task.title, Task.due_date).where(
+            Task.due_date >= due_from,
+            Task.due_date < due_until,
+            Task.task_status.in_(OPEN_TASK_STATUSES),
+            ~already_reminded
+        )
+        if cursor:
+            query = query.where(tuple_(Task.due_date, Task.id) > tuple_(*cursor))
+        query = query.order_by(Task.due_date, Task.id).limit(limit)
+        return [tuple(row) for row in self.db.execute(query)]
+
+    def claim_reminders(self, task_ids: Sequence[int], window: str, sent_at: datetime) -> List[int]:
+        """
+        Record reminders for the tasks, skipping ones that already exist
+
+        Returns:
+            list: Ids of the tasks that were claimed by this call; a concurrent
+            run that got there first keeps the others
+        """
+        if not task_ids:
+            return []
+        statement = self._insert().on_conflict_do_nothing(index_elements=["task_id", "window"])
+        claimed = self.db.execute(
+            statement.returning(TaskReminder.task_id),
+            [{"task_id": task_id, "window": window, "sent_at_utc": sent_at} for task_id in task_ids]
+        ).scalars().all()
+        commit_or_flush(self.db)
+        return list(claimed)
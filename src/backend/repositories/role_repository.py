@@ -1,6 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable, FrozenSet, Hashable, Optional, List, Tuple
+from core.config import settings
 from database.models.role import Role
+from repositories.common import column_values
+from database.unit_of_work import async_commit_or_flush, commit_or_flush
+from utils.cache import FileInvalidationBackend, LocalInvalidationBackend, TTLCache
 
 class RoleRepository:
     def __init__(self, db: Session):
@@ -18,33 +26,183 @@ class RoleRepository:
     def create_role(self, role_data: dict) -> Role:
         role = Role(**role_data)
         self.db.add(role)
-        self.db.commit()
-        self.db.refresh(role)
+        commit_or_flush(self.db, role)
         return role
 
     def update_role(self, role_id: int, role_data: dict) -> Optional[Role]:
-        role = self.get_role_by_id(role_id)
-        if role:
-            for key, value in role_data.items():
-                if hasattr(role, key):
-                    setattr(role, key, value)
-            self.db.commit()
-            self.db.refresh(role)
+        values = column_values(Role, role_data)
+        if not values:
+            return self.get_role_by_id(role_id)
+        role = self.db.execute(
+            update(Role).where(Role.id == role_id).values(**values).returning(Role)
+        ).scalars().first()
+        commit_or_flush(self.db)
+        return role
+
+    def save_role(self, role: Role, role_data: dict) -> Role:
+        """Apply changes to an already loaded role; flushes a single UPDATE"""
+        for key, value in role_data.items():
+            if hasattr(role, key):
+                setattr(role, key, value)
+        commit_or_flush(self.db)
         return role
 
     def delete_role(self, role_id: int) -> bool:
         role = self.get_role_by_id(role_id)
         if role:
-            self.db.delete(role)
-            self.db.commit()
-            self.db.expire_all()  
-            return True
+            return self.delete_loaded_role(role)
         return False
 
+    def delete_loaded_role(self, role: Role) -> bool:
+        """Delete an already loaded role without fetching it again"""
+        self.db.delete(role)
+        commit_or_flush(self.db)
+        self.db.expire_all()
+        return True
+
     def hard_delete_role(self, role_id: int) -> bool:
         role = self.get_role_by_id(role_id)
         if role:
             self.db.delete(role)
-            self.db.commit()
+            commit_or_flush(self.db)
+            return True
+        return False
+
+
+class AsyncRoleRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_role_by_id(self, role_id: int) -> Optional[Role]:
+        return await self.db.get(Role, role_id)
+
+    async def get_role_by_name(self, name: str) -> Optional[Role]:
+        result = await self.db.execute(select(Role).where(Role.name == name))
+        return result.scalars().first()
+
+    async def get_active_roles(self) -> List[Role]:
+        result = await self.db.execute(select(Role).where(Role.is_active == True))
+        return list(result.scalars().all())
+
+    async def create_role(self, role_data: dict) -> Role:
+        role = Role(**role_data)
+        self.db.add(role)
+        await async_commit_or_flush(self.db, role)
+        return role
+
+    async def update_role(self, role_id: int, role_data: dict) -> Optional[Role]:
+        values = column_values(Role, role_data)
+        if not values:
+            return await self.get_role_by_id(role_id)
+        result = await self.db.execute(
+            update(Role).where(Role.id == role_id).values(**values).returning(Role)
+        )
+        role = result.scalars().first()
+        await async_commit_or_flush(self.db)
+        return role
+
+    async def delete_role(self, role_id: int) -> bool:
+        role = await self.get_role_by_id(role_id)
+        if role:
+            await self.db.delete(role)
+            await async_commit_or_flush(self.db)
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+@dataclass(frozen=True)
+class RoleSnapshot:
+    """Immutable, session-independent copy of a role that is safe to share across requests"""
+    id: int
+    name: str
+    description: str
+    permissions: FrozenSet[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_role(cls, role: Role) -> "RoleSnapshot":
+        return cls(
+            id=role.id,
+            name=role.name,
+            description=role.description,
+            permissions=frozenset(role.permissions or ()),
+            is_active=role.is_active,
+            created_at=role.created_at,
+            updated_at=role.updated_at
+        )
+
+
+class RoleCache:
+    """Read-through TTL+LRU cache of role snapshots keyed by id and by name"""
+
+    def __init__(self, cache: TTLCache, invalidation_backend=None):
+        self.cache = cache
+        self.invalidation_backend = invalidation_backend or LocalInvalidationBackend()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        if self.invalidation_backend.changed():
+            self.cache.clear()
+        value = self.cache.get(key)
+        if value is None:
+            value = loader()
+            # Misses are not cached so a role created elsewhere shows up immediately
+            if value is not None:
+                self.cache.set(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached role here and tell the other workers to do the same"""
+        self.cache.clear()
+        self.invalidation_backend.publish()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+def _create_role_cache() -> RoleCache:
+    invalidation_backend = None
+    if settings.ROLE_CACHE_INVALIDATION_FILE:
+        invalidation_backend = FileInvalidationBackend(settings.ROLE_CACHE_INVALIDATION_FILE)
+    return RoleCache(
+        TTLCache(maxsize=settings.ROLE_CACHE_MAX_SIZE, ttl=settings.ROLE_CACHE_TTL_SECONDS),
+        invalidation_backend
+    )
+
+role_cache = _create_role_cache()
+
+
+class CachedRoleRepository:
+    """Read-only view over RoleRepository that returns cached RoleSnapshot objects"""
+
+    def __init__(self, db: Session, cache: Optional[RoleCache] = None):
+        self.role_repository = RoleRepository(db)
+        self.cache = cache or role_cache
+
+    def _snapshot(self, role: Optional[Role]) -> Optional[RoleSnapshot]:
+        return RoleSnapshot.from_role(role) if role else None
+
+    def get_role_by_id(self, role_id: int) -> Optional[RoleSnapshot]:
+        return self.cache.get_or_load(
+            ("id", role_id),
+            lambda: self._snapshot(self.role_repository.get_role_by_id(role_id))
+        )
+
+    def get_role_by_name(self, name: str) -> Optional[RoleSnapshot]:
+        return self.cache.get_or_load(
+            ("name", name),
+            lambda: self._snapshot(self.role_repository.get_role_by_name(name))
+        )
+
+    def get_active_roles(self) -> Tuple[RoleSnapshot, ...]:
+        return self.cache.get_or_load(
+            ("active",),
+            lambda: tuple(
+                RoleSnapshot.from_role(role)
+                for role in self.role_repository.get_active_roles()
+            )
+        )
+
+    def invalidate(self) -> None:
+        self.cache.invalidate()
@@ -1,6 +1,13 @@
-from sqlalchemy.orm import Session
-from database.models import Session as StudySession
-from typing import Optional, Dict
+import csv
+import io
+from datetime import datetime
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import Session as StudySession, UserSession
+from typing import Optional, Dict, List
+from repositories.common import column_values
+from database.unit_of_work import async_commit_or_flush, commit_or_flush
 
 class SessionRepository:
     def __init__(self, db: Session):
@@ -9,26 +16,161 @@ class SessionRepository:
     def get_session_by_id(self, session_id: int) -> Optional[Dict]:
         return self.db.query(StudySession).filter(StudySession.id == session_id).first()
 
+    def get_session_with_tasks_and_participants(self, session_id: int) -> Optional[StudySession]:
+        """
+        Load a session with its creator, tasks and participants (with their users)
+
+        Three queries regardless of how many tasks or participants there are:
+        the session joined to its creator, then one SELECT ... IN each for
+        tasks and participants joined to their users.
+        """
+        return self.db.execute(
+            select(StudySession)
+            .where(StudySession.id == session_id)
+            .options(
+                joinedload(StudySession.created_by_user),
+                selectinload(StudySession.tasks),
+                selectinload(StudySession.user_sessions).joinedload(UserSession.user)
+            )
+        ).scalars().first()
+
+    def get_participant_user_ids(self, session_id: int) -> List[int]:
+        return list(self.db.execute(
+            select(UserSession.user_id).where(UserSession.session_id == session_id)
+        ).scalars().all())
+
+    def add_participants(self, session_id: int, user_ids: List[int], role: str, joined_at: datetime) -> None:
+        self.db.add_all([
+            UserSession(user_id=user_id, session_id=session_id, role=role, joined_at=joined_at)
+            for user_id in user_ids
+        ])
+        commit_or_flush(self.db)
+
     def create_session(self, session_data: dict) -> StudySession:
         session = StudySession(**session_data)
         self.db.add(session)
-        self.db.commit()
-        self.db.refresh(session)
+        commit_or_flush(self.db, session)
         return session
 
+    def create_sessions_bulk(self, sessions_data: List[dict]) -> None:
+        """
+        Insert many sessions in one round trip
+
+        Uses COPY on PostgreSQL (psycopg2) and a single executemany elsewhere.
+        Every row must have the same keys; ids are not returned.
+        """
+        if not sessions_data:
+            return
+        bind = self.db.get_bind()
+        if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+            self._copy_sessions(sessions_data)
+        else:
+            self.db.connection().execute(insert(StudySession.__table__), sessions_data)
+        commit_or_flush(self.db)
+
+    def _copy_sessions(self, sessions_data: List[dict]) -> None:
+        columns = list(sessions_data[0])
+        buffer = io.StringIO()
+        # Every session column is NOT NULL, so quoting all strings is safe
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerows([session_data[column] for column in columns] for session_data in sessions_data)
+        buffer.seek(0)
+
+        # Runs on the session's connection, inside its transaction
+        cursor = self.db.connection().connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {StudySession.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+    def get_timer_state(self, session_id: int) -> Optional[tuple]:
+        """(timer_state, timer_elapsed_seconds, timer_started_at) of a session"""
+        row = self.db.execute(
+            select(StudySession.timer_state, StudySession.timer_elapsed_seconds, StudySession.timer_started_at)
+            .where(StudySession.id == session_id)
+        ).first()
+        return tuple(row) if row else None
+
+    def save_timer_states(self, timer_states: List[dict]) -> None:
+        """
+        Write many sessions' timers with one executemany UPDATE
+
+        Each entry has session_id, timer_state, timer_elapsed_seconds and
+        timer_started_at.
+        """
+        if not timer_states:
+            return
+        table = StudySession.__table__
+        # Bind names can't match the SET columns, so prefix them
+        self.db.connection().execute(
+            update(table)
+            .where(table.c.id == bindparam("p_session_id"))
+            .values(
+                timer_state=bindparam("p_timer_state"),
+                timer_elapsed_seconds=bindparam("p_timer_elapsed_seconds"),
+                timer_started_at=bindparam("p_timer_started_at")
+            ),
+            [{f"p_{key}": value for key, value in timer_state.items()} for timer_state in timer_states]
+        )
+        commit_or_flush(self.db)
+
     def update_session(self, session_id: int, session_data: dict) -> Optional[StudySession]:
-        session = self.get_session_by_id(session_id)
-        if session:
-            for key, value in session_data.items():
-                setattr(session, key, value)
-            self.db.commit()
-            self.db.refresh(session)
+        values = column_values(StudySession, session_data)
+        if not values:
+            return self.get_session_by_id(session_id)
+        session = self.db.execute(
+            update(StudySession)
+            .where(StudySession.id == session_id)
+            .values(**values)
+            .returning(StudySession)
+        ).scalars().first()
+        commit_or_flush(self.db)
         return session
 
     def delete_session(self, session_id: int) -> bool:
         session = self.get_session_by_id(session_id)
         if session:
-            self.db.delete(session)
-            self.db.commit()
+            return self.delete_loaded_session(session)
+        return False
+
+    def delete_loaded_session(self, session: StudySession) -> bool:
+        """Delete an already loaded session without fetching it again"""
+        self.db.delete(session)
+        commit_or_flush(self.db)
+        return True
+
+
+class AsyncSessionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_session_by_id(self, session_id: int) -> Optional[StudySession]:
+        return await self.db.get(StudySession, session_id)
+
+    async def create_session(self, session_data: dict) -> StudySession:
+        session = StudySession(**session_data)
+        self.db.add(session)
+        await async_commit_or_flush(self.db, session)
+        return session
+
+    async def update_session(self, session_id: int, session_data: dict) -> Optional[StudySession]:
+        values = column_values(StudySession, session_data)
+        if not values:
+            return await self.get_session_by_id(session_id)
+        result = await self.db.execute(
+            update(StudySession).where(StudySession.id == session_id).values(**values).returning(StudySession)
+        )
+        session = result.scalars().first()
+        await async_commit_or_flush(self.db)
+        return session
+
+    async def delete_session(self, session_id: int) -> bool:
+        session = await self.get_session_by_id(session_id)
+        if session:
+            await self.db.delete(session)
+            await async_commit_or_flush(self.db)
             return True
-        return False
\ No newline at end of file
+        return False
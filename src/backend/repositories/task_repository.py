@@ -1,6 +1,69 @@
+from datetime import datetime
+from sqlalchemy import case, delete, or_, select, tuple_, update
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.models import Task
-from typing import Optional
+from database.models.task import TaskPriority, TaskStatus
+from repositories.common import column_values
+from typing import List, Optional, Sequence, Tuple
+from database.unit_of_work import async_commit_or_flush, commit_or_flush
+
+# Highest priority first
+PRIORITY_RANK = case(
+    (Task.priority_level == TaskPriority.HIGH, 0),
+    (Task.priority_level == TaskPriority.MEDIUM, 1),
+    else_=2
+)
+
+def select_user_tasks_page(
+    user_id: int,
+    limit: int,
+    statuses: Optional[Sequence[TaskStatus]] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    cursor: Optional[Tuple[Optional[datetime], int]] = None
+):
+    """
+    Build the keyset query for a page of a user's tasks, soonest due first
+
+    Served by ix_tasks_owner_status_due; tasks without a due date come last.
+    """
+    query = select(Task).where(Task.created_by_user_id == user_id)
+    if statuses:
+        query = query.where(Task.task_status.in_(statuses))
+    if due_after:
+        query = query.where(Task.due_date >= due_after)
+    if due_before:
+        query = query.where(Task.due_date < due_before)
+    if cursor:
+        due_date, task_id = cursor
+        if due_date is None:
+            query = query.where(Task.due_date.is_(None), Task.id > task_id)
+        else:
+            query = query.where(or_(
+                tuple_(Task.due_date, Task.id) > tuple_(due_date, task_id),
+                Task.due_date.is_(None)
+            ))
+    return query.order_by(Task.due_date.asc().nulls_last(), Task.id.asc()).limit(limit)
+
+def select_session_tasks_page(
+    session_id: int,
+    limit: int,
+    priorities: Optional[Sequence[TaskPriority]] = None,
+    cursor: Optional[Tuple[int, int]] = None
+):
+    """
+    Build the keyset query for a page of a session's tasks, highest priority first
+
+    Served by ix_tasks_session_priority; the priority order is applied to
+    the session's rows only.
+    """
+    query = select(Task).where(Task.session_id == session_id)
+    if priorities:
+        query = query.where(Task.priority_level.in_(priorities))
+    if cursor:
+        query = query.where(tuple_(PRIORITY_RANK, Task.id) > tuple_(*cursor))
+    return query.order_by(PRIORITY_RANK, Task.id).limit(limit)
 
 class TaskRepository:
     def __init__(self, db: Session):
@@ -9,26 +72,111 @@ class TaskRepository:
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         return self.db.query(Task).filter(Task.id == task_id).first()
 
+    def get_user_tasks_page(
+        self,
+        user_id: int,
+        limit: int,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        cursor: Optional[Tuple[Optional[datetime], int]] = None
+    ) -> List[Task]:
+        query = select_user_tasks_page(user_id, limit, statuses, due_after, due_before, cursor)
+        return list(self.db.execute(query).scalars().all())
+
+    def get_session_tasks_page(
+        self,
+        session_id: int,
+        limit: int,
+        priorities: Optional[Sequence[TaskPriority]] = None,
+        cursor: Optional[Tuple[int, int]] = None
+    ) -> List[Task]:
+        query = select_session_tasks_page(session_id, limit, priorities, cursor)
+        return list(self.db.execute(query).scalars().all())
+
     def create_task(self, task_data: dict) -> Task:
         task = Task(**task_data)
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        commit_or_flush(self.db, task)
         return task
 
     def update_task(self, task_id: int, task_data: dict) -> Optional[Task]:
-        task = self.get_task_by_id(task_id)
-        if task:
-            for key, value in task_data.items():
-                setattr(task, key, value)
-            self.db.commit()
-            self.db.refresh(task)
+        values = column_values(Task, task_data)
+        if not values:
+            return self.get_task_by_id(task_id)
+        task = self.db.execute(
+            update(Task).where(Task.id == task_id).values(**values).returning(Task)
+        ).scalars().first()
+        commit_or_flush(self.db)
+        return task
+
+    def save_task(self, task: Task, task_data: dict) -> Task:
+        """Apply changes to an already loaded task; flushes a single UPDATE"""
+        for key, value in task_data.items():
+            setattr(task, key, value)
+        commit_or_flush(self.db)
         return task
 
     def delete_taskById(self, task_id: int) -> bool:
-        task = self.get_task_by_id(task_id)
-        if task:
-            self.db.delete(task)
-            self.db.commit()
-            return True
-        return False
+        deleted_id = self.db.execute(
+            delete(Task).where(Task.id == task_id).returning(Task.id)
+        ).scalar()
+        commit_or_flush(self.db)
+        return deleted_id is not None
+
+
+class AsyncTaskRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        return await self.db.get(Task, task_id)
+
+    async def get_user_tasks_page(
+        self,
+        user_id: int,
+        limit: int,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        cursor: Optional[Tuple[Optional[datetime], int]] = None
+    ) -> List[Task]:
+        query = select_user_tasks_page(user_id, limit, statuses, due_after, due_before, cursor)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_session_tasks_page(
+        self,
+        session_id: int,
+        limit: int,
+        priorities: Optional[Sequence[TaskPriority]] = None,
+        cursor: Optional[Tuple[int, int]] = None
+    ) -> List[Task]:
+        query = select_session_tasks_page(session_id, limit, priorities, cursor)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create_task(self, task_data: dict) -> Task:
+        task = Task(**task_data)
+        self.db.add(task)
+        await async_commit_or_flush(self.db, task)
+        return task
+
+    async def update_task(self, task_id: int, task_data: dict) -> Optional[Task]:
+        values = column_values(Task, task_data)
+        if not values:
+            return await self.get_task_by_id(task_id)
+        result = await self.db.execute(
+            update(Task).where(Task.id == task_id).values(**values).returning(Task)
+        )
+        task = result.scalars().first()
+        await async_commit_or_flush(self.db)
+        return task
+
+    async def delete_taskById(self, task_id: int) -> bool:
+        result = await self.db.execute(
+            delete(Task).where(Task.id == task_id).returning(Task.id)
+        )
+        deleted_id = result.scalar()
+        await async_commit_or_flush(self.db)
+        return deleted_id is not None
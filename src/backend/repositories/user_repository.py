@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session
-from database.models import User
-from typing import Optional, Dict
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import User, UserSession
+from typing import Optional, Dict, List, Set, Tuple
+from repositories.common import column_values
+from database.unit_of_work import async_commit_or_flush, commit_or_flush
 
 class UserRepository:
     def __init__(self, db: Session):
@@ -9,26 +14,126 @@ class UserRepository:
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         return self.session.query(User).filter(User.id == user_id).first()
 
+    def get_user_by_email(self, email: str) -> Optional[User]:
+        return self.session.query(User).filter(User.email == email).first()
+
     def create_user(self, user_data: dict) -> User:
         user = User(**user_data)
         self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        commit_or_flush(self.session, user)
         return user
 
+    def get_user_dashboard(self, user_id: int) -> Optional[User]:
+        """
+        Load a user with everything the dashboard renders
+
+        The role is joined in; sessions, tasks, notifications and joined
+        sessions are each fetched with one SELECT ... IN, so the query count
+        doesn't grow with the amount of data.
+        """
+        return self.session.execute(
+            select(User)
+            .where(User.id == user_id)
+            .options(
+                joinedload(User.role),
+                selectinload(User.sessions),
+                selectinload(User.tasks),
+                selectinload(User.notifications),
+                selectinload(User.user_sessions).joinedload(UserSession.session)
+            )
+        ).scalars().first()
+
+    def get_taken_identities(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Return which of the usernames and emails already belong to a user"""
+        rows = self.session.execute(
+            select(User.username, User.email).where(
+                or_(User.username.in_(usernames), User.email.in_(emails))
+            )
+        ).all()
+        return {row.username for row in rows}, {row.email for row in rows}
+
+    def get_existing_user_ids(self, user_ids: Set[int]) -> Set[int]:
+        """Return which of the ids belong to a user"""
+        if not user_ids:
+            return set()
+        return set(self.session.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+
+    def create_users_bulk(self, users_data: List[dict]) -> List[Optional[str]]:
+        """
+        Insert many users with one executemany
+
+        Returns one entry per row: None if it was inserted, otherwise the
+        database error. If the batch fails it is retried row by row in
+        savepoints so that one bad row doesn't reject the rest.
+        """
+        if not users_data:
+            return []
+        try:
+            with self.session.begin_nested():
+                self.session.execute(insert(User), users_data)
+            commit_or_flush(self.session)
+            return [None] * len(users_data)
+        except IntegrityError:
+            pass
+
+        errors: List[Optional[str]] = []
+        for user_data in users_data:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(User), [user_data])
+                errors.append(None)
+            except IntegrityError as error:
+                errors.append(str(error.orig))
+        commit_or_flush(self.session)
+        return errors
+
     def update_user(self, user_id: int, user_data: dict) -> Optional[User]:
-        user = self.session.query(User).filter(User.id == user_id).first()
-        if user:
-            for key, value in user_data.items():
-                setattr(user, key, value)
-            self.session.commit()
-            self.session.refresh(user)
+        values = column_values(User, user_data)
+        if not values:
+            return self.get_user_by_id(user_id)
+        user = self.session.execute(
+            update(User).where(User.id == user_id).values(**values).returning(User)
+        ).scalars().first()
+        commit_or_flush(self.session)
         return user
 
     def delete_user(self, user_id: int) -> bool:
         user = self.session.query(User).filter(User.id == user_id).first()
         if user:
             self.session.delete(user)
-            self.session.commit()
+            commit_or_flush(self.session)
+            return True
+        return False
+
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.session = db
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        return await self.session.get(User, user_id)
+
+    async def create_user(self, user_data: dict) -> User:
+        user = User(**user_data)
+        self.session.add(user)
+        await async_commit_or_flush(self.session, user)
+        return user
+
+    async def update_user(self, user_id: int, user_data: dict) -> Optional[User]:
+        values = column_values(User, user_data)
+        if not values:
+            return await self.get_user_by_id(user_id)
+        result = await self.session.execute(
+            update(User).where(User.id == user_id).values(**values).returning(User)
+        )
+        user = result.scalars().first()
+        await async_commit_or_flush(self.session)
+        return user
+
+    async def delete_user(self, user_id: int) -> bool:
+        user = await self.get_user_by_id(user_id)
+        if user:
+            await self.session.delete(user)
+            await async_commit_or_flush(self.session)
             return True
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from core.dependencies import require_admin
+from core.query_profiler import QueryProfiler, query_profiler
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+class QueryProfilerUpdate(BaseModel):
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = Field(default=None, ge=0, le=1)
+    slow_query_threshold_ms: Optional[float] = Field(default=None, ge=0)
+    reset: bool = False
+
+def get_query_profiler() -> QueryProfiler:
+    return query_profiler
+
+@router.get("/query-profiler")
+def get_query_profile(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal["total", "p99", "count", "max"] = "total",
+    profiler: QueryProfiler = Depends(get_query_profiler)
+) -> Dict[str, Any]:
+    """Profiler settings and the heaviest statement fingerprints of this worker"""
+    top: List[Dict[str, Any]] = profiler.top(limit, order_by)
+    return {**profiler.status(), "order_by": order_by, "queries": top}
+
+@router.patch("/query-profiler")
+def update_query_profiler(
+    update: QueryProfilerUpdate,
+    profiler: QueryProfiler = Depends(get_query_profiler)
+) -> Dict[str, Any]:
+    """Toggle the profiler or change its sampling and slow query threshold at runtime"""
+    try:
+        profiler.configure(update.enabled, update.sample_rate, update.slow_query_threshold_ms)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    if update.reset:
+        profiler.reset()
+    return profiler.status()
@@ -0,0 +1,36 @@
+from typing import Callable, Iterator
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from core.dependencies import get_current_user_id, get_session_factory
+from exceptions import InvalidDataException
+from services.export_service import ExportService
+
+router = APIRouter(prefix="/api/v1/exports", tags=["exports"])
+
+def _stream_export(session_factory: Callable[[], Session], resource: str, user_id: int, export_format: str) -> Iterator[str]:
+    # Dependencies with yield are torn down before the body is sent, so the
+    # session has to live inside the generator.
+    db = session_factory()
+    try:
+        yield from ExportService(db).export_rows(resource, user_id, export_format)
+    finally:
+        db.close()
+
+@router.get("/{resource}")
+def export_user_data(
+    resource: str,
+    user_id: int = Depends(get_current_user_id),
+    export_format: str = Query("csv", alias="format"),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
+):
+    try:
+        media_type = ExportService.validate(resource, export_format)
+    except InvalidDataException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        _stream_export(session_factory, resource, user_id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{export_format}"'}
+    )
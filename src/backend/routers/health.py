@@ -0,0 +1,24 @@
+from typing import Any, Dict
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from core.health import EventLoopLagMonitor, HealthChecker, event_loop_lag_monitor, health_checker
+
+router = APIRouter(prefix="/api/v1/health", tags=["health"])
+
+def get_health_checker() -> HealthChecker:
+    return health_checker
+
+def get_event_loop_lag_monitor() -> EventLoopLagMonitor:
+    return event_loop_lag_monitor
+
+@router.get("/live")
+async def liveness(monitor: EventLoopLagMonitor = Depends(get_event_loop_lag_monitor)) -> Dict[str, Any]:
+    """The process serves requests; touches nothing else, so a slow database never restarts workers"""
+    lag = monitor.lag_seconds
+    return {"status": "ok", "event_loop_lag_ms": None if lag is None else lag * 1000}
+
+@router.get("/ready")
+async def readiness(checker: HealthChecker = Depends(get_health_checker)) -> JSONResponse:
+    """Database, pool and event loop checks, cached briefly; 503 takes the worker out of rotation"""
+    result = await checker.readiness()
+    return JSONResponse(result, status_code=200 if result["status"] == "ok" else 503)
@@ -0,0 +1,22 @@
+from typing import Any, Dict
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.metrics import registry
+from database.connection import database_connection
+from database.pool_metrics import pool_exposition
+
+# Operational endpoints for the infrastructure, kept out of the public schema;
+# expose them on the internal network only
+router = APIRouter(tags=["internal"], include_in_schema=False)
+
+registry.register_collector(lambda: pool_exposition(database_connection.pool_metrics()))
+
+@router.get("/internal/metrics/pool")
+def pool_metrics() -> Dict[str, Any]:
+    """Connection pool gauges, counters and checkout wait histogram of this worker"""
+    return database_connection.pool_metrics()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Metrics of this worker in the Prometheus text exposition format"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,142 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Response, WebSocket
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from core.config import settings
+from core.dependencies import get_current_user_id, get_notification_service
+from services.notification_service import NotificationService
+from utils.notification_hub import NotificationHub, Subscription, notification_hub
+from utils.pagination import PageResponse
+
+router = APIRouter(prefix="/api/v1/notifications", tags=["notifications"])
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Keep reverse proxies such as nginx from buffering the stream
+    "X-Accel-Buffering": "no"
+}
+
+class NotificationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    message: str
+    user_id: int
+    notification_type: str
+    is_read: bool
+    created_at_utc: datetime
+
+class MarkReadRequest(BaseModel):
+    notification_ids: List[int]
+
+class MarkReadResponse(BaseModel):
+    updated: int
+
+def get_notification_hub() -> NotificationHub:
+    return notification_hub
+
+def format_sse(event: Dict[str, Any]) -> str:
+    data = event["data"]
+    lines = f"event: {event['event']}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+    if event["event"] == "notification":
+        return f"id: {data['id']}\n{lines}"
+    return lines
+
+async def sse_events(hub: NotificationHub, user_id: int, heartbeat_seconds: float) -> AsyncIterator[str]:
+    # Subscribing in the generator ties the subscription to the stream: the
+    # response cancels the generator when the client disconnects and the
+    # finally block always runs.
+    subscription = hub.subscribe(user_id)
+    try:
+        while True:
+            event = await subscription.get(heartbeat_seconds)
+            yield ": keep-alive\n\n" if event is None else format_sse(event)
+    finally:
+        hub.unsubscribe(subscription)
+
+@router.get("", response_model=PageResponse[NotificationResponse])
+def list_notifications(
+    limit: int = 50,
+    include_read: bool = False,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    page = notification_service.get_user_notifications_page(user_id, limit, include_read, cursor)
+    return PageResponse[NotificationResponse].from_page(page)
+
+@router.post("", response_model=NotificationResponse, status_code=201)
+def create_notification(
+    notification_data: Dict[str, Any] = Body(...),
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    return notification_service.create_notification(notification_data, user_id)
+
+@router.post("/read", response_model=MarkReadResponse)
+def mark_read(
+    request: MarkReadRequest,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    return MarkReadResponse(updated=notification_service.mark_read(request.notification_ids, user_id))
+
+@router.post("/read-all", response_model=MarkReadResponse)
+def mark_all_read(
+    before: Optional[datetime] = None,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    return MarkReadResponse(updated=notification_service.mark_all_read(user_id, before))
+
+@router.post("/{notification_id}/read", response_model=NotificationResponse)
+def mark_notification_read(
+    notification_id: int,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    return notification_service.mark_notification_as_read(notification_id, user_id)
+
+@router.delete("/{notification_id}", status_code=204)
+def delete_notification(
+    notification_id: int,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    notification_service.delete_notification(notification_id, user_id)
+    return Response(status_code=204)
+
+# The push endpoints take user_id as a query parameter: EventSource and
+# browser WebSockets cannot send custom headers
+
+@router.get("/stream")
+async def stream_notifications(user_id: int, hub: NotificationHub = Depends(get_notification_hub)):
+    """Server-Sent Events stream of new notifications of a user"""
+    return StreamingResponse(
+        sse_events(hub, user_id, settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        await websocket.send_json(await subscription.get())
+
+@router.websocket("/ws")
+async def notification_socket(websocket: WebSocket, user_id: int, hub: NotificationHub = Depends(get_notification_hub)):
+    """WebSocket push of new notifications of a user; client messages are ignored"""
+    subscription = hub.subscribe(user_id)
+    sender = None
+    try:
+        await websocket.accept()
+        sender = asyncio.create_task(_send_events(websocket, subscription))
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        if sender is not None:
+            sender.cancel()
+        hub.unsubscribe(subscription)
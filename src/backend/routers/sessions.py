@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, Response
+from pydantic import BaseModel, ConfigDict
+from core.dependencies import get_current_user_id, get_session_service, get_task_service
+from exceptions import InvalidDataException, UnauthorizedAccessError
+from routers.tasks import TaskResponse
+from services.session_service import SessionService
+from services.task_service import TaskService
+from services.timer_service import TimerService, TimerSnapshot, get_timer_service
+from utils.pagination import PageResponse
+
+router = APIRouter(prefix="/api/v1/sessions", tags=["sessions"])
+
+TIMER_ACTIONS = ("start", "pause", "resume", "reset")
+
+class SessionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    created_by: Optional[int]
+    start_time: datetime
+    end_time: datetime
+    status: str
+    category: str
+    created_at: datetime
+    updated_at: datetime
+
+class TimerResponse(BaseModel):
+    session_id: int
+    state: str
+    elapsed_seconds: float
+
+    @classmethod
+    def from_snapshot(cls, snapshot: TimerSnapshot) -> "TimerResponse":
+        return cls(session_id=snapshot.session_id, state=snapshot.state.value, elapsed_seconds=snapshot.elapsed_seconds)
+
+def _require_owner(session_service: SessionService, session_id: int, user_id: int) -> None:
+    if session_service.get_session(session_id).created_by != user_id:
+        raise UnauthorizedAccessError("User not authorized to modify this session")
+
+@router.post("", response_model=SessionResponse, status_code=201)
+def create_session(
+    session_data: Dict[str, Any] = Body(...),
+    user_id: int = Depends(get_current_user_id),
+    session_service: SessionService = Depends(get_session_service)
+):
+    return session_service.create_session({**session_data, "created_by": user_id})
+
+@router.get("/{session_id}", response_model=SessionResponse)
+def get_session(session_id: int, session_service: SessionService = Depends(get_session_service)):
+    return session_service.get_session(session_id)
+
+@router.patch("/{session_id}", response_model=SessionResponse)
+def update_session(
+    session_id: int,
+    session_data: Dict[str, Any] = Body(...),
+    user_id: int = Depends(get_current_user_id),
+    session_service: SessionService = Depends(get_session_service)
+):
+    _require_owner(session_service, session_id, user_id)
+    session_data.pop("created_by", None)
+    return session_service.update_session(session_id, session_data)
+
+@router.delete("/{session_id}", status_code=204)
+def delete_session(
+    session_id: int,
+    user_id: int = Depends(get_current_user_id),
+    session_service: SessionService = Depends(get_session_service)
+):
+    _require_owner(session_service, session_id, user_id)
+    session_service.delete_session(session_id)
+    return Response(status_code=204)
+
+@router.get("/{session_id}/tasks", response_model=PageResponse[TaskResponse])
+def list_session_tasks(
+    session_id: int,
+    priority: Optional[List[str]] = Query(None),
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    task_service: TaskService = Depends(get_task_service)
+):
+    page = task_service.list_session_tasks(session_id, priority, limit, cursor)
+    return PageResponse[TaskResponse].from_page(page)
+
+# Timers live in memory; only changing one needs the database, to check
+# that the caller owns the session
+
+@router.get("/{session_id}/timer", response_model=TimerResponse)
+def get_timer(
+    session_id: int,
+    user_id: int = Depends(get_current_user_id),
+    timer_service: TimerService = Depends(get_timer_service)
+):
+    return TimerResponse.from_snapshot(timer_service.get(session_id))
+
+@router.post("/{session_id}/timer/{action}", response_model=TimerResponse)
+def change_timer(
+    session_id: int,
+    action: str,
+    user_id: int = Depends(get_current_user_id),
+    session_service: SessionService = Depends(get_session_service),
+    timer_service: TimerService = Depends(get_timer_service)
+):
+    if action not in TIMER_ACTIONS:
+        raise InvalidDataException(f"Timer action must be one of: {', '.join(TIMER_ACTIONS)}")
+    _require_owner(session_service, session_id, user_id)
+    return TimerResponse.from_snapshot(getattr(timer_service, action)(session_id))
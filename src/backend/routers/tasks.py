@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, Response
+from pydantic import BaseModel, ConfigDict
+from core.dependencies import get_current_user_id, get_task_service
+from database.models.task import TaskPriority, TaskStatus
+from services.task_service import TaskService
+from utils.pagination import PageResponse
+
+router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
+
+class TaskResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    session_id: Optional[int]
+    title: str
+    description: Optional[str]
+    due_date: Optional[datetime]
+    priority_level: TaskPriority
+    task_status: TaskStatus
+    created_by_user_id: int
+    created_at_utc: datetime
+    last_updated_at_utc: datetime
+
+@router.get("", response_model=PageResponse[TaskResponse])
+def list_tasks(
+    status: Optional[List[str]] = Query(None),
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+):
+    page = task_service.list_user_tasks(user_id, status, due_after, due_before, limit, cursor)
+    return PageResponse[TaskResponse].from_page(page)
+
+@router.post("", response_model=TaskResponse, status_code=201)
+def create_task(
+    task_data: Dict[str, Any] = Body(...),
+    user_id: int = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+):
+    return task_service.create_new_task(task_data, user_id)
+
+@router.get("/{task_id}", response_model=TaskResponse)
+def get_task(
+    task_id: int,
+    user_id: int = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+):
+    return task_service.get_task_by_id(task_id, user_id)
+
+@router.patch("/{task_id}", response_model=TaskResponse)
+def update_task(
+    task_id: int,
+    update_data: Dict[str, Any] = Body(...),
+    user_id: int = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+):
+    return task_service.update_existing_task(task_id, update_data, user_id)
+
+@router.delete("/{task_id}", status_code=204)
+def delete_task(
+    task_id: int,
+    user_id: int = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+):
+    task_service.delete_task_by_id(task_id, user_id)
+    return Response(status_code=204)
@@ -0,0 +1,42 @@
+"""
+Import historical study sessions from a CSV or NDJSON file
+
+Usage (from src/backend):
+    python scripts/import_sessions.py FILE [--format csv|ndjson] [--chunk-size N]
+
+CSV files need a header row with the SessionCreate field names. Rejected
+rows are printed with their index and don't stop the import.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import database_connection
+from services.session_service import SessionService
+from utils.import_formats import IMPORT_FORMATS
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    import_format = args.format or os.path.splitext(args.file)[1].lstrip(".").lower()
+    logging.basicConfig(level=logging.INFO)
+    db = database_connection.SessionLocal()
+    try:
+        with open(args.file, newline="", encoding="utf-8") as stream:
+            report = SessionService(db).import_sessions_file(stream, import_format, args.chunk_size)
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"row {error.row}: {error.message}", file=sys.stderr)
+    print(f"imported {report.created} sessions, {len(report.errors)} rows rejected")
+
+if __name__ == "__main__":
+    main()
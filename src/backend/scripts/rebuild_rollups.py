@@ -0,0 +1,34 @@
+"""
+Rebuild the daily study time rollups from the raw sessions
+
+Usage (from src/backend):
+    python scripts/rebuild_rollups.py [--user-id ID]
+
+Rollups are maintained incrementally by SessionService; run this after
+bulk edits made outside the service or to repair drifted totals.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import database_connection
+from services.analytics_service import AnalyticsService
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user-id", type=int, default=None, help="only rebuild this user's rollups")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = database_connection.SessionLocal()
+    try:
+        rows = AnalyticsService(db).rebuild_rollups(args.user_id)
+    finally:
+        db.close()
+    print(f"rebuilt {rows} rollup rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+import operator
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+from sqlalchemy import Column, Date, DateTime, Enum
+from sqlalchemy.orm import Session
+from exceptions import InvalidDataException
+from repositories.export_repository import EXPORTABLE_MODELS, ExportRepository
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+def _column_converters(columns: List[Column]) -> List[Tuple[int, Callable[[Any], Any]]]:
+    """(index, converter) for the columns whose values aren't CSV/JSON ready"""
+    converters = []
+    for index, column in enumerate(columns):
+        if isinstance(column.type, Enum) and column.type.enum_class is not None:
+            converters.append((index, operator.attrgetter("value")))
+        elif isinstance(column.type, (DateTime, Date)):
+            converters.append((index, operator.methodcaller("isoformat")))
+    return converters
+
+def _convert_rows(batch: Sequence[Tuple], converters) -> Iterator[Sequence[Any]]:
+    if not converters:
+        yield from batch
+        return
+    for row in batch:
+        row = list(row)
+        for index, convert in converters:
+            if row[index] is not None:
+                row[index] = convert(row[index])
+        yield row
+
+class ExportService:
+    def __init__(self, db: Session):
+        if not isinstance(db, Session):
+            raise ValueError("Invalid database session provided")
+        self.export_repository = ExportRepository(db)
+
+    @staticmethod
+    def validate(resource: str, export_format: str) -> str:
+        """
+        Check an export request before streaming starts
+
+        Returns:
+            str: Media type of the export
+        """
+        if resource not in EXPORTABLE_MODELS:
+            raise InvalidDataException(f"Unknown export resource: {resource}")
+        if export_format not in EXPORT_MEDIA_TYPES:
+            raise InvalidDataException(f"Unsupported export format: {export_format}")
+        return EXPORT_MEDIA_TYPES[export_format]
+
+    def export_rows(self, resource: str, user_id: int, export_format: str, batch_size: int = 1000) -> Iterator[str]:
+        """Yield the export one batch of rows at a time"""
+        self.validate(resource, export_format)
+        columns = self.export_repository.get_columns(resource)
+        converters = _column_converters(columns)
+        names = [column.name for column in columns]
+        batches = self.export_repository.iter_user_rows(resource, user_id, batch_size)
+        if export_format == "csv":
+            return self._csv(names, converters, batches)
+        return self._ndjson(names, converters, batches)
+
+    def _csv(self, names, converters, batches) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        yield buffer.getvalue()
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(_convert_rows(batch, converters))
+            yield buffer.getvalue()
+
+    def _ndjson(self, names, converters, batches) -> Iterator[str]:
+        dumps = json.JSONEncoder().encode
+        for batch in batches:
+            yield "".join(
+                dumps(dict(zip(names, row))) + "\n"
+                for row in _convert_rows(batch, converters)
+            )
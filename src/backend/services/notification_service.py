@@ -3,14 +3,51 @@ from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 import logging
+from core.metrics import timed
 from exceptions import NotificationNotFoundException, InvalidDataException, UnauthorizedAccessError
 from repositories.notification_repository import NotificationRepository
+from repositories.session_repository import SessionRepository
 from database.models.notification import Notification
+from database.unit_of_work import after_commit
+from utils.notification_hub import NotificationHub, notification_hub
+from utils.pagination import Page, encode_cursor, decode_datetime_cursor
 
 logger = logging.getLogger(__name__)
 
-class NotificationCreate(BaseModel):
-    """Validation model for creating notifications"""
+def notification_event(notification_id: int, notification_data: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready payload pushed to connected clients for a new notification"""
+    created_at = notification_data["created_at_utc"]
+    return {
+        "id": notification_id,
+        "title": notification_data["title"],
+        "message": notification_data["message"],
+        "notification_type": getattr(notification_data["notification_type"], "value", notification_data["notification_type"]),
+        "is_read": notification_data["is_read"],
+        "created_at_utc": created_at.isoformat() if isinstance(created_at, datetime) else created_at
+    }
+
+def publish_created_notifications(
+    db: Session,
+    notifications_data: List[Dict[str, Any]],
+    created_ids: List[int],
+    hub: NotificationHub = notification_hub
+) -> None:
+    """
+    Push newly created notifications to their users once the transaction commits
+
+    created_ids are paired with notifications_data by position, so they must
+    come from a RETURNING with sort_by_parameter_order; otherwise a user
+    could be sent the id of someone else's notification.
+    """
+    messages = [
+        (notification_data["user_id"], notification_event(notification_id, notification_data))
+        for notification_id, notification_data in zip(created_ids, notifications_data)
+    ]
+    if messages:
+        after_commit(db, lambda: hub.publish_many(messages))
+
+class NotificationTemplate(BaseModel):
+    """Validation model for notification content shared by many recipients"""
     title: str = Field(
         title="Notification Title",
         description="The title of the notification",
@@ -22,10 +59,6 @@ class NotificationCreate(BaseModel):
         description="The content of the notification",
         min_length=1
     )
-    user_id: int = Field(
-        title="User ID",
-        description="ID of the user receiving the notification"
-    )
     notification_type: str = Field(
         title="Notification Type",
         description="Type of notification (info/warning/error)",
@@ -41,6 +74,13 @@ class NotificationCreate(BaseModel):
         title="Creation Time"
     )
 
+class NotificationCreate(NotificationTemplate):
+    """Validation model for creating notifications"""
+    user_id: int = Field(
+        title="User ID",
+        description="ID of the user receiving the notification"
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -52,13 +92,16 @@ class NotificationCreate(BaseModel):
         }
 
 class NotificationService:
-    def __init__(self, database_session: Session):
+    def __init__(self, database_session: Session, hub: NotificationHub = notification_hub):
         """Initialize notification service with database session"""
         if not isinstance(database_session, Session):
             raise ValueError("Invalid database session provided")
         self.database_session = database_session
+        self.hub = hub
         self.notification_repository = NotificationRepository(database_session)
+        self.session_repository = SessionRepository(database_session)
 
+    @timed
     def get_user_notifications(
         self, 
         user_id: int, 
@@ -66,17 +109,53 @@ class NotificationService:
         include_read: bool = False
     ) -> List[Notification]:
         """Get notifications for a specific user"""
+        return self.get_user_notifications_page(user_id, limit, include_read).items
+
+    @timed
+    def get_user_notifications_page(
+        self,
+        user_id: int,
+        limit: int = 50,
+        include_read: bool = False,
+        cursor: Optional[str] = None
+    ) -> Page[Notification]:
+        """
+        Get a page of notifications for a user, newest first
+
+        Args:
+            user_id: ID of the user owning the notifications
+            limit: Maximum number of notifications in the page
+            include_read: Whether read notifications are included
+            cursor: Token returned as next_cursor by the previous page
+
+        Returns:
+            Page with the notifications and the cursor of the next page
+        """
         try:
-            notifications = self.notification_repository.get_notifications_by_user_id(user_id)
-            
-            if not include_read:
-                notifications = [n for n in notifications if not n.is_read]
-                
-            return notifications[:limit]
+            if limit < 1:
+                raise InvalidDataException("Limit must be a positive integer")
+
+            decoded_cursor = decode_datetime_cursor(cursor) if cursor else None
+            # One extra row tells us whether another page exists
+            notifications = self.notification_repository.get_user_notifications_page(
+                user_id,
+                limit + 1,
+                include_read,
+                decoded_cursor
+            )
+
+            next_cursor = None
+            if len(notifications) > limit:
+                notifications = notifications[:limit]
+                last_notification = notifications[-1]
+                next_cursor = encode_cursor(last_notification.created_at_utc, last_notification.id)
+
+            return Page(items=notifications, next_cursor=next_cursor)
         except Exception as error:
             logger.error(f"Error fetching notifications for user {user_id}: {str(error)}")
             raise
 
+    @timed
     def create_notification(
         self, 
         notification_data: Dict[str, Any], 
@@ -96,13 +175,19 @@ class NotificationService:
             # Validate notification data
             validated_notification = NotificationCreate(**notification_data)
             
-            # Create notification
-            created_notification = self.notification_repository.create_notification(
-                validated_notification.model_dump(exclude_unset=True)
-            )
+            # Create notification; defaults such as created_at_utc must be kept
+            notification_values = validated_notification.model_dump()
+            created_notification = self.notification_repository.create_notification(notification_values)
             
             if not created_notification:
                 raise InvalidDataException("Failed to create notification")
+
+            publish_created_notifications(
+                self.database_session,
+                [notification_values],
+                [created_notification.id],
+                self.hub
+            )
             
             logger.info(
                 f"Notification created for user {notification_data['user_id']} "
@@ -117,6 +202,64 @@ class NotificationService:
             logger.error(f"Error creating notification: {str(error)}")
             raise
 
+    @timed
+    def create_notifications_bulk(
+        self,
+        template_data: Dict[str, Any],
+        user_ids: List[int],
+        requesting_user_id: int
+    ) -> List[int]:
+        """
+        Send the same notification to many users
+
+        Args:
+            template_data: Notification content shared by every recipient
+            user_ids: IDs of the users receiving the notification
+            requesting_user_id: ID of the user creating the notifications
+
+        Returns:
+            IDs of the created notifications, in recipient order
+        """
+        try:
+            # Validate once; every row shares the same content
+            validated_template = NotificationTemplate(**template_data)
+            recipients = list(dict.fromkeys(user_ids))
+            if not recipients:
+                return []
+
+            notification_data = validated_template.model_dump()
+            created_ids = self.notification_repository.create_notifications_bulk(notification_data, recipients)
+            publish_created_notifications(
+                self.database_session,
+                [{**notification_data, "user_id": user_id} for user_id in recipients],
+                created_ids,
+                self.hub
+            )
+
+            logger.info(
+                f"{len(created_ids)} notifications created by user {requesting_user_id}"
+            )
+            return created_ids
+
+        except ValueError as error:
+            logger.warning(f"Invalid notification data: {str(error)}")
+            raise InvalidDataException(str(error))
+        except Exception as error:
+            logger.error(f"Error creating notifications in bulk: {str(error)}")
+            raise
+
+    @timed
+    def notify_session_participants(
+        self,
+        session_id: int,
+        template_data: Dict[str, Any],
+        requesting_user_id: int
+    ) -> List[int]:
+        """Send a notification to every participant of a study session"""
+        participant_ids = self.session_repository.get_participant_user_ids(session_id)
+        return self.create_notifications_bulk(template_data, participant_ids, requesting_user_id)
+
+    @timed
     def mark_notification_as_read(
         self, 
         notification_id: int, 
@@ -146,6 +289,48 @@ class NotificationService:
             logger.error(f"Error marking notification {notification_id} as read: {str(error)}")
             raise
 
+    @timed
+    def mark_all_read(self, user_id: int, before: Optional[datetime] = None) -> int:
+        """
+        Mark all of a user's unread notifications as read
+
+        Args:
+            user_id: ID of the user owning the notifications
+            before: Only notifications created before this time are marked
+
+        Returns:
+            Number of notifications that changed
+        """
+        try:
+            updated_count = self.notification_repository.mark_all_read(user_id, before)
+            logger.info(f"{updated_count} notifications marked as read for user {user_id}")
+            return updated_count
+        except Exception as error:
+            logger.error(f"Error marking notifications as read for user {user_id}: {str(error)}")
+            raise
+
+    @timed
+    def mark_read(self, notification_ids: List[int], user_id: int) -> int:
+        """
+        Mark a set of notifications as read
+
+        Notifications that belong to other users are left untouched, so the
+        returned count may be smaller than the number of IDs given.
+
+        Returns:
+            Number of notifications that changed
+        """
+        try:
+            if not notification_ids:
+                return 0
+            updated_count = self.notification_repository.mark_read(notification_ids, user_id)
+            logger.info(f"{updated_count} notifications marked as read for user {user_id}")
+            return updated_count
+        except Exception as error:
+            logger.error(f"Error marking notifications as read for user {user_id}: {str(error)}")
+            raise
+
+    @timed
     def delete_notification(self, notification_id: int, user_id: int) -> bool:
         """Delete a notification"""
         try:
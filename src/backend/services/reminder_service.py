@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from database.models.notification import NotificationType
+from database.unit_of_work import unit_of_work
+from exceptions import InvalidDataException
+from repositories.notification_repository import NotificationRepository
+from repositories.reminder_repository import ReminderRepository
+from services.notification_service import publish_created_notifications
+import logging
+
+logger = logging.getLogger(__name__)
+
+def window_label(hours: int) -> str:
+    return f"{hours}h"
+
+class ReminderService:
+    def __init__(self, database_session: Session):
+        if not isinstance(database_session, Session):
+            raise ValueError("Invalid database session provided")
+        self.database_session = database_session
+        self.reminder_repository = ReminderRepository(database_session)
+        self.notification_repository = NotificationRepository(database_session)
+
+    def send_due_reminders(
+        self,
+        windows_hours: Sequence[int],
+        now: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> int:
+        """
+        Notify the owners of open tasks that are due soon
+
+        Each window only covers the band above the next smaller one, so a
+        task due in 30 minutes with windows [24, 1] gets the 1h reminder
+        only, and a task due tomorrow gets the 24h one now and the 1h one
+        later.
+
+        Returns:
+            int: Number of reminders sent
+        """
+        if not windows_hours or any(hours <= 0 for hours in windows_hours):
+            raise InvalidDataException("Reminder windows must be positive numbers of hours")
+        if batch_size < 1:
+            raise InvalidDataException("Batch size must be a positive integer")
+
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        sent = 0
+        lower_hours = 0
+        for hours in sorted(set(windows_hours)):
+            sent += self._send_window_reminders(
+                window_label(hours),
+                now + timedelta(hours=lower_hours),
+                now + timedelta(hours=hours),
+                now,
+                batch_size
+            )
+            lower_hours = hours
+        return sent
+
+    def _send_window_reminders(
+        self,
+        window: str,
+        due_from: datetime,
+        due_until: datetime,
+        now: datetime,
+        batch_size: int
+    ) -> int:
+        sent = 0
+        cursor = None
+        while True:
+            tasks = self.reminder_repository.get_due_tasks_chunk(window, due_from, due_until, batch_size, cursor)
+            if not tasks:
+                break
+            cursor = (tasks[-1][3], tasks[-1][0])
+
+            with unit_of_work(self.database_session):
+                claimed = set(self.reminder_repository.claim_reminders([task[0] for task in tasks], window, now))
+                reminders = [
+                    {
+                        "title": "Task due soon",
+                        "message": f"'{title}' is due at {due_date:%Y-%m-%d %H:%M} UTC",
+                        "user_id": user_id,
+                        "notification_type": NotificationType.WARNING.value,
+                        "is_read": False,
+                        "created_at_utc": now
+                    }
+                    for task_id, user_id, title, due_date in tasks
+                    if task_id in claimed
+                ]
+                created_ids = self.notification_repository.create_notifications(reminders)
+                publish_created_notifications(self.database_session, reminders, created_ids)
+            sent += len(claimed)
+
+            if len(tasks) < batch_size:
+                break
+
+        if sent:
+            logger.info(f"Sent {sent} '{window}' task reminders")
+        return sent
+
+class ReminderScheduler:
+    """Runs ReminderService periodically on the event loop, with the DB work in a thread"""
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        windows_hours: List[int],
+        interval_seconds: float,
+        batch_size: int = 1000
+    ):
+        self.session_factory = session_factory
+        self.windows_hours = windows_hours
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        db = self.session_factory()
+        try:
+            return ReminderService(db).send_due_reminders(self.windows_hours, now, self.batch_size)
+        finally:
+            db.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as error:
+                logger.error(f"Reminder run failed: {str(error)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="task-reminders")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
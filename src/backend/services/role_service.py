@@ -2,7 +2,9 @@ from datetime import datetime, timezone
 from pydantic import BaseModel, Field, ValidationError
 from typing import Optional, Dict, Any
 from exceptions import RoleNotFoundException, InvalidDataException, UnauthorizedAccessError
-from repositories.role_repository import RoleRepository
+from repositories.role_repository import CachedRoleRepository, RoleRepository
+from repositories.user_repository import UserRepository
+from utils.permissions import ADMIN_PERMISSION, has_permission, permission_registry
 from sqlalchemy.orm import Session
 import logging
 from database.models import Role
@@ -51,13 +53,26 @@ class RoleService:
             raise ValueError("Invalid database session provided")
         self.database_session = database_session
         self.role_repository = RoleRepository(database_session)
+        self.cached_role_repository = CachedRoleRepository(database_session)
+        self.user_repository = UserRepository(database_session)
 
     def _verify_admin_access(self, user_id: int) -> None:
-        pass
+        user = self.user_repository.get_user_by_id(user_id)
+        role = None
+        if user and user.is_active and user.role_id:
+            role = self.cached_role_repository.get_role_by_id(user.role_id)
+
+        if not role or not role.is_active or not has_permission(role, ADMIN_PERMISSION):
+            logger.warning(f"User {user_id} attempted an admin-only role operation")
+            raise UnauthorizedAccessError("Admin access required")
+
+    def verify_admin_access(self, user_id: int) -> None:
+        """Raise UnauthorizedAccessError unless the user holds an active admin role"""
+        self._verify_admin_access(user_id)
 
     def get_role(self, role_id: int, requesting_user_id: int) -> Dict[str, Any]:
         try:
-            role = self.role_repository.get_role_by_id(role_id)
+            role = self.cached_role_repository.get_role_by_id(role_id)
             if not role:
                 raise RoleNotFoundException(f"Role {role_id} not found")
             return role
@@ -81,6 +96,7 @@ class RoleService:
             created_role = self.role_repository.create_role(
                 role_create.model_dump(exclude_unset=True)
             )
+            self.cached_role_repository.invalidate()
 
             logger.info(f"Role created: {created_role.name} by user {requesting_user_id}")
             return created_role
@@ -96,7 +112,8 @@ class RoleService:
         try:
             self._verify_admin_access(requesting_user_id)
 
-            existing_role = self.get_role(role_id, requesting_user_id)
+            # Writes check against the current row, never a cached copy
+            existing_role = self.role_repository.get_role_by_id(role_id)
             if not existing_role:
                 raise RoleNotFoundException(f"Role {role_id} not found")
 
@@ -109,7 +126,9 @@ class RoleService:
                 raise UnauthorizedAccessError("Cannot modify role to be a system role")
 
             role_data['updated_at'] = datetime.now(timezone.utc)
-            updated_role = self.role_repository.update_role(role_id, role_data)
+            updated_role = self.role_repository.save_role(existing_role, role_data)
+            self.cached_role_repository.invalidate()
+            permission_registry.invalidate(role_id)
             return updated_role
 
         except Exception as error:
@@ -119,21 +138,17 @@ class RoleService:
     def delete_role(self, role_id: int, requesting_user_id: int) -> bool:
         try:
             self._verify_admin_access(requesting_user_id)
-            
-            existing_role = self.get_role(role_id, requesting_user_id)
+
+            existing_role = self.role_repository.get_role_by_id(role_id)
             if not existing_role:
                 raise RoleNotFoundException(f"Role {role_id} not found")
 
             if existing_role.name.lower() in {'admin', 'system', 'superuser'}:
                 raise UnauthorizedAccessError("Cannot delete system roles")
 
-            if not self.role_repository.delete_role(role_id):
-                raise RoleNotFoundException(f"Role {role_id} not found")
-
-            deleted_role = self.role_repository.get_role_by_id(role_id)
-            if deleted_role:
-                raise Exception("Role deletion failed")
-
+            self.role_repository.delete_loaded_role(existing_role)
+            self.cached_role_repository.invalidate()
+            permission_registry.invalidate(role_id)
             return True
 
         except Exception as error:
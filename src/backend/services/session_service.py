@@ -1,10 +1,21 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pydantic import BaseModel, Field, ValidationError
-from typing import Optional, Dict
+from typing import Optional, Dict, Any, Iterable, List, TextIO
 from exceptions import SessionNotFoundException, InvalidDataException
 from repositories.session_repository import SessionRepository
+from repositories.user_repository import UserRepository
+from services.notification_service import NotificationService
+from services.analytics_service import AnalyticsService, contributions_of, merge_contributions, session_contributions
+from database.unit_of_work import unit_of_work
 from sqlalchemy.orm import Session
 from pydantic.functional_validators import field_validator
+from utils.import_formats import IMPORT_FORMATS, read_records
+import logging
+from core.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 class SessionCreate(BaseModel):
     name: str
@@ -12,6 +23,7 @@ class SessionCreate(BaseModel):
     start_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     end_time: datetime
     status: str = "pending"
+    category: str = Field(default="general", min_length=1, max_length=100)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -29,32 +41,180 @@ class SessionCreate(BaseModel):
             raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
         return status
 
+@dataclass
+class SessionImportError:
+    row: int
+    message: str
+
+@dataclass
+class SessionImportReport:
+    created: int = 0
+    errors: List[SessionImportError] = field(default_factory=list)
+
+def _utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# Session columns that feed the study time rollups
+ROLLUP_FIELDS = {"created_by", "start_time", "end_time", "status", "category"}
+
 class SessionService:
     def __init__(self, db: Session):
         self.db = db
         self.session_repo = SessionRepository(db)
+        self.user_repo = UserRepository(db)
+        self.analytics_service = AnalyticsService(db)
 
+    @timed
     def get_session(self, session_id: int) -> Dict:
         session = self.session_repo.get_session_by_id(session_id)
         if not session:
             raise SessionNotFoundException("Session not found")
         return session
 
+    @timed
+    def get_session_details(self, session_id: int) -> Dict:
+        """Session with its creator, tasks and participants loaded up front"""
+        session = self.session_repo.get_session_with_tasks_and_participants(session_id)
+        if not session:
+            raise SessionNotFoundException("Session not found")
+        return session
+
+    @timed
     def create_session(self, session_data: dict) -> Dict:
         try:
             session_create = SessionCreate(**session_data)
-            return self.session_repo.create_session(session_create.model_dump())
         except ValidationError as e:
             raise InvalidDataException(str(e))
 
+        with unit_of_work(self.db):
+            session = self.session_repo.create_session(session_create.model_dump())
+            self.analytics_service.record_session_change(None, contributions_of(session))
+        return session
+
+
+    @timed
+    def create_session_with_participants(
+        self,
+        session_data: dict,
+        participant_ids: List[int],
+        notification_data: Optional[Dict[str, Any]] = None,
+        participant_role: str = "participant"
+    ) -> Dict:
+        """
+        Create a session, enrol its participants and optionally notify them,
+        all in one transaction
+        """
+        with unit_of_work(self.db):
+            session = self.create_session(session_data)
+            participant_ids = list(dict.fromkeys(participant_ids))
+            self.session_repo.add_participants(
+                session.id,
+                participant_ids,
+                participant_role,
+                datetime.now(timezone.utc)
+            )
+            if notification_data and participant_ids:
+                NotificationService(self.db).create_notifications_bulk(
+                    notification_data,
+                    participant_ids,
+                    requesting_user_id=session.created_by
+                )
+        return session
 
+    @timed
     def update_session(self, session_id: int, session_data: dict) -> Dict:
-        session = self.session_repo.update_session(session_id, session_data)
-        if not session:
-            raise SessionNotFoundException("Session not found")
+        if not ROLLUP_FIELDS.intersection(session_data):
+            session = self.session_repo.update_session(session_id, session_data)
+            if not session:
+                raise SessionNotFoundException("Session not found")
+            return session
+
+        with unit_of_work(self.db):
+            existing_session = self.session_repo.get_session_by_id(session_id)
+            if not existing_session:
+                raise SessionNotFoundException("Session not found")
+            # Capture before the UPDATE ... RETURNING overwrites the loaded row
+            old_contributions = contributions_of(existing_session)
+            session = self.session_repo.update_session(session_id, session_data)
+            self.analytics_service.record_session_change(old_contributions, contributions_of(session))
         return session
 
-    def delete_session(self, session_id: int) -> bool:  
-        if not self.session_repo.delete_session(session_id):
-            raise SessionNotFoundException("Session not found")
-        return True
\ No newline at end of file
+    @timed
+    def delete_session(self, session_id: int) -> bool:
+        with unit_of_work(self.db):
+            existing_session = self.session_repo.get_session_by_id(session_id)
+            if not existing_session:
+                raise SessionNotFoundException("Session not found")
+            old_contributions = contributions_of(existing_session)
+            self.session_repo.delete_loaded_session(existing_session)
+            self.analytics_service.record_session_change(old_contributions, None)
+        return True
+
+    @timed
+    def import_sessions(self, sessions_data: Iterable[dict], chunk_size: int = 5000) -> SessionImportReport:
+        """
+        Create historical sessions from a stream of rows, e.g. another tracker's export
+
+        Rows are validated as they are read and handled chunk_size at a
+        time: each chunk is inserted in one round trip (COPY on PostgreSQL)
+        together with its study time rollups. Invalid rows and rows whose
+        creator doesn't exist are reported by their index and do not stop
+        the import.
+        """
+        report = SessionImportReport()
+        rows = enumerate(sessions_data)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            valid_rows: List[tuple] = []
+            for row_number, session_data in chunk:
+                try:
+                    valid_rows.append((row_number, SessionCreate(**session_data)))
+                except ValidationError as e:
+                    report.errors.append(SessionImportError(row_number, f"Invalid data: {e}"))
+                except TypeError:
+                    report.errors.append(SessionImportError(row_number, "Row is not a mapping"))
+
+            existing_user_ids = self.user_repo.get_existing_user_ids(
+                {session_create.created_by for _, session_create in valid_rows}
+            )
+            sessions_values = []
+            contributions: Dict[tuple, int] = {}
+            for row_number, session_create in valid_rows:
+                if session_create.created_by not in existing_user_ids:
+                    report.errors.append(SessionImportError(row_number, "User not found"))
+                    continue
+                session_values = session_create.model_dump()
+                for column in ("start_time", "end_time", "created_at", "updated_at"):
+                    session_values[column] = _utc_naive(session_values[column])
+                sessions_values.append(session_values)
+                merge_contributions(contributions, session_contributions(
+                    session_create.created_by,
+                    session_values["start_time"],
+                    session_values["end_time"],
+                    session_create.status,
+                    session_create.category
+                ))
+            if not sessions_values:
+                continue
+
+            with unit_of_work(self.db):
+                self.session_repo.create_sessions_bulk(sessions_values)
+                self.analytics_service.record_session_change(None, contributions)
+            report.created += len(sessions_values)
+
+        report.errors.sort(key=lambda error: error.row)
+        logger.info(f"Imported {report.created} sessions, {len(report.errors)} rows rejected")
+        return report
+
+    @timed
+    def import_sessions_file(self, stream: TextIO, import_format: str, chunk_size: int = 5000) -> SessionImportReport:
+        """Import sessions from a CSV (with header) or NDJSON file"""
+        if import_format not in IMPORT_FORMATS:
+            raise InvalidDataException(f"Unsupported import format: {import_format}")
+        return self.import_sessions(read_records(stream, import_format), chunk_size)
@@ -1,12 +1,14 @@
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 from pydantic.functional_validators import field_validator
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from exceptions import TaskNotFoundException, InvalidDataException, UnauthorizedAccessError
 from repositories.task_repository import TaskRepository
 from sqlalchemy.orm import Session
 import logging
-from database.models.task import Task 
+from core.metrics import timed
+from database.models.task import Task, TaskPriority, TaskStatus
+from utils.pagination import Page, decode_int_cursor, decode_optional_datetime_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +75,17 @@ class TaskCreate(BaseModel):
             raise ValueError("Due date must be in the future")
         return due_date
 
+PRIORITY_ORDER = {TaskPriority.HIGH: 0, TaskPriority.MEDIUM: 1, TaskPriority.LOW: 2}
+
+def _parse_enum_values(enum_class, values: Optional[List[str]], label: str) -> Optional[List]:
+    if not values:
+        return None
+    try:
+        return [enum_class(value.lower()) for value in values]
+    except (ValueError, AttributeError):
+        allowed = ", ".join(member.value for member in enum_class)
+        raise InvalidDataException(f"{label} must be one of: {allowed}")
+
 class TaskService:
 
     def __init__(self, database_session: Session):
@@ -86,6 +99,7 @@ class TaskService:
         if not task or task.created_by_user_id != requesting_user_id:
             raise UnauthorizedAccessError("User not authorized to access this task")
 
+    @timed
     def get_task_by_id(self, task_id: int, requesting_user_id: int) -> Task:
         """Get a task by ID with user authorization check"""
         try:
@@ -99,6 +113,95 @@ class TaskService:
             logger.error(f"Error retrieving task {task_id}: {str(error)}")
             raise
 
+    @timed
+    def list_user_tasks(
+        self,
+        requesting_user_id: int,
+        statuses: Optional[List[str]] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Page[Task]:
+        """
+        Get a page of the user's tasks, soonest due first
+
+        Args:
+            requesting_user_id: ID of the user owning the tasks
+            statuses: Only tasks in these statuses, e.g. ["pending", "in_progress"]
+            due_after: Only tasks due at or after this time
+            due_before: Only tasks due before this time
+            limit: Maximum number of tasks in the page
+            cursor: Token returned as next_cursor by the previous page
+
+        Returns:
+            Page with the tasks and the cursor of the next page
+        """
+        try:
+            if limit < 1:
+                raise InvalidDataException("Limit must be a positive integer")
+
+            decoded_cursor = decode_optional_datetime_cursor(cursor) if cursor else None
+            tasks = self.task_repository.get_user_tasks_page(
+                requesting_user_id,
+                limit + 1,
+                _parse_enum_values(TaskStatus, statuses, "Status"),
+                due_after,
+                due_before,
+                decoded_cursor
+            )
+
+            next_cursor = None
+            if len(tasks) > limit:
+                tasks = tasks[:limit]
+                next_cursor = encode_cursor(tasks[-1].due_date, tasks[-1].id)
+            return Page(items=tasks, next_cursor=next_cursor)
+        except Exception as error:
+            logger.error(f"Error listing tasks for user {requesting_user_id}: {str(error)}")
+            raise
+
+    @timed
+    def list_session_tasks(
+        self,
+        session_id: int,
+        priorities: Optional[List[str]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Page[Task]:
+        """
+        Get a page of a session's tasks, highest priority first
+
+        Args:
+            session_id: ID of the session the tasks belong to
+            priorities: Only tasks with these priorities, e.g. ["high"]
+            limit: Maximum number of tasks in the page
+            cursor: Token returned as next_cursor by the previous page
+
+        Returns:
+            Page with the tasks and the cursor of the next page
+        """
+        try:
+            if limit < 1:
+                raise InvalidDataException("Limit must be a positive integer")
+
+            decoded_cursor = decode_int_cursor(cursor) if cursor else None
+            tasks = self.task_repository.get_session_tasks_page(
+                session_id,
+                limit + 1,
+                _parse_enum_values(TaskPriority, priorities, "Priority"),
+                decoded_cursor
+            )
+
+            next_cursor = None
+            if len(tasks) > limit:
+                tasks = tasks[:limit]
+                next_cursor = encode_cursor(PRIORITY_ORDER[tasks[-1].priority_level], tasks[-1].id)
+            return Page(items=tasks, next_cursor=next_cursor)
+        except Exception as error:
+            logger.error(f"Error listing tasks for session {session_id}: {str(error)}")
+            raise
+
+    @timed
     def create_new_task(self, task_data: Dict[str, Any], requesting_user_id: int) -> Task:
         """Create a new task with validation"""
         try:
@@ -137,6 +240,7 @@ class TaskService:
             )
             raise
     
+    @timed
     def update_existing_task(
         self, 
         task_id: int, 
@@ -151,22 +255,16 @@ class TaskService:
 
             update_data['last_updated_at_utc'] = datetime.now(timezone.utc)
             
-            updated_task = self.task_repository.update_task(task_id, update_data)
-            if not updated_task:
-                raise TaskNotFoundException(f"Task {task_id} not found")
-            
-            return updated_task
+            return self.task_repository.save_task(existing_task, update_data)
         except Exception as error:
             logger.error(f"Error updating task {task_id}: {str(error)}")
             raise
 
+    @timed
     def delete_task_by_id(self, task_id: int, requesting_user_id: int) -> bool:
         try:
-            self.verify_user_task_access(
-                self.get_task_by_id(task_id, requesting_user_id),
-                requesting_user_id
-            )
-            
+            self.get_task_by_id(task_id, requesting_user_id)
+
             if not self.task_repository.delete_taskById(task_id):
                 raise TaskNotFoundException(f"Task {task_id} not found")
             
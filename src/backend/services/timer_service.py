@@ -0,0 +1,257 @@
+import asyncio
+import enum
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+from core.config import settings
+from database.connection import database_connection
+from exceptions import InvalidDataException, SessionNotFoundException
+from repositories.session_repository import SessionRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TimerState(str, enum.Enum):
+    IDLE = "idle"
+    RUNNING = "running"
+    PAUSED = "paused"
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class TimerRecord:
+    """Timer of one session; elapsed excludes the running stretch since started_at"""
+    __slots__ = ("session_id", "state", "elapsed", "started_at", "dirty")
+
+    def __init__(
+        self,
+        session_id: int,
+        state: TimerState = TimerState.IDLE,
+        elapsed: float = 0.0,
+        started_at: Optional[datetime] = None
+    ):
+        self.session_id = session_id
+        self.state = state
+        self.elapsed = elapsed
+        self.started_at = started_at
+        self.dirty = False
+
+    def elapsed_at(self, now: datetime) -> float:
+        if self.state is TimerState.RUNNING:
+            return self.elapsed + max(0.0, (now - self.started_at).total_seconds())
+        return self.elapsed
+
+    def _require(self, action: str, *states: TimerState) -> None:
+        if self.state not in states:
+            raise InvalidDataException(f"Cannot {action} a timer that is {self.state.value}")
+
+    def start(self, now: datetime) -> None:
+        self._require("start", TimerState.IDLE)
+        self.state, self.elapsed, self.started_at, self.dirty = TimerState.RUNNING, 0.0, now, True
+
+    def pause(self, now: datetime) -> None:
+        self._require("pause", TimerState.RUNNING)
+        self.elapsed = self.elapsed_at(now)
+        self.state, self.started_at, self.dirty = TimerState.PAUSED, None, True
+
+    def resume(self, now: datetime) -> None:
+        self._require("resume", TimerState.PAUSED)
+        self.state, self.started_at, self.dirty = TimerState.RUNNING, now, True
+
+    def reset(self) -> None:
+        self.state, self.elapsed, self.started_at, self.dirty = TimerState.IDLE, 0.0, None, True
+
+@dataclass(frozen=True)
+class TimerSnapshot:
+    session_id: int
+    state: TimerState
+    elapsed_seconds: float
+
+class TimerService:
+    """
+    Study timers kept in memory and written to their Session rows in batches
+
+    Transitions only mark a timer dirty; dirty timers are written together
+    with one executemany UPDATE once flush_interval has passed (checked on
+    every call and by the periodic flush loop) and on shutdown. A timer not
+    in memory, e.g. after a restart, is rehydrated from its row; a running
+    timer keeps counting from its persisted start. Timers of one session
+    must be served by a single worker process.
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_interval: float = 5.0,
+        clock: Callable[[], datetime] = _utc_now,
+        monotonic: Callable[[], float] = time.monotonic
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.monotonic = monotonic
+        self._timers: Dict[int, TimerRecord] = {}
+        self._lock = threading.RLock()
+        # Held from copying the dirty timers until they are committed, so an
+        # older copy can never be written over a newer one
+        self._flush_lock = threading.Lock()
+        # Bumped whenever a flushed idle timer is dropped from memory; a row
+        # read before that may predate the flush
+        self._evictions = 0
+        self._last_flush = monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _get_record(self, session_id: int) -> TimerRecord:
+        # The row is read without holding the lock so one rehydration
+        # doesn't stall every other timer
+        while True:
+            record = self._timers.get(session_id)
+            if record is not None:
+                return record
+            evictions = self._evictions
+            db = self.session_factory()
+            try:
+                timer_state = SessionRepository(db).get_timer_state(session_id)
+            finally:
+                db.close()
+            if timer_state is None:
+                raise SessionNotFoundException("Session not found")
+            state, elapsed, started_at = timer_state
+            loaded = TimerRecord(session_id, TimerState(state), elapsed or 0.0, started_at)
+            with self._lock:
+                if self._evictions == evictions:
+                    return self._timers.setdefault(session_id, loaded)
+
+    def _snapshot(self, record: TimerRecord, now: datetime) -> TimerSnapshot:
+        return TimerSnapshot(record.session_id, record.state, record.elapsed_at(now))
+
+    def _transition(self, session_id: int, action: Callable[[TimerRecord, datetime], None]) -> TimerSnapshot:
+        now = self.clock()
+        while True:
+            record = self._get_record(session_id)
+            with self._lock:
+                # A flush may have dropped the record since it was looked up
+                if self._timers.get(session_id) is record:
+                    action(record, now)
+                    snapshot = self._snapshot(record, now)
+                    break
+        self.flush_if_due()
+        return snapshot
+
+    def get(self, session_id: int) -> TimerSnapshot:
+        record = self._get_record(session_id)
+        with self._lock:
+            return self._snapshot(record, self.clock())
+
+    def start(self, session_id: int) -> TimerSnapshot:
+        return self._transition(session_id, TimerRecord.start)
+
+    def pause(self, session_id: int) -> TimerSnapshot:
+        return self._transition(session_id, TimerRecord.pause)
+
+    def resume(self, session_id: int) -> TimerSnapshot:
+        return self._transition(session_id, TimerRecord.resume)
+
+    def reset(self, session_id: int) -> TimerSnapshot:
+        return self._transition(session_id, lambda record, now: record.reset())
+
+    def flush_if_due(self) -> int:
+        if self.monotonic() - self._last_flush < self.flush_interval:
+            return 0
+        # Another thread is already flushing; the request doesn't wait for it
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        try:
+            if self.monotonic() - self._last_flush < self.flush_interval:
+                return 0
+            return self._flush()
+        finally:
+            self._flush_lock.release()
+
+    def flush(self) -> int:
+        """
+        Write every dirty timer in one statement
+
+        Returns:
+            int: Number of timers written
+        """
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self) -> int:
+        with self._lock:
+            self._last_flush = self.monotonic()
+            dirty: List[TimerRecord] = [record for record in self._timers.values() if record.dirty]
+            timer_states = [
+                {
+                    "session_id": record.session_id,
+                    "timer_state": record.state.value,
+                    "timer_elapsed_seconds": record.elapsed,
+                    "timer_started_at": record.started_at
+                }
+                for record in dirty
+            ]
+            for record in dirty:
+                record.dirty = False
+        if not timer_states:
+            return 0
+
+        db = self.session_factory()
+        try:
+            SessionRepository(db).save_timer_states(timer_states)
+        except Exception as error:
+            logger.error(f"Failed to flush {len(timer_states)} timers: {str(error)}")
+            with self._lock:
+                for record in dirty:
+                    record.dirty = True
+            raise
+        finally:
+            db.close()
+
+        with self._lock:
+            # Idle timers rehydrate to the same state, no need to keep them
+            for record in dirty:
+                if record.state is TimerState.IDLE and not record.dirty and self._timers.get(record.session_id) is record:
+                    del self._timers[record.session_id]
+                    self._evictions += 1
+        return len(timer_states)
+
+    async def _run_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                # Already logged; the timers stay dirty for the next round
+                pass
+
+    def start_flush_loop(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._run_flush_loop(), name="timer-flush")
+
+    async def stop_flush_loop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await asyncio.to_thread(self.flush)
+
+_timer_service: Optional[TimerService] = None
+_timer_service_lock = threading.Lock()
+
+def get_timer_service() -> TimerService:
+    """Process-wide TimerService bound to the application database"""
+    global _timer_service
+    if _timer_service is None:
+        with _timer_service_lock:
+            if _timer_service is None:
+                _timer_service = TimerService(
+                    database_connection.SessionLocal,
+                    settings.TIMER_FLUSH_INTERVAL_SECONDS
+                )
+    return _timer_service
@@ -1,9 +1,16 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pydantic import EmailStr, BaseModel, ValidationError, field_validator, Field
-from typing import Optional, Dict
-from exceptions import UserNotFoundException, InvalidDataException
+from typing import Optional, Dict, Iterable, List, Tuple
+from exceptions import UserNotFoundException, InvalidDataException, UnauthorizedAccessError
 from repositories.user_repository import UserRepository
+from repositories.role_repository import CachedRoleRepository
 from sqlalchemy.orm import Session
+from utils.hashing import PasswordHasher, pwd_context
+import logging
+
+logger = logging.getLogger(__name__)
 
 class UserCreate(BaseModel):
     username: str
@@ -34,10 +41,39 @@ class UserCreate(BaseModel):
         return password
 
 
+@dataclass
+class UserImportError:
+    row: int
+    message: str
+
+@dataclass
+class UserImportReport:
+    created: int = 0
+    errors: List[UserImportError] = field(default_factory=list)
+
+
 class UserService:
     def __init__(self, db: Session):
         self.db = db
         self.user_repo = UserRepository(db)
+        self.role_repo = CachedRoleRepository(db)
+
+    def _resolve_role_id(self, role_name: str, role_ids: Optional[Dict[str, Optional[int]]] = None) -> Optional[int]:
+        if role_ids is not None and role_name in role_ids:
+            return role_ids[role_name]
+        role = self.role_repo.get_role_by_name(role_name)
+        if not role:
+            logger.warning(f"Role '{role_name}' does not exist; user created without a role")
+        role_id = role.id if role else None
+        if role_ids is not None:
+            role_ids[role_name] = role_id
+        return role_id
+
+    def _user_values(self, user_create: UserCreate, role_id: Optional[int]) -> dict:
+        # role is a name in UserCreate but a foreign key on User
+        user_values = user_create.model_dump(exclude={"role"})
+        user_values["role_id"] = role_id
+        return user_values
 
     def get_user(self, user_id: int) -> Optional[Dict]:
         user = self.user_repo.get_user_by_id(user_id)
@@ -45,13 +81,120 @@ class UserService:
             raise UserNotFoundException("User not found.")
         return user
 
+    def get_user_dashboard(self, user_id: int) -> Dict:
+        """User with role, sessions, tasks, notifications and joined sessions loaded up front"""
+        user = self.user_repo.get_user_dashboard(user_id)
+        if not user:
+            raise UserNotFoundException("User not found.")
+        return user
+
     def create_user(self, user_data: dict) -> Dict:
         try:
             user_create = UserCreate(**user_data)
         except ValidationError as e:
             raise InvalidDataException(f"Invalid data: {e}")
 
-        return self.user_repo.create_user(user_create.model_dump())
+        user_values = self._user_values(user_create, self._resolve_role_id(user_create.role))
+        user_values["password"] = PasswordHasher.get_password_hash(user_create.password)
+        if not user_values["password"]:
+            raise InvalidDataException("Could not hash password")
+
+        return self.user_repo.create_user(user_values)
+
+    def import_users(self, users_data: Iterable[dict], chunk_size: int = 1000) -> UserImportReport:
+        """
+        Create users from a stream of rows, e.g. a whole class at once
+
+        Rows are validated as they are read and handled chunk_size at a
+        time: passwords are hashed in parallel on the hashing pool and each
+        chunk is inserted with one executemany. Invalid or duplicate rows
+        are reported by their index and do not stop the import.
+        """
+        report = UserImportReport()
+        role_ids: Dict[str, Optional[int]] = {}
+        rows = enumerate(users_data)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            valid_rows: List[Tuple[int, UserCreate]] = []
+            for row_number, user_data in chunk:
+                try:
+                    valid_rows.append((row_number, UserCreate(**user_data)))
+                except ValidationError as e:
+                    report.errors.append(UserImportError(row_number, f"Invalid data: {e}"))
+                except TypeError:
+                    report.errors.append(UserImportError(row_number, "Row is not a mapping"))
+
+            valid_rows = self._drop_duplicate_users(valid_rows, report)
+            if not valid_rows:
+                continue
+
+            hashed_passwords = PasswordHasher.get_password_hashes(
+                [user_create.password for _, user_create in valid_rows]
+            )
+            users_values = []
+            for (_, user_create), hashed_password in zip(valid_rows, hashed_passwords):
+                user_values = self._user_values(
+                    user_create,
+                    self._resolve_role_id(user_create.role, role_ids)
+                )
+                user_values["password"] = hashed_password
+                users_values.append(user_values)
+
+            insert_errors = self.user_repo.create_users_bulk(users_values)
+            for (row_number, _), insert_error in zip(valid_rows, insert_errors):
+                if insert_error:
+                    report.errors.append(UserImportError(row_number, insert_error))
+                else:
+                    report.created += 1
+
+        report.errors.sort(key=lambda error: error.row)
+        logger.info(f"Imported {report.created} users, {len(report.errors)} rows rejected")
+        return report
+
+    def _drop_duplicate_users(
+        self,
+        valid_rows: List[Tuple[int, UserCreate]],
+        report: UserImportReport
+    ) -> List[Tuple[int, UserCreate]]:
+        if not valid_rows:
+            return valid_rows
+        taken_usernames, taken_emails = self.user_repo.get_taken_identities(
+            [user_create.username for _, user_create in valid_rows],
+            [user_create.email for _, user_create in valid_rows]
+        )
+
+        unique_rows = []
+        for row_number, user_create in valid_rows:
+            if user_create.username in taken_usernames:
+                report.errors.append(UserImportError(row_number, f"Username '{user_create.username}' already exists"))
+            elif user_create.email in taken_emails:
+                report.errors.append(UserImportError(row_number, f"Email '{user_create.email}' already exists"))
+            else:
+                taken_usernames.add(user_create.username)
+                taken_emails.add(user_create.email)
+                unique_rows.append((row_number, user_create))
+        return unique_rows
+
+    def authenticate_user(self, email: str, password: str) -> Dict:
+        user = self.user_repo.get_user_by_email(email)
+        if not user or not user.is_active:
+            # Spend the same time as a real check so unknown emails can't be probed
+            pwd_context.dummy_verify()
+            raise UnauthorizedAccessError("Invalid credentials")
+
+        verified, new_hash = PasswordHasher.verify_and_update(password, user.password)
+        if not verified:
+            raise UnauthorizedAccessError("Invalid credentials")
+
+        if new_hash:
+            # Stored hash used an outdated bcrypt cost; upgrade it now that we know the password
+            user = self.user_repo.update_user(user.id, {"password": new_hash})
+            logger.info(f"Password hash upgraded for user {user.id}")
+        return user
 
     def update_user(self, user_id: int, user_data: dict) -> Dict:
         user = self.user_repo.update_user(user_id, user_data)
@@ -1,8 +1,12 @@
 import os
 import sys
 import pytest
-from sqlalchemy import create_engine
+import pytest_asyncio
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 # Add the backend directory to Python path
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +25,13 @@ def engine():
     yield engine
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(autouse=True)
+def clear_role_cache():
+    from repositories.role_repository import role_cache
+    role_cache.cache.clear()
+    yield
+    role_cache.cache.clear()
+
 @pytest.fixture(scope="function")
 def db_session(engine):
     SessionLocal = sessionmaker(bind=engine)
@@ -31,6 +42,76 @@ def db_session(engine):
         session.rollback()
         session.close()
 
+class QueryCounter:
+    """Records the SQL statements sent to the database while active"""
+    def __init__(self):
+        self.statements = []
+        self.parameters = []
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append(statement)
+            self.parameters.append(parameters)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @contextmanager
+    def record(self):
+        self.statements = []
+        self.parameters = []
+        self.active = True
+        try:
+            yield self
+        finally:
+            self.active = False
+
+@pytest.fixture
+def query_counter(engine):
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
+
+@pytest.fixture
+def query_budget(query_counter):
+    """
+    Fail the test when a block sends more statements than allowed
+
+        with query_budget(3):
+            service.get_session_details(session_id)
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        with query_counter.record() as queries:
+            yield queries
+        if queries.count > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {queries.count} queries, budget {max_queries}\n"
+                + "\n".join(queries.statements)
+            )
+    return budget
+
+@pytest_asyncio.fixture
+async def async_engine():
+    engine = create_async_engine(
+        test_settings.get_async_database_url(),
+        poolclass=StaticPool,
+        **test_settings.get_test_config()["SQLALCHEMY_CONNECT_ARGS"]
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def async_db_session(async_engine):
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    async with AsyncSessionLocal() as session:
+        yield session
+
 @pytest.fixture
 def user_service(db_session):
     from services.user_service import UserService
@@ -41,6 +122,11 @@ def session_service(db_session):
     from services.session_service import SessionService
     return SessionService(db_session)
 
+@pytest.fixture
+def analytics_service(db_session):
+    from services.analytics_service import AnalyticsService
+    return AnalyticsService(db_session)
+
 @pytest.fixture
 def task_service(db_session):
     from services.task_service import TaskService
@@ -0,0 +1,110 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from database.models import Session as StudySession, StudyTimeRollup
+from exceptions.exceptions import InvalidDataException
+from services.analytics_service import session_contributions
+
+def generate_session_data(start_time: datetime, hours: float, category: str = "math", **overrides) -> dict:
+    data = {
+        "name": f"Study {category}",
+        "created_by": 1,
+        "start_time": start_time,
+        "end_time": start_time + timedelta(hours=hours),
+        "status": "completed",
+        "category": category
+    }
+    data.update(overrides)
+    return data
+
+def rollup_rows(db_session):
+    return sorted(
+        (r.user_id, r.day, r.category, r.seconds)
+        for r in db_session.query(StudyTimeRollup).filter(StudyTimeRollup.seconds != 0)
+    )
+
+@pytest.fixture(autouse=True)
+def cleanup_database(db_session):
+    yield
+    db_session.query(StudySession).delete()
+    db_session.query(StudyTimeRollup).delete()
+    db_session.commit()
+
+def test_session_contributions_split_at_midnight():
+    start = datetime(2024, 3, 10, 23, 0, tzinfo=timezone.utc)
+    contributions = session_contributions(1, start, start + timedelta(hours=2), "completed", "math")
+
+    assert contributions == {
+        (1, date(2024, 3, 10), "math"): 3600,
+        (1, date(2024, 3, 11), "math"): 3600
+    }
+
+def test_session_contributions_converts_to_utc():
+    start = datetime(2024, 3, 11, 1, 0, tzinfo=timezone(timedelta(hours=3)))
+    contributions = session_contributions(1, start, start + timedelta(hours=1), "completed", "math")
+
+    assert contributions == {(1, date(2024, 3, 10), "math"): 3600}
+
+def test_session_contributions_skip_cancelled():
+    start = datetime(2024, 3, 10, 10, 0)
+    assert session_contributions(1, start, start + timedelta(hours=1), "cancelled", "math") == {}
+
+def test_week_and_month_reports(session_service, analytics_service):
+    session_service.create_session(generate_session_data(datetime(2024, 3, 11, 9, 0), 2))
+    session_service.create_session(generate_session_data(datetime(2024, 3, 13, 9, 0), 1, "physics"))
+    session_service.create_session(generate_session_data(datetime(2024, 3, 18, 9, 0), 1))
+
+    week = analytics_service.get_week(1, date(2024, 3, 14))
+    assert week.start_day == date(2024, 3, 11)
+    assert week.end_day == date(2024, 3, 17)
+    assert week.total_seconds == 3 * 3600
+    assert week.by_category == {"math": 7200, "physics": 3600}
+    assert week.by_day[date(2024, 3, 13)] == {"physics": 3600}
+
+    month = analytics_service.get_month(1, 2024, 3)
+    assert month.total_seconds == 4 * 3600
+    assert month.by_category == {"math": 3 * 3600, "physics": 3600}
+
+def test_invalid_ranges(analytics_service):
+    with pytest.raises(InvalidDataException):
+        analytics_service.get_range(1, date(2024, 3, 2), date(2024, 3, 1))
+    with pytest.raises(InvalidDataException):
+        analytics_service.get_month(1, 2024, 13)
+
+def test_update_and_delete_adjust_rollups(session_service, analytics_service, db_session):
+    session = session_service.create_session(generate_session_data(datetime(2024, 3, 11, 23, 0), 2))
+
+    session_service.update_session(session.id, {"category": "physics"})
+    report = analytics_service.get_range(1, date(2024, 3, 11), date(2024, 3, 12))
+    assert report.by_category == {"physics": 7200}
+
+    session_service.update_session(session.id, {"status": "cancelled"})
+    assert analytics_service.get_month(1, 2024, 3).total_seconds == 0
+
+    session_service.update_session(session.id, {"status": "completed"})
+    session_service.delete_session(session.id)
+    assert rollup_rows(db_session) == []
+
+def test_rebuild_matches_incremental_rollups(session_service, analytics_service, db_session):
+    start = datetime(2024, 3, 11, 20, 0)
+    for i in range(5):
+        session = session_service.create_session(
+            generate_session_data(start + timedelta(hours=7 * i), 3, ["math", "physics"][i % 2])
+        )
+    session_service.update_session(session.id, {"end_time": session.start_time + timedelta(hours=1)})
+    incremental = rollup_rows(db_session)
+
+    analytics_service.rebuild_rollups()
+    assert rollup_rows(db_session) == incremental
+
+def test_session_statistics(session_service, analytics_service):
+    session_service.create_session(generate_session_data(datetime(2024, 3, 11, 9, 0), 1))
+    session_service.create_session(generate_session_data(datetime(2024, 3, 12, 23, 0), 2))
+    session_service.create_session(generate_session_data(datetime(2024, 3, 13, 9, 0), 1, status="cancelled"))
+
+    statistics = analytics_service.get_session_statistics(1, today=date(2024, 3, 14))
+
+    assert statistics.session_count == 2
+    assert statistics.total_seconds == 3 * 3600
+    assert statistics.daily_seconds == [3600, 3600, 3600]
+    assert statistics.longest_streak == 3
+    assert statistics.current_streak == 3
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+import os
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import text
+from database.models import Notification, Task
+from database.models.task import TaskPriority, TaskStatus
+from exceptions.exceptions import InvalidDataException
+from services.export_service import ExportService
+
+def current_rss() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+@pytest.fixture
+def export_service(db_session):
+    return ExportService(db_session)
+
+@pytest.fixture(autouse=True)
+def cleanup_database(db_session):
+    yield
+    db_session.query(Notification).delete()
+    db_session.query(Task).delete()
+    db_session.commit()
+
+def add_tasks(db_session, user_id: int, count: int):
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        Task(
+            title=f"Task {i}",
+            priority_level=TaskPriority.HIGH,
+            task_status=TaskStatus.PENDING,
+            created_by_user_id=user_id,
+            created_at_utc=now,
+            last_updated_at_utc=now
+        )
+        for i in range(count)
+    )
+    db_session.commit()
+
+def test_export_csv(export_service, db_session):
+    add_tasks(db_session, 1, 3)
+    add_tasks(db_session, 2, 1)
+
+    rows = list(csv.DictReader(io.StringIO("".join(export_service.export_rows("tasks", 1, "csv", batch_size=2)))))
+
+    assert [row["title"] for row in rows] == ["Task 0", "Task 1", "Task 2"]
+    assert rows[0]["priority_level"] == "high"
+    assert rows[0]["description"] == ""
+
+def test_export_ndjson(export_service, db_session):
+    add_tasks(db_session, 1, 2)
+
+    lines = "".join(export_service.export_rows("tasks", 1, "ndjson")).splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert [record["title"] for record in records] == ["Task 0", "Task 1"]
+    assert records[0]["task_status"] == "pending"
+    assert records[0]["description"] is None
+    datetime.fromisoformat(records[0]["created_at_utc"])
+
+def test_export_rejects_unknown_resource_and_format(export_service):
+    with pytest.raises(InvalidDataException):
+        export_service.export_rows("users", 1, "csv")
+    with pytest.raises(InvalidDataException):
+        export_service.export_rows("tasks", 1, "xml")
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc to sample RSS")
+def test_export_million_rows_in_bounded_memory(export_service, db_session):
+    row_count = 1_000_000
+    db_session.execute(text("""
+        INSERT INTO notifications (title, message, user_id, notification_type, is_read, created_at_utc)
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :row_count)
+        SELECT 'Reminder ' || n, 'Time to study', 1, 'info', 0, '2024-01-01 00:00:00.000000' FROM seq
+    """), {"row_count": row_count})
+    db_session.commit()
+
+    lines = 0
+    exported_bytes = 0
+    baseline_rss = peak_rss = current_rss()
+    for chunk in export_service.export_rows("notifications", 1, "csv", batch_size=5000):
+        lines += chunk.count("\n")
+        exported_bytes += len(chunk)
+        peak_rss = max(peak_rss, current_rss())
+
+    assert lines == row_count + 1
+    # The export is ~70 MB; only a batch at a time may be held in memory
+    assert exported_bytes > 60 * 1024 * 1024
+    assert peak_rss - baseline_rss < 32 * 1024 * 1024
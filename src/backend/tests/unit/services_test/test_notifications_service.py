@@ -3,6 +3,8 @@ from datetime import datetime, timezone, timedelta
 from services.notification_service import NotificationService
 from exceptions import NotificationNotFoundException, InvalidDataException, UnauthorizedAccessError
 from database.models.notification import Notification, NotificationType
+from database.models.user_session import UserSession
+from database.unit_of_work import unit_of_work
 
 def generate_notification_data(suffix: str = "") -> dict:
     """Generate test notification data with unique suffix"""
@@ -122,6 +124,18 @@ class TestNotificationService:
         
         assert updated.is_read is True
 
+    def test_mark_notification_as_read_query_count(self, notification_service, query_counter):
+        """Test marking as read is one lookup and one UPDATE ... RETURNING"""
+        notification = notification_service.create_notification(
+            generate_notification_data("1"),
+            requesting_user_id=1
+        )
+
+        with query_counter.record() as queries:
+            notification_service.mark_notification_as_read(notification.id, user_id=1)
+
+        assert queries.count == 2
+
     def test_mark_notification_as_read_unauthorized(self, notification_service):
         """Test marking someone else's notification as read"""
         notification_data = generate_notification_data("1")
@@ -148,6 +162,18 @@ class TestNotificationService:
         with pytest.raises(NotificationNotFoundException):
             notification_service.delete_notification(notification.id, user_id=1)
 
+    def test_delete_notification_query_count(self, notification_service, query_counter):
+        """Test deleting is one lookup and one DELETE"""
+        notification = notification_service.create_notification(
+            generate_notification_data("1"),
+            requesting_user_id=1
+        )
+
+        with query_counter.record() as queries:
+            notification_service.delete_notification(notification.id, user_id=1)
+
+        assert queries.count == 2
+
     def test_delete_notification_unauthorized(self, notification_service):
         """Test deleting someone else's notification"""
         notification_data = generate_notification_data("1")
@@ -162,4 +188,219 @@ class TestNotificationService:
     def test_notification_not_found(self, notification_service):
         """Test handling non-existent notification"""
         with pytest.raises(NotificationNotFoundException):
-            notification_service.delete_notification(999, user_id=1)
\ No newline at end of file
+            notification_service.delete_notification(999, user_id=1)
+
+class TestNotificationPagination:
+    """Test suite for keyset-paginated notification listing"""
+
+    def create_notifications(self, notification_service, count: int) -> list:
+        base_time = datetime.now(timezone.utc)
+        created = []
+        for i in range(count):
+            notification_data = generate_notification_data(str(i))
+            notification_data["created_at_utc"] = base_time + timedelta(minutes=i)
+            created.append(
+                notification_service.create_notification(notification_data, requesting_user_id=1)
+            )
+        return created
+
+    def test_pages_are_newest_first_without_overlap(self, notification_service):
+        """Test walking every page with the returned cursors"""
+        created = self.create_notifications(notification_service, 5)
+
+        first_page = notification_service.get_user_notifications_page(user_id=1, limit=2)
+        second_page = notification_service.get_user_notifications_page(
+            user_id=1, limit=2, cursor=first_page.next_cursor
+        )
+        last_page = notification_service.get_user_notifications_page(
+            user_id=1, limit=2, cursor=second_page.next_cursor
+        )
+
+        ids = [n.id for page in (first_page, second_page, last_page) for n in page.items]
+        assert ids == [n.id for n in reversed(created)]
+        assert first_page.next_cursor is not None
+        assert last_page.next_cursor is None
+
+    def test_unread_filter_applied_in_query(self, notification_service):
+        """Test that read notifications never take up page slots"""
+        created = self.create_notifications(notification_service, 3)
+        notification_service.mark_notification_as_read(created[-1].id, user_id=1)
+
+        page = notification_service.get_user_notifications_page(user_id=1, limit=2)
+
+        assert [n.id for n in page.items] == [created[1].id, created[0].id]
+        assert page.next_cursor is None
+
+    def test_invalid_cursor(self, notification_service):
+        """Test that a malformed cursor is rejected"""
+        with pytest.raises(InvalidDataException):
+            notification_service.get_user_notifications_page(user_id=1, cursor="not-a-cursor")
+
+    def test_composite_index_declared(self):
+        """Test the listing index covers the filter and sort columns"""
+        indexes = {index.name: [c.name for c in index.columns] for index in Notification.__table__.indexes}
+        assert indexes["ix_notifications_user_read_created"] == ["user_id", "is_read", "created_at_utc"]
+
+
+class TestNotificationFanOut:
+    """Test suite for bulk notification creation"""
+
+    template = {
+        "title": "Session starting",
+        "message": "Your study session starts soon"
+    }
+
+    def test_create_notifications_bulk(self, notification_service, db_session):
+        """Test one notification is created per distinct recipient"""
+        created_ids = notification_service.create_notifications_bulk(
+            self.template,
+            [1, 2, 3, 2],
+            requesting_user_id=1
+        )
+
+        assert len(created_ids) == 3
+        notifications = db_session.query(Notification).order_by(Notification.id).all()
+        recipient_by_id = {n.id: n.user_id for n in notifications}
+        assert [recipient_by_id[notification_id] for notification_id in created_ids] == [1, 2, 3]
+        assert all(n.title == self.template["title"] and not n.is_read for n in notifications)
+
+    def test_create_notifications_bulk_invalid_template(self, notification_service, db_session):
+        """Test an invalid template is rejected before anything is inserted"""
+        with pytest.raises(InvalidDataException):
+            notification_service.create_notifications_bulk(
+                {"title": "", "message": "Test"},
+                [1, 2],
+                requesting_user_id=1
+            )
+        assert db_session.query(Notification).count() == 0
+
+    def test_notify_session_participants(self, notification_service, db_session):
+        """Test recipients are resolved through UserSession rows"""
+        joined_at = datetime.now(timezone.utc)
+        participants = [
+            UserSession(user_id=user_id, session_id=7, role="member", joined_at=joined_at)
+            for user_id in (4, 5)
+        ]
+        db_session.add_all(participants)
+        db_session.add(UserSession(user_id=6, session_id=8, role="member", joined_at=joined_at))
+        db_session.commit()
+
+        try:
+            created_ids = notification_service.notify_session_participants(
+                7, self.template, requesting_user_id=1
+            )
+
+            assert len(created_ids) == 2
+            recipients = {n.user_id for n in db_session.query(Notification).all()}
+            assert recipients == {4, 5}
+        finally:
+            db_session.query(UserSession).delete()
+            db_session.commit()
+
+
+class TestNotificationBulkRead:
+    """Test suite for set-based mark-as-read"""
+
+    def create_notifications(self, notification_service, user_id: int, count: int) -> list:
+        base_time = datetime.now(timezone.utc)
+        created = []
+        for i in range(count):
+            notification_data = generate_notification_data(str(i))
+            notification_data["user_id"] = user_id
+            notification_data["created_at_utc"] = base_time - timedelta(days=count - i)
+            created.append(
+                notification_service.create_notification(notification_data, requesting_user_id=user_id)
+            )
+        return created
+
+    def test_mark_all_read(self, notification_service):
+        """Test only the user's unread notifications are counted and updated"""
+        self.create_notifications(notification_service, user_id=1, count=3)
+        self.create_notifications(notification_service, user_id=2, count=2)
+
+        assert notification_service.mark_all_read(user_id=1) == 3
+        assert notification_service.mark_all_read(user_id=1) == 0
+        assert notification_service.get_user_notifications(user_id=1) == []
+        assert len(notification_service.get_user_notifications(user_id=2)) == 2
+
+    def test_mark_all_read_before(self, notification_service):
+        """Test the cut-off only marks older notifications"""
+        created = self.create_notifications(notification_service, user_id=1, count=3)
+
+        updated_count = notification_service.mark_all_read(
+            user_id=1,
+            before=created[-1].created_at_utc
+        )
+
+        assert updated_count == 2
+        assert [n.id for n in notification_service.get_user_notifications(user_id=1)] == [created[-1].id]
+
+    def test_mark_read_skips_other_users(self, notification_service):
+        """Test ownership is enforced by the update itself"""
+        own = self.create_notifications(notification_service, user_id=1, count=2)
+        other = self.create_notifications(notification_service, user_id=2, count=1)
+
+        updated_count = notification_service.mark_read([own[0].id, other[0].id], user_id=1)
+
+        assert updated_count == 1
+        assert own[0].is_read is True
+        assert other[0].is_read is False
+
+    def test_mark_read_empty(self, notification_service):
+        """Test an empty ID list is a no-op"""
+        assert notification_service.mark_read([], user_id=1) == 0
+
+
+class RecordingHub:
+    def __init__(self):
+        self.published = []
+
+    def publish_many(self, messages, event="notification"):
+        self.published.extend(messages)
+
+
+class TestNotificationPush:
+    """Test suite for pushing new notifications to connected clients"""
+
+    @pytest.fixture
+    def hub(self):
+        return RecordingHub()
+
+    def test_create_notification_publishes_after_commit(self, db_session, hub):
+        """Test the pushed payload matches the stored notification"""
+        service = NotificationService(db_session, hub)
+
+        notification = service.create_notification(generate_notification_data("push"), requesting_user_id=1)
+
+        assert len(hub.published) == 1
+        user_id, payload = hub.published[0]
+        assert user_id == 1
+        assert payload["id"] == notification.id
+        assert payload["title"] == "Test Notification push"
+        assert payload["notification_type"] == "info"
+        assert isinstance(payload["created_at_utc"], str)
+
+    def test_create_notifications_bulk_publishes_per_recipient(self, db_session, hub):
+        """Test every recipient gets its own notification id"""
+        service = NotificationService(db_session, hub)
+
+        created_ids = service.create_notifications_bulk(
+            {"title": "Bulk", "message": "Test"}, [3, 2], requesting_user_id=1
+        )
+
+        assert [(user_id, payload["id"]) for user_id, payload in hub.published] == list(zip([3, 2], created_ids))
+        for user_id, payload in hub.published:
+            assert db_session.get(Notification, payload["id"]).user_id == user_id
+
+    def test_nothing_published_when_transaction_rolls_back(self, db_session, hub):
+        """Test clients never see a notification that was not committed"""
+        service = NotificationService(db_session, hub)
+
+        with pytest.raises(RuntimeError):
+            with unit_of_work(db_session):
+                service.create_notification(generate_notification_data("rolled back"), requesting_user_id=1)
+                assert hub.published == []
+                raise RuntimeError("later step failed")
+
+        assert hub.published == []
+        assert db_session.query(Notification).count() == 0
@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database.connection import Base
+from database.models import Notification, Task, TaskReminder
+from database.models.task import TaskStatus
+from exceptions.exceptions import InvalidDataException
+from services.reminder_service import ReminderScheduler, ReminderService
+
+NOW = datetime(2024, 3, 11, 9, 0)
+
+@pytest.fixture
+def reminder_service(db_session):
+    return ReminderService(db_session)
+
+@pytest.fixture(autouse=True)
+def cleanup_database(db_session):
+    yield
+    db_session.query(TaskReminder).delete()
+    db_session.query(Notification).delete()
+    db_session.query(Task).delete()
+    db_session.commit()
+
+def add_task(db_session, title: str, due_in: timedelta, user_id: int = 1, status: TaskStatus = TaskStatus.PENDING) -> Task:
+    task = Task(
+        title=title,
+        due_date=NOW + due_in,
+        task_status=status,
+        created_by_user_id=user_id,
+        created_at_utc=NOW,
+        last_updated_at_utc=NOW
+    )
+    db_session.add(task)
+    return task
+
+def notification_messages(db_session):
+    return sorted((n.user_id, n.message) for n in db_session.query(Notification))
+
+def test_send_due_reminders_in_chunks(reminder_service, db_session):
+    for i in range(5):
+        add_task(db_session, f"Essay {i}", timedelta(hours=2 + i), user_id=i + 1)
+    add_task(db_session, "Done already", timedelta(hours=3), status=TaskStatus.COMPLETED)
+    add_task(db_session, "Overdue", timedelta(hours=-1))
+    add_task(db_session, "Next week", timedelta(days=7))
+    db_session.commit()
+
+    sent = reminder_service.send_due_reminders([24], now=NOW, batch_size=2)
+
+    assert sent == 5
+    assert [user_id for user_id, _ in notification_messages(db_session)] == [1, 2, 3, 4, 5]
+    assert notification_messages(db_session)[0][1] == "'Essay 0' is due at 2024-03-11 11:00 UTC"
+
+def test_send_due_reminders_is_idempotent(reminder_service, db_session):
+    add_task(db_session, "Essay", timedelta(hours=5))
+    db_session.commit()
+
+    assert reminder_service.send_due_reminders([24], now=NOW) == 1
+    assert reminder_service.send_due_reminders([24], now=NOW + timedelta(minutes=5)) == 0
+    assert db_session.query(Notification).count() == 1
+
+def test_windows_only_cover_their_band(reminder_service, db_session):
+    add_task(db_session, "Soon", timedelta(minutes=30))
+    add_task(db_session, "Tomorrow", timedelta(hours=20))
+    db_session.commit()
+
+    assert reminder_service.send_due_reminders([24, 1], now=NOW) == 2
+    reminders = sorted((r.task_id, r.window) for r in db_session.query(TaskReminder))
+    tasks = {t.title: t.id for t in db_session.query(Task)}
+    assert reminders == sorted([(tasks["Soon"], "1h"), (tasks["Tomorrow"], "24h")])
+
+    # Later the second task enters the 1h window and gets its last reminder
+    assert reminder_service.send_due_reminders([24, 1], now=NOW + timedelta(hours=19, minutes=30)) == 1
+
+def test_claimed_reminders_are_not_sent_twice(reminder_service, db_session):
+    task = add_task(db_session, "Essay", timedelta(hours=5))
+    db_session.commit()
+    # Another worker claimed the reminder between our scan and insert
+    assert reminder_service.reminder_repository.claim_reminders([task.id], "24h", NOW) == [task.id]
+    assert reminder_service.reminder_repository.claim_reminders([task.id], "24h", NOW) == []
+
+def test_invalid_windows(reminder_service):
+    with pytest.raises(InvalidDataException):
+        reminder_service.send_due_reminders([], now=NOW)
+    with pytest.raises(InvalidDataException):
+        reminder_service.send_due_reminders([0], now=NOW)
+
+def test_due_task_scan_uses_due_date_index(reminder_service, db_session, query_counter):
+    with query_counter.record() as queries:
+        reminder_service.reminder_repository.get_due_tasks_chunk("24h", NOW, NOW + timedelta(hours=24), 10, (NOW, 5))
+
+    plan = "\n".join(
+        row[-1] for row in db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {queries.statements[0]}", queries.parameters[0]
+        )
+    )
+    assert "SEARCH tasks USING INDEX ix_tasks_due_date" in plan
+    assert "SCAN tasks" not in plan
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_on_the_event_loop(tmp_path):
+    # The scheduler works on a worker thread, so it needs a database shared
+    # across threads; a file keeps its connection apart from the polling one,
+    # whose rollback on close would otherwise discard an uncommitted run
+    engine = create_engine(f"sqlite:///{tmp_path / 'reminders.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+    with session_factory() as db:
+        db.add(Task(
+            title="Essay",
+            due_date=current_time + timedelta(hours=3),
+            created_by_user_id=1,
+            created_at_utc=current_time,
+            last_updated_at_utc=current_time
+        ))
+        db.commit()
+
+    scheduler = ReminderScheduler(session_factory, [24], interval_seconds=60)
+    scheduler.start()
+    try:
+        with session_factory() as db:
+            for _ in range(200):
+                if db.query(Notification).count():
+                    break
+                await asyncio.sleep(0.01)
+        assert scheduler.running
+    finally:
+        await scheduler.stop()
+
+    assert not scheduler.running
+    with session_factory() as db:
+        assert db.query(Notification).count() == 1
+    engine.dispose()
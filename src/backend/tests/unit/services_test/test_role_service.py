@@ -4,6 +4,7 @@ from services.role_service import RoleService
 from exceptions import RoleNotFoundException, InvalidDataException, UnauthorizedAccessError
 from database.models.role import Role
 from database.models.user import User
+from repositories.role_repository import role_cache
 
 def generate_role_data(suffix: str = "") -> dict:
     current_time = datetime.now(timezone.utc)
@@ -142,4 +143,76 @@ class TestRoleService:
         update_data = {"name": "admin"}
         with pytest.raises(UnauthorizedAccessError) as exc:
             role_service.update_role(role.id, update_data, requesting_user_id=1)
-        assert "Cannot modify role to be a system role" in str(exc.value)
\ No newline at end of file
+        assert "Cannot modify role to be a system role" in str(exc.value)
+
+    def test_update_role_query_count(self, role_service, query_counter):
+        role = role_service.create_role(generate_role_data("5"), requesting_user_id=1)
+
+        with query_counter.record() as queries:
+            role_service.update_role(role.id, {"description": "Updated"}, requesting_user_id=1)
+
+        assert queries.count == 2
+
+    def test_delete_role_query_count(self, role_service, query_counter):
+        role = role_service.create_role(generate_role_data("6"), requesting_user_id=1)
+
+        with query_counter.record() as queries:
+            role_service.delete_role(role.id, requesting_user_id=1)
+
+        # Lookup, loading role.users to detach them, then the DELETE
+        assert queries.count == 3
+
+    def test_get_role_is_cached(self, role_service, query_counter):
+        role = role_service.create_role(generate_role_data("7"), requesting_user_id=1)
+        role_service.get_role(role.id, requesting_user_id=1)
+
+        with query_counter.record() as queries:
+            cached_role = role_service.get_role(role.id, requesting_user_id=1)
+
+        assert queries.count == 0
+        assert cached_role.permissions == frozenset(["read", "write"])
+        assert role_cache.stats()["hits"] >= 1
+        with pytest.raises(AttributeError):
+            cached_role.name = "changed"
+
+    def test_update_role_invalidates_cache(self, role_service):
+        role = role_service.create_role(generate_role_data("8"), requesting_user_id=1)
+        role_service.get_role(role.id, requesting_user_id=1)
+
+        role_service.update_role(role.id, {"name": "renamed_role"}, requesting_user_id=1)
+
+        assert role_service.get_role(role.id, requesting_user_id=1).name == "renamed_role"
+
+    def test_delete_role_invalidates_cache(self, role_service):
+        role = role_service.create_role(generate_role_data("9"), requesting_user_id=1)
+        role_id = role.id
+        role_service.get_role(role_id, requesting_user_id=1)
+
+        role_service.delete_role(role_id, requesting_user_id=1)
+
+        with pytest.raises(RoleNotFoundException):
+            role_service.get_role(role_id, requesting_user_id=1)
+
+class TestVerifyAdminAccess:
+    def test_admin_user_allowed(self, db_session, admin_user):
+        RoleService(db_session)._verify_admin_access(admin_user.id)
+
+    def test_user_without_admin_permission_rejected(self, db_session, admin_user, admin_role):
+        admin_role.permissions = ["read"]
+        db_session.commit()
+
+        with pytest.raises(UnauthorizedAccessError):
+            RoleService(db_session)._verify_admin_access(admin_user.id)
+
+    def test_unknown_user_rejected(self, db_session):
+        with pytest.raises(UnauthorizedAccessError):
+            RoleService(db_session)._verify_admin_access(999)
+
+    def test_create_role_requires_admin(self, db_session, admin_user):
+        service = RoleService(db_session)
+
+        created_role = service.create_role(generate_role_data("admin_check"), requesting_user_id=admin_user.id)
+        assert created_role.name == "test_role_admin_check"
+
+        with pytest.raises(UnauthorizedAccessError):
+            service.create_role(generate_role_data("no_admin"), requesting_user_id=999)
\ No newline at end of file
@@ -1,7 +1,9 @@
 import pytest
 from services.session_service import SessionService
 from exceptions.exceptions import SessionNotFoundException, InvalidDataException
-from database.models import Session as StudySession
+import io
+import json
+from database.models import Session as StudySession, StudyTimeRollup, Task, User, UserSession, Notification
 from datetime import datetime, timezone, timedelta
 
 def generate_session_data(suffix: str = "") -> dict:
@@ -20,6 +22,7 @@ def generate_session_data(suffix: str = "") -> dict:
 def cleanup_database(db_session):
     yield
     db_session.query(StudySession).delete()
+    db_session.query(StudyTimeRollup).delete()
     db_session.commit()
 
 def test_create_session(session_service):
@@ -85,4 +88,171 @@ def test_get_session_not_found(session_service):
 
 def test_update_session_not_found(session_service):
     with pytest.raises(SessionNotFoundException):
-        session_service.update_session(999, {"name": "Test"})
\ No newline at end of file
+        session_service.update_session(999, {"name": "Test"})
+
+def test_update_session_query_count(session_service, query_counter):
+    session_id = session_service.create_session(generate_session_data("5")).id
+
+    with query_counter.record() as queries:
+        session_service.update_session(session_id, {"name": "Renamed Session"})
+
+    assert queries.count == 1
+
+def test_update_session_rollup_fields_query_count(session_service, query_counter):
+    created_session = session_service.create_session(generate_session_data("5"))
+    session_id = created_session.id
+
+    with query_counter.record() as queries:
+        session_service.update_session(session_id, {"category": "physics"})
+
+    # load old row, UPDATE ... RETURNING, rollup upsert
+    assert queries.count == 3
+
+def test_create_session_with_participants(session_service, db_session):
+    notification_data = {"title": "Session starting", "message": "Join now"}
+
+    session = session_service.create_session_with_participants(
+        generate_session_data("6"),
+        [2, 3],
+        notification_data
+    )
+
+    try:
+        participants = db_session.query(UserSession).filter(UserSession.session_id == session.id).all()
+        assert sorted(p.user_id for p in participants) == [2, 3]
+        assert sorted(n.user_id for n in db_session.query(Notification).all()) == [2, 3]
+    finally:
+        db_session.query(UserSession).delete()
+        db_session.query(Notification).delete()
+        db_session.commit()
+
+def test_create_session_with_participants_is_atomic(session_service, db_session):
+    with pytest.raises(InvalidDataException):
+        session_service.create_session_with_participants(
+            generate_session_data("7"),
+            [2, 3],
+            {"title": "", "message": "Invalid title"}
+        )
+
+    assert db_session.query(StudySession).count() == 0
+    assert db_session.query(UserSession).count() == 0
+
+@pytest.fixture
+def importing_user(db_session):
+    current_time = datetime.now(timezone.utc)
+    user = User(
+        username="importer",
+        email="importer@test.com",
+        password="hashed_password",
+        created_at=current_time,
+        updated_at=current_time
+    )
+    db_session.add(user)
+    db_session.commit()
+    yield user
+    db_session.query(User).delete()
+    db_session.commit()
+
+def test_import_sessions_csv(session_service, importing_user, db_session):
+    stream = io.StringIO(
+        "name,created_by,start_time,end_time,status,category\n"
+        f"Algebra,{importing_user.id},2024-03-10T23:00:00,2024-03-11T01:00:00,completed,math\n"
+        f"Bad times,{importing_user.id},2024-03-11T10:00:00,2024-03-11T09:00:00,completed,math\n"
+        f"Optics,{importing_user.id},2024-03-11T10:00:00,2024-03-11T11:00:00,,physics\n"
+        "Nobody,999,2024-03-11T10:00:00,2024-03-11T11:00:00,completed,math\n"
+    )
+
+    report = session_service.import_sessions_file(stream, "csv", chunk_size=2)
+
+    assert report.created == 2
+    assert [error.row for error in report.errors] == [1, 3]
+    assert report.errors[1].message == "User not found"
+    imported = db_session.query(StudySession).order_by(StudySession.id).all()
+    assert [(s.name, s.status) for s in imported] == [("Algebra", "completed"), ("Optics", "pending")]
+    rollups = sorted((r.day.isoformat(), r.category, r.seconds) for r in db_session.query(StudyTimeRollup))
+    assert rollups == [("2024-03-10", "math", 3600), ("2024-03-11", "math", 3600), ("2024-03-11", "physics", 3600)]
+
+def test_import_sessions_ndjson(session_service, importing_user, db_session):
+    record = {
+        "name": "History",
+        "created_by": importing_user.id,
+        "start_time": "2024-03-11T12:00:00+02:00",
+        "end_time": "2024-03-11T13:00:00+02:00",
+        "status": "completed"
+    }
+    stream = io.StringIO(json.dumps(record) + "\n\n{not json\n[1, 2]\n")
+
+    report = session_service.import_sessions_file(stream, "ndjson")
+
+    assert report.created == 1
+    assert [(error.row, error.message) for error in report.errors] == [
+        (1, "Row is not a mapping"),
+        (2, "Row is not a mapping")
+    ]
+    imported = db_session.query(StudySession).one()
+    assert imported.start_time == datetime(2024, 3, 11, 10, 0)
+    assert imported.category == "general"
+
+def test_import_sessions_unsupported_format(session_service):
+    with pytest.raises(InvalidDataException):
+        session_service.import_sessions_file(io.StringIO(""), "xml")
+
+@pytest.fixture
+def session_with_details(session_service, db_session):
+    current_time = datetime.now(timezone.utc)
+    users = [
+        User(username=f"student{i}", email=f"student{i}@test.com", password="hashed_password",
+             created_at=current_time, updated_at=current_time)
+        for i in range(3)
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+
+    session_data = generate_session_data("details")
+    session_data["created_by"] = users[0].id
+    session = session_service.create_session(session_data)
+    db_session.add_all(
+        Task(session_id=session.id, title=f"Task {i}", created_by_user_id=users[0].id,
+             created_at_utc=current_time, last_updated_at_utc=current_time)
+        for i in range(3)
+    )
+    db_session.add_all(
+        UserSession(user_id=user.id, session_id=session.id, role="participant", joined_at=current_time)
+        for user in users[1:]
+    )
+    db_session.commit()
+    session_id = session.id
+    # Start from an empty identity map so nothing is already loaded
+    db_session.expunge_all()
+    yield session_id
+    db_session.query(UserSession).delete()
+    db_session.query(Task).delete()
+    db_session.query(StudySession).delete()
+    db_session.query(User).delete()
+    db_session.commit()
+
+def render_session(session) -> dict:
+    return {
+        "creator": session.created_by_user.username,
+        "tasks": [task.title for task in session.tasks],
+        "participants": sorted(participant.user.username for participant in session.user_sessions)
+    }
+
+def test_get_session_details_within_query_budget(session_service, session_with_details, query_budget):
+    with query_budget(3):
+        rendered = render_session(session_service.get_session_details(session_with_details))
+
+    assert rendered == {
+        "creator": "student0",
+        "tasks": ["Task 0", "Task 1", "Task 2"],
+        "participants": ["student1", "student2"]
+    }
+
+def test_lazy_loading_exceeds_query_budget(session_service, session_with_details, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="Query budget exceeded"):
+        with query_budget(3):
+            render_session(session_service.get_session(session_with_details))
+
+def test_get_session_details_not_found(session_service):
+    with pytest.raises(SessionNotFoundException):
+        session_service.get_session_details(999)
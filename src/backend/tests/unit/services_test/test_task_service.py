@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from exceptions import TaskNotFoundException, InvalidDataException, UnauthorizedAccessError
 from database.models import Task
+from database.models.task import TaskPriority, TaskStatus
 
 def generate_task_data(suffix: str = "") -> dict:
     """Generate test task data with unique suffix"""
@@ -125,4 +126,115 @@ def test_delete_task_unauthorized(task_service):
     created_task = task_service.create_new_task(task_data, requesting_user_id=1)
     
     with pytest.raises(UnauthorizedAccessError):
-        task_service.delete_task_by_id(created_task.id, requesting_user_id=2)
\ No newline at end of file
+        task_service.delete_task_by_id(created_task.id, requesting_user_id=2)
+
+def test_update_task_query_count(task_service, query_counter):
+    """Test updating reuses the task loaded for the access check"""
+    created_task = task_service.create_new_task(generate_task_data("8"), requesting_user_id=1)
+
+    with query_counter.record() as queries:
+        task_service.update_existing_task(created_task.id, {"title": "Renamed"}, requesting_user_id=1)
+
+    assert queries.count == 2
+
+def test_delete_task_query_count(task_service, query_counter):
+    """Test deleting issues one lookup and one DELETE"""
+    created_task = task_service.create_new_task(generate_task_data("9"), requesting_user_id=1)
+
+    with query_counter.record() as queries:
+        task_service.delete_task_by_id(created_task.id, requesting_user_id=1)
+
+    assert queries.count == 2
+
+def add_task(db_session, title: str, **overrides) -> Task:
+    current_time = datetime.now(timezone.utc)
+    task_data = {
+        "title": title,
+        "created_by_user_id": 1,
+        "created_at_utc": current_time,
+        "last_updated_at_utc": current_time
+    }
+    task_data.update(overrides)
+    task = Task(**task_data)
+    db_session.add(task)
+    return task
+
+def explain(db_session, statement: str, parameters) -> str:
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return "\n".join(row[-1] for row in rows)
+
+def test_list_user_tasks_due_this_week(task_service, db_session):
+    now = datetime(2024, 3, 11, 9, 0)
+    add_task(db_session, "Essay", due_date=now + timedelta(days=2), task_status=TaskStatus.PENDING)
+    add_task(db_session, "Lab report", due_date=now + timedelta(days=1), task_status=TaskStatus.IN_PROGRESS)
+    add_task(db_session, "Reading", due_date=now + timedelta(days=3), task_status=TaskStatus.COMPLETED)
+    add_task(db_session, "Project", due_date=now + timedelta(days=10), task_status=TaskStatus.PENDING)
+    add_task(db_session, "Someone else's", due_date=now + timedelta(days=1), created_by_user_id=2)
+    db_session.commit()
+
+    page = task_service.list_user_tasks(
+        1,
+        statuses=["pending", "in_progress"],
+        due_after=now,
+        due_before=now + timedelta(days=7)
+    )
+
+    assert [task.title for task in page.items] == ["Lab report", "Essay"]
+    assert page.next_cursor is None
+
+def test_list_user_tasks_paginates_with_undated_tasks_last(task_service, db_session):
+    now = datetime(2024, 3, 11, 9, 0)
+    for i in range(3):
+        add_task(db_session, f"Dated {i}", due_date=now + timedelta(days=3 - i))
+        add_task(db_session, f"Undated {i}")
+    db_session.commit()
+
+    titles, cursor = [], None
+    while True:
+        page = task_service.list_user_tasks(1, limit=2, cursor=cursor)
+        titles.extend(task.title for task in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert titles == ["Dated 2", "Dated 1", "Dated 0", "Undated 0", "Undated 1", "Undated 2"]
+
+def test_list_session_tasks_by_priority(task_service, db_session):
+    for i, priority in enumerate([TaskPriority.LOW, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.HIGH]):
+        add_task(db_session, f"Task {i}", session_id=7, priority_level=priority)
+    add_task(db_session, "Other session", session_id=8, priority_level=TaskPriority.HIGH)
+    db_session.commit()
+
+    first_page = task_service.list_session_tasks(7, limit=3)
+    second_page = task_service.list_session_tasks(7, limit=3, cursor=first_page.next_cursor)
+    only_high = task_service.list_session_tasks(7, priorities=["HIGH"])
+
+    assert [task.title for task in first_page.items] == ["Task 1", "Task 3", "Task 2"]
+    assert [task.title for task in second_page.items] == ["Task 0"]
+    assert second_page.next_cursor is None
+    assert [task.title for task in only_high.items] == ["Task 1", "Task 3"]
+
+def test_list_tasks_invalid_arguments(task_service):
+    with pytest.raises(InvalidDataException):
+        task_service.list_user_tasks(1, statuses=["archived"])
+    with pytest.raises(InvalidDataException):
+        task_service.list_session_tasks(1, limit=0)
+    with pytest.raises(InvalidDataException):
+        task_service.list_session_tasks(1, cursor="not-a-cursor")
+
+def test_user_task_listing_uses_owner_status_due_index(task_service, db_session, query_counter):
+    now = datetime(2024, 3, 11, 9, 0)
+    with query_counter.record() as queries:
+        task_service.list_user_tasks(1, statuses=["pending"], due_after=now, due_before=now + timedelta(days=7))
+
+    plan = explain(db_session, queries.statements[0], queries.parameters[0])
+    assert "USING INDEX ix_tasks_owner_status_due" in plan
+    assert "SCAN tasks" not in plan
+
+def test_session_task_listing_uses_session_priority_index(task_service, db_session, query_counter):
+    with query_counter.record() as queries:
+        task_service.list_session_tasks(7, priorities=["high", "medium"])
+
+    plan = explain(db_session, queries.statements[0], queries.parameters[0])
+    assert "USING INDEX ix_tasks_session_priority" in plan
+    assert "SCAN tasks" not in plan
@@ -0,0 +1,180 @@
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import sessionmaker
+from database.models import Session as StudySession
+from exceptions.exceptions import InvalidDataException, SessionNotFoundException
+from repositories.session_repository import SessionRepository
+from services.timer_service import TimerRecord, TimerService, TimerState
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 3, 11, 9, 0)
+        self.monotonic = 0.0
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+        self.monotonic += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+@pytest.fixture
+def timer_service(session_factory, clock):
+    return TimerService(session_factory, flush_interval=5.0, clock=lambda: clock.now, monotonic=lambda: clock.monotonic)
+
+@pytest.fixture
+def session_id(session_service, db_session):
+    start_time = datetime.now(timezone.utc)
+    session = session_service.create_session({
+        "name": "Pomodoro",
+        "created_by": 1,
+        "start_time": start_time,
+        "end_time": start_time + timedelta(minutes=25)
+    })
+    yield session.id
+    db_session.query(StudySession).delete()
+    db_session.commit()
+
+def persisted_timer(db_session, session_id: int) -> tuple:
+    db_session.expire_all()
+    session = db_session.get(StudySession, session_id)
+    return session.timer_state, session.timer_elapsed_seconds, session.timer_started_at
+
+def test_timer_record_uses_slots():
+    record = TimerRecord(1)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.label = "focus"
+
+def test_start_pause_resume_reset(timer_service, session_id, clock):
+    assert timer_service.start(session_id).state is TimerState.RUNNING
+    clock.advance(1)
+    assert timer_service.get(session_id).elapsed_seconds == 1
+    clock.advance(1)
+    assert timer_service.pause(session_id).elapsed_seconds == 2
+    clock.advance(3)
+    assert timer_service.get(session_id).elapsed_seconds == 2
+    timer_service.resume(session_id)
+    clock.advance(1)
+    assert timer_service.get(session_id).elapsed_seconds == 3
+
+    snapshot = timer_service.reset(session_id)
+    assert (snapshot.state, snapshot.elapsed_seconds) == (TimerState.IDLE, 0)
+
+def test_invalid_transitions(timer_service, session_id):
+    with pytest.raises(InvalidDataException):
+        timer_service.pause(session_id)
+    with pytest.raises(InvalidDataException):
+        timer_service.resume(session_id)
+    timer_service.start(session_id)
+    with pytest.raises(InvalidDataException):
+        timer_service.start(session_id)
+
+def test_unknown_session(timer_service):
+    with pytest.raises(SessionNotFoundException):
+        timer_service.start(999)
+
+def test_transitions_are_flushed_in_one_statement_per_interval(
+    timer_service, session_service, session_id, clock, db_session, query_counter
+):
+    other_session_id = session_service.create_session({
+        "name": "Reading",
+        "created_by": 1,
+        "start_time": datetime.now(timezone.utc),
+        "end_time": datetime.now(timezone.utc) + timedelta(minutes=25)
+    }).id
+    timer_service.get(session_id)
+    timer_service.get(other_session_id)
+
+    with query_counter.record() as queries:
+        timer_service.start(session_id)
+        clock.advance(1)
+        timer_service.pause(session_id)
+        timer_service.start(other_session_id)
+    assert queries.count == 0
+
+    clock.advance(5)
+    with query_counter.record() as queries:
+        timer_service.resume(session_id)
+    assert queries.count == 1
+    assert persisted_timer(db_session, session_id) == ("running", 1.0, clock.now)
+    assert persisted_timer(db_session, other_session_id)[0] == "running"
+
+def test_rehydrates_after_restart(timer_service, session_factory, session_id, clock):
+    timer_service.start(session_id)
+    clock.advance(90)
+    timer_service.flush()
+
+    clock.advance(30)
+    restarted = TimerService(session_factory, clock=lambda: clock.now, monotonic=lambda: clock.monotonic)
+    snapshot = restarted.get(session_id)
+
+    assert snapshot.state is TimerState.RUNNING
+    assert snapshot.elapsed_seconds == 120
+    assert restarted.pause(session_id).elapsed_seconds == 120
+
+def test_flush_drops_idle_timers_from_memory(timer_service, session_id, db_session):
+    timer_service.start(session_id)
+    timer_service.reset(session_id)
+
+    assert timer_service.flush() == 1
+    assert timer_service.flush() == 0
+    assert session_id not in timer_service._timers
+    assert persisted_timer(db_session, session_id) == ("idle", 0.0, None)
+
+def test_flushes_never_overlap(timer_service, session_id, monkeypatch):
+    writes = []
+    writing = threading.Lock()
+    overlapped = []
+
+    def slow_save(repository, timer_states):
+        if not writing.acquire(blocking=False):
+            overlapped.append(timer_states)
+            return
+        try:
+            time.sleep(0.05)
+            writes.append([timer_state["timer_state"] for timer_state in timer_states])
+        finally:
+            writing.release()
+
+    monkeypatch.setattr(SessionRepository, "save_timer_states", slow_save)
+    timer_service.start(session_id)
+    first = threading.Thread(target=timer_service.flush)
+    first.start()
+    time.sleep(0.01)
+    timer_service.pause(session_id)
+    second = threading.Thread(target=timer_service.flush)
+    second.start()
+    first.join()
+    second.join()
+
+    assert overlapped == []
+    assert writes == [["running"], ["paused"]]
+
+def test_rehydration_does_not_block_other_timers(timer_service, session_id, monkeypatch):
+    timer_service.get(session_id)
+    reading = threading.Event()
+    release = threading.Event()
+
+    def slow_read(repository, other_session_id):
+        reading.set()
+        release.wait(5)
+        return ("idle", 0.0, None)
+
+    monkeypatch.setattr(SessionRepository, "get_timer_state", slow_read)
+    rehydrating = threading.Thread(target=timer_service.get, args=(session_id + 1,))
+    rehydrating.start()
+    try:
+        assert reading.wait(5)
+        assert timer_service.start(session_id).state is TimerState.RUNNING
+    finally:
+        release.set()
+        rehydrating.join()
+    assert timer_service.get(session_id + 1).state is TimerState.IDLE
@@ -1,7 +1,10 @@
 import pytest
+from datetime import datetime, timezone
 from services.user_service import UserService
-from exceptions.exceptions import UserNotFoundException, InvalidDataException
-from database.models import User
+from exceptions.exceptions import UserNotFoundException, InvalidDataException, UnauthorizedAccessError
+import utils.hashing as hashing
+from utils.hashing import PasswordHasher, PasswordHashingPool, configure_bcrypt_rounds, get_bcrypt_rounds, pwd_context
+from database.models import Notification, Role, Session as StudySession, Task, User
 
 def generate_unique_user_data(email_suffix: str = "") -> dict:
     return {
@@ -16,8 +19,23 @@ def generate_unique_user_data(email_suffix: str = "") -> dict:
 def cleanup_database(db_session):
     yield
     db_session.query(User).delete()
+    db_session.query(Role).delete()
     db_session.commit()
 
+@pytest.fixture(autouse=True)
+def fast_password_hashing():
+    original_rounds = get_bcrypt_rounds()
+    configure_bcrypt_rounds(4)
+    yield
+    configure_bcrypt_rounds(original_rounds)
+
+@pytest.fixture(autouse=True)
+def user_role(db_session):
+    role = Role(name="user", description="Regular user", permissions=["read"])
+    db_session.add(role)
+    db_session.commit()
+    return role
+
 def test_create_user(user_service):
     user_data = generate_unique_user_data("1")
     user = user_service.create_user(user_data)
@@ -25,7 +43,17 @@ def test_create_user(user_service):
     assert user is not None
     assert user.email == user_data["email"]
     assert user.username == user_data["username"]
-    assert user.role == user_data["role"]
+    assert user.role.name == user_data["role"]
+    assert user.password != user_data["password"]
+    assert PasswordHasher.verify_password(user_data["password"], user.password)
+
+def test_create_user_unknown_role(user_service):
+    user_data = generate_unique_user_data("6")
+    user_data["role"] = "missing"
+
+    user = user_service.create_user(user_data)
+
+    assert user.role_id is None
 
 def test_get_user(user_service):
     user_data = generate_unique_user_data("2")
@@ -36,7 +64,7 @@ def test_get_user(user_service):
     assert user is not None
     assert user.email == user_data["email"]
     assert user.username == user_data["username"]
-    assert user.role == user_data["role"]
+    assert user.role.name == user_data["role"]
     assert user.is_active == user_data["is_active"]
 
 def test_create_user_invalid_data(user_service):
@@ -71,4 +99,136 @@ def test_delete_user(user_service):
     assert result is True
     
     with pytest.raises(UserNotFoundException):
-        user_service.get_user(created_user.id)
\ No newline at end of file
+        user_service.get_user(created_user.id)
+
+def test_update_user_query_count(user_service, db_session, query_counter):
+    current_time = datetime.now(timezone.utc)
+    created_user = User(
+        username="testuser5",
+        email="test5@example.com",
+        password="hashed_password",
+        created_at=current_time,
+        updated_at=current_time
+    )
+    db_session.add(created_user)
+    db_session.commit()
+    user_id = created_user.id
+
+    with query_counter.record() as queries:
+        user_service.update_user(user_id, {"email": "updated5@example.com"})
+
+    assert queries.count == 1
+
+@pytest.fixture
+def stored_user(db_session):
+    current_time = datetime.now(timezone.utc)
+    user = User(
+        username="loginuser",
+        email="login@example.com",
+        password=pwd_context.hash("testPassword123!", rounds=4),
+        created_at=current_time,
+        updated_at=current_time
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+def test_authenticate_user_upgrades_outdated_hash(user_service, stored_user, db_session):
+    configure_bcrypt_rounds(5)
+
+    user = user_service.authenticate_user("login@example.com", "testPassword123!")
+
+    assert user.id == stored_user.id
+    db_session.expire_all()
+    assert db_session.get(User, user.id).password.startswith("$2b$05$")
+
+def test_authenticate_user_keeps_current_hash(user_service, stored_user, query_counter):
+    configure_bcrypt_rounds(4)
+
+    with query_counter.record() as queries:
+        user_service.authenticate_user("login@example.com", "testPassword123!")
+
+    assert queries.count == 1
+
+def test_authenticate_user_invalid_credentials(user_service, stored_user):
+    with pytest.raises(UnauthorizedAccessError):
+        user_service.authenticate_user("login@example.com", "wrongPassword123!")
+    with pytest.raises(UnauthorizedAccessError):
+        user_service.authenticate_user("unknown@example.com", "testPassword123!")
+
+
+class TestImportUsers:
+    @pytest.fixture(autouse=True)
+    def hashing_pool(self, monkeypatch):
+        pool = PasswordHashingPool(max_workers=2)
+        monkeypatch.setattr(hashing, "_hashing_pool", pool)
+        yield pool
+        pool.shutdown()
+
+    def test_import_users(self, user_service, db_session, user_role):
+        rows = (generate_unique_user_data(f"import{i}") for i in range(5))
+
+        report = user_service.import_users(rows, chunk_size=2)
+
+        assert report.created == 5
+        assert report.errors == []
+        users = db_session.query(User).order_by(User.username).all()
+        assert [u.username for u in users] == [f"testuserimport{i}" for i in range(5)]
+        assert all(u.role_id == user_role.id for u in users)
+        assert PasswordHasher.verify_password("testPassword123!", users[0].password)
+
+    def test_import_users_reports_row_errors(self, user_service, db_session):
+        user_service.create_user(generate_unique_user_data("existing"))
+        rows = [
+            generate_unique_user_data("a"),
+            {**generate_unique_user_data("b"), "email": "invalid-email"},
+            generate_unique_user_data("existing"),
+            generate_unique_user_data("a"),
+            generate_unique_user_data("c")
+        ]
+
+        report = user_service.import_users(rows, chunk_size=10)
+
+        assert report.created == 2
+        assert [error.row for error in report.errors] == [1, 2, 3]
+        assert "already exists" in report.errors[1].message
+        assert db_session.query(User).count() == 3
+
+def test_get_user_dashboard_within_query_budget(user_service, db_session, query_budget):
+    user_id = user_service.create_user(generate_unique_user_data("dashboard")).id
+    current_time = datetime.now(timezone.utc)
+    for i in range(3):
+        db_session.add(StudySession(
+            name=f"Session {i}", created_by=user_id, start_time=current_time, end_time=current_time,
+            status="completed", created_at=current_time, updated_at=current_time
+        ))
+        db_session.add(Task(
+            title=f"Task {i}", created_by_user_id=user_id,
+            created_at_utc=current_time, last_updated_at_utc=current_time
+        ))
+        db_session.add(Notification(
+            title=f"Note {i}", message="Study", user_id=user_id, created_at_utc=current_time
+        ))
+    db_session.commit()
+    db_session.expunge_all()
+
+    try:
+        with query_budget(5):
+            user = user_service.get_user_dashboard(user_id)
+            rendered = (
+                user.role.name,
+                len(user.sessions),
+                len(user.tasks),
+                len(user.notifications),
+                len(user.user_sessions)
+            )
+        assert rendered == ("user", 3, 3, 3, 0)
+    finally:
+        db_session.query(Notification).delete()
+        db_session.query(Task).delete()
+        db_session.query(StudySession).delete()
+        db_session.commit()
+
+def test_get_user_dashboard_not_found(user_service):
+    with pytest.raises(UserNotFoundException):
+        user_service.get_user_dashboard(999)
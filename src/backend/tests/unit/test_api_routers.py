@@ -0,0 +1,204 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from core.dependencies import RequestServices, get_session_factory
+from database.connection import Base
+from database.models import Notification, Task, User
+from main import app
+from services.session_service import SessionService
+from services.timer_service import TimerService, get_timer_service
+
+class CountingSessionFactory:
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.sessions_opened = 0
+
+    def __call__(self):
+        self.sessions_opened += 1
+        return self.session_factory()
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    current_time = datetime(2024, 1, 1)
+    with sessionmaker(bind=engine)() as db:
+        db.add_all(
+            User(username=f"user{i}", email=f"user{i}@test.com", password="hashed_password",
+                 created_at=current_time, updated_at=current_time)
+            for i in (1, 2)
+        )
+        db.commit()
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(engine):
+    return CountingSessionFactory(sessionmaker(bind=engine))
+
+@pytest.fixture
+def checkouts(engine):
+    counts = []
+    listener = lambda *args: counts.append(1)
+    event.listen(engine, "checkout", listener)
+    yield counts
+    event.remove(engine, "checkout", listener)
+
+@pytest.fixture
+def client(session_factory):
+    timer_service = TimerService(session_factory, flush_interval=3600)
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_timer_service] = lambda: timer_service
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+def as_user(user_id: int) -> dict:
+    return {"X-User-Id": str(user_id)}
+
+def session_payload() -> dict:
+    start_time = datetime.now(timezone.utc)
+    return {
+        "name": "Calculus",
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(hours=1)).isoformat(),
+        "category": "math"
+    }
+
+class TestRequestServices:
+    def test_session_opened_lazily_and_shared(self, session_factory):
+        services = RequestServices(session_factory)
+        assert session_factory.sessions_opened == 0
+
+        task_service = services.tasks
+        assert services.tasks is task_service
+        assert services.sessions.db is task_service.database_session
+        assert isinstance(services.get(SessionService), SessionService)
+        assert session_factory.sessions_opened == 1
+
+        services.close()
+        assert not services.opened
+
+    def test_unused_container_never_opens_a_session(self, session_factory):
+        services = RequestServices(session_factory)
+        services.close()
+
+        assert session_factory.sessions_opened == 0
+
+class TestRouters:
+    def test_session_crud(self, client):
+        created = client.post("/api/v1/sessions", json=session_payload(), headers=as_user(1))
+        assert created.status_code == 201
+        session_id = created.json()["id"]
+        assert created.json()["created_by"] == 1
+
+        assert client.get(f"/api/v1/sessions/{session_id}").json()["name"] == "Calculus"
+        renamed = client.patch(f"/api/v1/sessions/{session_id}", json={"name": "Algebra"}, headers=as_user(1))
+        assert renamed.json()["name"] == "Algebra"
+        assert client.patch(f"/api/v1/sessions/{session_id}", json={"name": "Mine"}, headers=as_user(2)).status_code == 403
+        assert client.delete(f"/api/v1/sessions/{session_id}", headers=as_user(1)).status_code == 204
+        assert client.get(f"/api/v1/sessions/{session_id}").status_code == 404
+
+    def test_one_session_per_request(self, client, session_factory):
+        session_id = client.post("/api/v1/sessions", json=session_payload(), headers=as_user(1)).json()["id"]
+        session_factory.sessions_opened = 0
+
+        # Ownership check and update go through two services' dependencies
+        client.patch(f"/api/v1/sessions/{session_id}", json={"name": "Algebra"}, headers=as_user(1))
+
+        assert session_factory.sessions_opened == 1
+
+    def test_routes_without_queries_take_no_connection(self, client, session_factory, checkouts):
+        response = client.get("/api/v1/tasks", params={"cursor": "not-a-cursor"}, headers=as_user(1))
+
+        assert response.status_code == 400
+        assert session_factory.sessions_opened == 1
+        assert checkouts == []
+
+        client.get("/api/v1/health")
+        assert session_factory.sessions_opened == 1
+
+    def test_server_timing_reports_database_time(self, client):
+        client.post("/api/v1/tasks", json={"title": "Read", "description": "Chapter 1"}, headers=as_user(1))
+
+        response = client.get("/api/v1/tasks", headers=as_user(1))
+
+        assert response.json()["items"][0]["title"] == "Read"
+        db_timing, app_timing = response.headers["server-timing"].split(", ")
+        assert db_timing.startswith("db;dur=") and db_timing.endswith('desc="1 queries"')
+        assert app_timing.startswith("app;dur=")
+        assert client.get("/api/v1/health").headers["server-timing"].startswith('db;dur=0.00;desc="0 queries"')
+
+    def test_task_routes_enforce_ownership(self, client):
+        task_id = client.post(
+            "/api/v1/tasks", json={"title": "Read", "description": "Chapter 1"}, headers=as_user(1)
+        ).json()["id"]
+
+        assert client.get(f"/api/v1/tasks/{task_id}", headers=as_user(1)).json()["task_status"] == "pending"
+        assert client.get(f"/api/v1/tasks/{task_id}", headers=as_user(2)).status_code == 403
+        assert client.get("/api/v1/tasks/999", headers=as_user(1)).status_code == 404
+        assert client.get(f"/api/v1/tasks/{task_id}").status_code == 401
+        assert client.delete(f"/api/v1/tasks/{task_id}", headers=as_user(1)).status_code == 204
+
+    def test_session_tasks_page(self, client, engine):
+        session_id = client.post("/api/v1/sessions", json=session_payload(), headers=as_user(1)).json()["id"]
+        current_time = datetime(2024, 1, 1)
+        with sessionmaker(bind=engine)() as db:
+            db.add_all(
+                Task(session_id=session_id, title=f"Task {i}", created_by_user_id=1,
+                     created_at_utc=current_time, last_updated_at_utc=current_time)
+                for i in range(3)
+            )
+            db.commit()
+
+        first = client.get(f"/api/v1/sessions/{session_id}/tasks", params={"limit": 2}).json()
+        second = client.get(
+            f"/api/v1/sessions/{session_id}/tasks", params={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [task["title"] for task in first["items"] + second["items"]] == ["Task 0", "Task 1", "Task 2"]
+        assert second["next_cursor"] is None
+
+    def test_timer_routes(self, client):
+        session_id = client.post("/api/v1/sessions", json=session_payload(), headers=as_user(1)).json()["id"]
+        timer = f"/api/v1/sessions/{session_id}/timer"
+
+        assert client.post(f"{timer}/start", headers=as_user(1)).json()["state"] == "running"
+        assert client.post(f"{timer}/start", headers=as_user(1)).status_code == 400
+        assert client.post(f"{timer}/stop", headers=as_user(1)).status_code == 400
+        assert client.post(f"{timer}/pause", headers=as_user(1)).json()["state"] == "paused"
+        assert client.get(timer, headers=as_user(1)).json()["session_id"] == session_id
+        assert client.get("/api/v1/sessions/999/timer", headers=as_user(1)).status_code == 404
+
+    def test_timer_routes_require_owner(self, client):
+        session_id = client.post("/api/v1/sessions", json=session_payload(), headers=as_user(1)).json()["id"]
+        timer = f"/api/v1/sessions/{session_id}/timer"
+
+        assert client.get(timer).status_code == 401
+        assert client.post(f"{timer}/start").status_code == 401
+        assert client.post(f"{timer}/start", headers=as_user(2)).status_code == 403
+        assert client.post(f"{timer}/reset", headers=as_user(2)).status_code == 403
+        assert client.get(timer, headers=as_user(1)).json()["state"] == "idle"
+
+    def test_notification_routes(self, client, engine):
+        note = {"title": "Welcome", "message": "Hello", "user_id": 1}
+        created = client.post("/api/v1/notifications", json=note, headers=as_user(2))
+        assert created.status_code == 201
+        notification_id = created.json()["id"]
+
+        assert [n["id"] for n in client.get("/api/v1/notifications", headers=as_user(1)).json()["items"]] == [notification_id]
+        assert client.post(f"/api/v1/notifications/{notification_id}/read", headers=as_user(2)).status_code == 403
+        assert client.post(f"/api/v1/notifications/{notification_id}/read", headers=as_user(1)).json()["is_read"] is True
+        assert client.get("/api/v1/notifications", headers=as_user(1)).json()["items"] == []
+
+        client.post("/api/v1/notifications", json=note, headers=as_user(2))
+        assert client.post("/api/v1/notifications/read-all", headers=as_user(1)).json() == {"updated": 1}
+        assert client.post("/api/v1/notifications/read", json={"notification_ids": [notification_id]},
+                           headers=as_user(1)).json() == {"updated": 0}
+        assert client.delete(f"/api/v1/notifications/{notification_id}", headers=as_user(1)).status_code == 204
+        with sessionmaker(bind=engine)() as db:
+            assert db.query(Notification).count() == 1
@@ -0,0 +1,111 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from repositories.notification_repository import AsyncNotificationRepository
+from repositories.role_repository import AsyncRoleRepository
+from repositories.session_repository import AsyncSessionRepository
+from repositories.task_repository import AsyncTaskRepository
+from repositories.user_repository import AsyncUserRepository
+from core.config import Settings
+from database.unit_of_work import async_unit_of_work
+
+def current_time() -> datetime:
+    return datetime.now(timezone.utc)
+
+@pytest.mark.asyncio
+async def test_async_user_crud(async_db_session):
+    repository = AsyncUserRepository(async_db_session)
+    user = await repository.create_user({
+        "username": "asyncuser",
+        "email": "async@example.com",
+        "password": "hashed",
+        "created_at": current_time(),
+        "updated_at": current_time()
+    })
+    assert user.id is not None
+
+    updated = await repository.update_user(user.id, {"email": "updated@example.com"})
+    assert updated.email == "updated@example.com"
+
+    assert await repository.delete_user(user.id) is True
+    assert await repository.get_user_by_id(user.id) is None
+
+@pytest.mark.asyncio
+async def test_async_session_and_task_crud(async_db_session):
+    session_repository = AsyncSessionRepository(async_db_session)
+    task_repository = AsyncTaskRepository(async_db_session)
+    start_time = current_time()
+    session = await session_repository.create_session({
+        "name": "Async Session",
+        "created_by": 1,
+        "start_time": start_time,
+        "end_time": start_time + timedelta(hours=1),
+        "status": "pending",
+        "created_at": start_time,
+        "updated_at": start_time
+    })
+    task = await task_repository.create_task({
+        "title": "Async Task",
+        "session_id": session.id,
+        "created_by_user_id": 1,
+        "created_at_utc": start_time,
+        "last_updated_at_utc": start_time
+    })
+
+    updated = await session_repository.update_session(session.id, {"status": "completed"})
+    assert updated.status == "completed"
+    assert (await task_repository.update_task(task.id, {"title": "Renamed"})).title == "Renamed"
+
+    assert await task_repository.delete_taskById(task.id) is True
+    assert await session_repository.delete_session(session.id) is True
+    assert await session_repository.delete_session(session.id) is False
+
+@pytest.mark.asyncio
+async def test_async_notifications_by_user(async_db_session):
+    repository = AsyncNotificationRepository(async_db_session)
+    for user_id in (1, 1, 2):
+        await repository.create_notification({
+            "title": "Async",
+            "message": "Message",
+            "user_id": user_id,
+            "created_at_utc": current_time()
+        })
+
+    notifications = await repository.get_notifications_by_user_id(1)
+    assert len(notifications) == 2
+    assert all(n.user_id == 1 for n in notifications)
+
+@pytest.mark.asyncio
+async def test_async_role_lookup(async_db_session):
+    repository = AsyncRoleRepository(async_db_session)
+    role = await repository.create_role({
+        "name": "async_role",
+        "description": "Async role",
+        "permissions": ["read"]
+    })
+
+    assert (await repository.get_role_by_name("async_role")).id == role.id
+    assert [r.name for r in await repository.get_active_roles()] == ["async_role"]
+    assert await repository.delete_role(role.id) is True
+
+def test_async_database_url_uses_asyncpg():
+    settings = Settings(
+        DATABASE_URL="postgresql://user:secret@db:5432/study_tracker_db",
+        SECRET_KEY="test"
+    )
+    assert settings.get_async_database_url() == "postgresql+asyncpg://user:secret@db:5432/study_tracker_db"
+
+@pytest.mark.asyncio
+async def test_async_unit_of_work_rolls_back(async_db_session):
+    repository = AsyncNotificationRepository(async_db_session)
+
+    with pytest.raises(RuntimeError):
+        async with async_unit_of_work(async_db_session):
+            await repository.create_notification({
+                "title": "Rolled back",
+                "message": "Message",
+                "user_id": 3,
+                "created_at_utc": current_time()
+            })
+            raise RuntimeError("step failed")
+
+    assert await repository.get_notifications_by_user_id(3) == []
@@ -0,0 +1,40 @@
+from utils.cache import FileInvalidationBackend, TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("role", "admin")
+
+    assert cache.get("role") == "admin"
+    clock.now = 5.1
+    assert cache.get("role") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 0}
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_file_backend_propagates_invalidation(tmp_path):
+    path = str(tmp_path / "role-cache.invalidate")
+    publisher = FileInvalidationBackend(path, poll_interval=0)
+    subscriber = FileInvalidationBackend(path, poll_interval=0)
+
+    assert subscriber.changed() is False
+    publisher.publish()
+    assert subscriber.changed() is True
+    assert subscriber.changed() is False
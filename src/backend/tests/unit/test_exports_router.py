@@ -0,0 +1,64 @@
+import json
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from database.connection import Base
+from database.models import Notification
+from main import app
+from routers.exports import get_session_factory
+
+AS_USER_1 = {"X-User-Id": "1"}
+
+@pytest.fixture
+def client():
+    # The streamed body is produced on a worker thread, so the in-memory
+    # database has to be shared across threads.
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        db.add_all(
+            Notification(title=f"Note {i}", message="Study", user_id=1, created_at_utc=datetime(2024, 1, 1))
+            for i in range(3)
+        )
+        db.commit()
+
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+def test_export_csv(client):
+    response = client.get("/api/v1/exports/notifications", headers=AS_USER_1)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="notifications.csv"' in response.headers["content-disposition"]
+    lines = response.text.splitlines()
+    assert lines[0].startswith("id,title,message")
+    assert len(lines) == 4
+
+def test_export_ndjson(client):
+    response = client.get("/api/v1/exports/notifications", params={"format": "ndjson"}, headers=AS_USER_1)
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["title"] for record in records] == ["Note 0", "Note 1", "Note 2"]
+    assert records[0]["created_at_utc"] == "2024-01-01T00:00:00"
+
+def test_export_rejects_bad_requests(client):
+    assert client.get("/api/v1/exports/users", headers=AS_USER_1).status_code == 400
+    assert client.get("/api/v1/exports/tasks", params={"format": "xml"}, headers=AS_USER_1).status_code == 400
+
+def test_export_is_always_the_callers_own_data(client):
+    assert client.get("/api/v1/exports/notifications", params={"user_id": 1}).status_code == 401
+
+    response = client.get("/api/v1/exports/notifications", params={"user_id": 1}, headers={"X-User-Id": "2"})
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 1
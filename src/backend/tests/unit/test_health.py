@@ -0,0 +1,109 @@
+import asyncio
+import time
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from core.health import EventLoopLagMonitor, HealthChecker
+from database.connection import database_connection
+from main import app
+from routers.health import get_health_checker
+
+class FakeDatabase:
+    def __init__(self, in_use: int = 0, error: Exception = None, delay: float = 0.0):
+        self.in_use = in_use
+        self.error = error
+        self.delay = delay
+        self.checks = 0
+
+    def check_connection(self) -> None:
+        self.checks += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+    def pool_metrics(self):
+        return {"sync": {"pool_size": 5, "max_overflow": 5, "in_use": self.in_use, "checkout_timeouts": 0}}
+
+def checker(database, monitor=None, **options) -> HealthChecker:
+    return HealthChecker(database, monitor or EventLoopLagMonitor(), **options)
+
+@pytest.mark.asyncio
+async def test_readiness_is_cached_for_ttl():
+    database = FakeDatabase(in_use=3)
+    health = checker(database, ttl_seconds=60)
+
+    results = await asyncio.gather(*(health.readiness() for _ in range(20)))
+    results.append(await health.readiness())
+
+    assert database.checks == 1
+    assert results[-1]["status"] == "ok"
+    assert results[-1]["checks"]["pool"]["saturation"] == pytest.approx(0.3)
+    assert results[-1]["checks"]["database"]["status"] == "ok"
+
+    health.ttl_seconds = 0
+    health._expires_at = 0
+    await health.readiness()
+    assert database.checks == 2
+
+@pytest.mark.asyncio
+async def test_database_failure_and_saturated_pool_are_unavailable():
+    error = OperationalError("SELECT 1", {}, Exception("connection refused"))
+    result = await checker(FakeDatabase(error=error)).readiness()
+    assert result["status"] == "unavailable"
+    assert result["checks"]["database"] == {"status": "error", "error": "OperationalError"}
+
+    result = await checker(FakeDatabase(in_use=10)).readiness()
+    assert result["status"] == "unavailable"
+    assert result["checks"]["pool"]["status"] == "saturated"
+
+@pytest.mark.asyncio
+async def test_hung_database_check_times_out_without_piling_up():
+    database = FakeDatabase(delay=0.3)
+    health = checker(database, ttl_seconds=0, db_timeout_seconds=0.05)
+
+    first = await health.readiness()
+    second = await health.readiness()
+
+    assert first["checks"]["database"] == {"status": "error", "error": "timed out"}
+    assert second["checks"]["database"]["status"] == "error"
+    assert database.checks == 1
+    await asyncio.sleep(0.3)
+    database.delay = 0.0
+    assert (await health.readiness())["status"] == "ok"
+    assert database.checks == 2
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_is_detected():
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        result = await checker(FakeDatabase(), monitor, max_event_loop_lag_seconds=0.1).readiness()
+    finally:
+        await monitor.stop()
+
+    assert result["status"] == "unavailable"
+    assert result["checks"]["event_loop"]["status"] == "lagging"
+    assert result["checks"]["event_loop"]["max_lag_ms"] >= 100
+    assert monitor.take_max_lag() == 0.0
+
+def test_check_connection_uses_the_pool(monkeypatch, engine):
+    monkeypatch.setattr(database_connection, "engine", engine)
+    database_connection.check_connection()
+
+def test_probe_endpoints():
+    database = FakeDatabase(in_use=10)
+    app.dependency_overrides[get_health_checker] = lambda: checker(database)
+    try:
+        client = TestClient(app)
+        ready = client.get("/api/v1/health/ready")
+        live = client.get("/api/v1/health/live")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert ready.status_code == 503
+    assert ready.json()["checks"]["pool"]["in_use"] == 10
+    assert live.status_code == 200
+    assert live.json()["status"] == "ok"
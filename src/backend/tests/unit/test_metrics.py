@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from core.metrics import (
+    DB_QUERY_DURATION,
+    HTTP_REQUEST_DURATION,
+    SERVICE_METHOD_DURATION,
+    SERVICE_METHOD_ERRORS,
+    MetricsMiddleware,
+    MetricsRegistry,
+    timed
+)
+from core.request_metrics import statement_operation
+from main import app
+
+def count(histogram, labels) -> int:
+    entry = histogram.values().get(labels)
+    return 0 if entry is None else int(sum(entry[:-1]))
+
+def test_histogram_merges_thread_shards():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("work_seconds", "Work", ("kind",), buckets=(0.1, 1.0))
+
+    def record():
+        for _ in range(1000):
+            histogram.observe(0.5, ("batch",))
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    histogram.observe(0.05, ("batch",))
+
+    assert histogram.values()[("batch",)] == [1, 4000, 0, 2000.05]
+    rendered = registry.render()
+    assert 'work_seconds_bucket{kind="batch",le="0.1"} 1\n' in rendered
+    assert 'work_seconds_bucket{kind="batch",le="+Inf"} 4001\n' in rendered
+    assert 'work_seconds_count{kind="batch"} 4001\n' in rendered
+    assert "# TYPE work_seconds histogram\n" in rendered
+
+def test_counter_and_collectors():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ("state",))
+    counter.inc(("done",))
+    counter.inc(("done",), 2)
+    registry.register_collector(lambda: ["queue_depth 3"])
+
+    assert registry.render().endswith('jobs_total{state="done"} 3\nqueue_depth 3\n')
+
+def test_timed_records_duration_and_errors():
+    class ReportService:
+        @timed
+        def build(self, fail: bool = False):
+            if fail:
+                raise ValueError("broken")
+            return "report"
+
+    labels = ("ReportService", "build")
+    assert ReportService().build() == "report"
+    with pytest.raises(ValueError):
+        ReportService().build(fail=True)
+
+    assert count(SERVICE_METHOD_DURATION, labels) == 2
+    assert SERVICE_METHOD_ERRORS.values()[labels] == 1
+    assert ReportService.build.__name__ == "build"
+
+def test_statement_operation():
+    assert statement_operation("SELECT 1") == "SELECT"
+    assert statement_operation("\n  insert into tasks VALUES (1)") == "INSERT"
+    assert statement_operation("(SELECT 1) UNION (SELECT 2)") == "SELECT"
+    assert statement_operation("") == "OTHER"
+
+def test_queries_are_timed(engine):
+    before = count(DB_QUERY_DURATION, ("SELECT",))
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert count(DB_QUERY_DURATION, ("SELECT",)) == before + 1
+
+def test_middleware_labels_by_route_template():
+    client = TestClient(app)
+    health = ("GET", "/api/v1/health", 200)
+    missing = ("GET", "unmatched", 404)
+    before = count(HTTP_REQUEST_DURATION, health), count(HTTP_REQUEST_DURATION, missing)
+
+    client.get("/api/v1/health")
+    client.get("/api/v1/no-such-page/42")
+
+    assert count(HTTP_REQUEST_DURATION, health) == before[0] + 1
+    assert count(HTTP_REQUEST_DURATION, missing) == before[1] + 1
+
+@pytest.mark.asyncio
+async def test_event_streams_are_measured_until_headers():
+    class Route:
+        path = "/test/stream"
+
+    async def stream_app(scope, receive, send):
+        scope["route"] = Route()
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream; charset=utf-8")]})
+        await asyncio.sleep(0.3)
+        await send({"type": "http.response.body", "body": b": keep-alive\n\n"})
+
+    async def discard(message):
+        pass
+
+    labels = ("GET", "/test/stream", 200)
+    await MetricsMiddleware(stream_app)({"type": "http", "method": "GET", "path": "/test/stream"}, None, discard)
+
+    entry = HTTP_REQUEST_DURATION.values()[labels]
+    assert int(sum(entry[:-1])) == 1
+    assert entry[-1] < 0.1
+
+def test_metrics_endpoint():
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'db_pool_connections{pool="sync",state="in_use"} 0' in response.text
+    assert 'db_pool_checkout_wait_seconds_count{pool="sync"}' in response.text
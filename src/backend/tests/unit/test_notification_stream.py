@@ -0,0 +1,97 @@
+import asyncio
+import json
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from routers.notifications import get_notification_hub, sse_events
+from utils.notification_hub import NotificationHub
+
+def note(notification_id: int) -> dict:
+    return {"id": notification_id, "title": f"Note {notification_id}"}
+
+@pytest.mark.asyncio
+async def test_publish_reaches_every_connection_of_the_user():
+    hub = NotificationHub()
+    first, second, other = hub.subscribe(1), hub.subscribe(1), hub.subscribe(2)
+
+    hub.publish(1, note(1))
+
+    assert (await first.get(0.1))["data"] == note(1)
+    assert (await second.get(0.1))["data"] == note(1)
+    assert await other.get(0.01) is None
+    assert hub.stats() == {"users": 2, "connections": 3}
+
+@pytest.mark.asyncio
+async def test_unsubscribe_removes_idle_users():
+    hub = NotificationHub()
+    subscription = hub.subscribe(1)
+
+    hub.unsubscribe(subscription)
+    hub.unsubscribe(subscription)
+    hub.publish(1, note(1))
+
+    assert hub.stats() == {"users": 0, "connections": 0}
+    assert len(subscription) == 0
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_events():
+    hub = NotificationHub(queue_size=2, overflow_policy="drop_oldest")
+    subscription = hub.subscribe(1)
+
+    hub.publish_many((1, note(i)) for i in range(5))
+
+    assert [(await subscription.get(0.1))["data"]["id"] for _ in range(2)] == [3, 4]
+    assert subscription.dropped == 3
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_backlog_with_resync():
+    hub = NotificationHub(queue_size=2, overflow_policy="coalesce")
+    subscription = hub.subscribe(1)
+
+    hub.publish_many((1, note(i)) for i in range(4))
+
+    assert await subscription.get(0.1) == {"event": "resync", "data": {"dropped": 3}}
+    assert (await subscription.get(0.1))["data"] == note(3)
+    assert subscription.dropped == 0
+
+def test_unknown_overflow_policy_rejected():
+    with pytest.raises(ValueError):
+        NotificationHub(overflow_policy="block")
+
+@pytest.mark.asyncio
+async def test_publish_from_another_thread():
+    hub = NotificationHub()
+    subscription = hub.subscribe(1)
+
+    publisher = threading.Thread(target=hub.publish, args=(1, note(7)))
+    publisher.start()
+    publisher.join()
+
+    assert (await subscription.get(1.0))["data"] == note(7)
+
+@pytest.mark.asyncio
+async def test_sse_events_format_and_heartbeat():
+    hub = NotificationHub()
+    stream = sse_events(hub, 1, heartbeat_seconds=0.01)
+
+    assert await stream.__anext__() == ": keep-alive\n\n"
+    hub.publish(1, note(5))
+    assert await stream.__anext__() == 'id: 5\nevent: notification\ndata: {"id":5,"title":"Note 5"}\n\n'
+
+    await stream.aclose()
+    assert hub.stats()["connections"] == 0
+
+def test_websocket_pushes_published_notifications():
+    hub = NotificationHub()
+    app.dependency_overrides[get_notification_hub] = lambda: hub
+    try:
+        with TestClient(app).websocket_connect("/api/v1/notifications/ws?user_id=1") as websocket:
+            assert hub.stats()["connections"] == 1
+            hub.publish(2, note(1))
+            hub.publish(1, note(2))
+            assert websocket.receive_json() == {"event": "notification", "data": note(2)}
+    finally:
+        app.dependency_overrides.clear()
+
+    assert hub.stats()["connections"] == 0
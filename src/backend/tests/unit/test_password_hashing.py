@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+import utils.hashing as hashing
+from utils.hashing import (
+    PasswordHasher,
+    PasswordHashingPool,
+    calibrate_bcrypt_rounds,
+    configure_bcrypt_rounds,
+    get_bcrypt_rounds,
+    pwd_context
+)
+
+@pytest.fixture
+def hashing_pool(monkeypatch):
+    pool = PasswordHashingPool(max_workers=1, max_concurrency=1)
+    monkeypatch.setattr(hashing, "_hashing_pool", pool)
+    yield pool
+    pool.shutdown()
+
+def fast_hash(password: str) -> str:
+    return pwd_context.hash(password, rounds=4)
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_round_trip(hashing_pool):
+    hashed = await PasswordHasher.get_password_hash_async("testPassword123!")
+
+    assert hashed is not None
+    assert PasswordHasher.verify_password("testPassword123!", hashed)
+    assert await PasswordHasher.verify_password_async("testPassword123!", hashed)
+    assert not await PasswordHasher.verify_password_async("wrongPassword123!", hashed)
+
+@pytest.mark.asyncio
+async def test_async_verify_invalid_hash_returns_false(hashing_pool):
+    assert await PasswordHasher.verify_password_async("testPassword123!", "not-a-hash") is False
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_reports_queue_depth(hashing_pool):
+    hashed = fast_hash("testPassword123!")
+    calls = [
+        asyncio.create_task(PasswordHasher.verify_password_async("testPassword123!", hashed))
+        for _ in range(4)
+    ]
+    await asyncio.sleep(0)
+
+    stats = hashing_pool.stats()
+    assert stats["in_flight"] == 1
+    assert stats["queue_depth"] == 3
+
+    assert all(await asyncio.gather(*calls))
+    assert hashing_pool.stats() == {
+        "workers": 1,
+        "max_concurrency": 1,
+        "queue_depth": 0,
+        "in_flight": 0,
+        "completed": 4
+    }
+
+def test_map_counts_calls_and_limits_concurrency(hashing_pool, monkeypatch):
+    submitted = []
+    submit = hashing_pool.executor.submit
+
+    def tracking_submit(function, *args):
+        submitted.append(hashing_pool.stats()["in_flight"])
+        return submit(function, *args)
+
+    monkeypatch.setattr(hashing_pool.executor, "submit", tracking_submit)
+    hashes = hashing_pool.map(hashing._hash_password, ["a", "b", "c"], [4, 4, 4])
+
+    assert all(pwd_context.verify(password, hashed) for password, hashed in zip("abc", hashes))
+    assert max(submitted) <= hashing_pool.max_concurrency
+    assert hashing_pool.stats()["in_flight"] == 0
+    assert hashing_pool.stats()["queue_depth"] == 0
+    assert hashing_pool.stats()["completed"] == 3
+
+@pytest.fixture
+def bcrypt_rounds():
+    original_rounds = get_bcrypt_rounds()
+    yield
+    configure_bcrypt_rounds(original_rounds)
+
+def test_calibration_stays_within_bounds():
+    rounds = calibrate_bcrypt_rounds(target_ms=1, min_rounds=4, max_rounds=6)
+    assert rounds == 4
+
+    rounds = calibrate_bcrypt_rounds(target_ms=60_000, min_rounds=4, max_rounds=6)
+    assert rounds == 6
+
+def test_verify_and_update_rehashes_outdated_cost(bcrypt_rounds):
+    hashed = fast_hash("testPassword123!")
+    configure_bcrypt_rounds(5)
+
+    assert PasswordHasher.needs_rehash(hashed)
+    verified, new_hash = PasswordHasher.verify_and_update("testPassword123!", hashed)
+
+    assert verified
+    assert new_hash.startswith("$2b$05$")
+    assert PasswordHasher.verify_password("testPassword123!", new_hash)
+    assert PasswordHasher.verify_and_update("testPassword123!", new_hash) == (True, None)
+
+def test_verify_and_update_wrong_password(bcrypt_rounds):
+    configure_bcrypt_rounds(5)
+    assert PasswordHasher.verify_and_update("wrongPassword123!", fast_hash("testPassword123!")) == (False, None)
+
+@pytest.mark.asyncio
+async def test_verify_and_update_async(hashing_pool, bcrypt_rounds):
+    configure_bcrypt_rounds(5)
+
+    verified, new_hash = await PasswordHasher.verify_and_update_async(
+        "testPassword123!",
+        fast_hash("testPassword123!")
+    )
+
+    assert verified
+    assert new_hash.startswith("$2b$05$")
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from repositories.role_repository import RoleSnapshot
+from utils.permissions import PermissionRegistry
+
+def make_role(role_id: int, permissions) -> RoleSnapshot:
+    current_time = datetime.now(timezone.utc)
+    return RoleSnapshot(
+        id=role_id,
+        name=f"role_{role_id}",
+        description="Test role",
+        permissions=frozenset(permissions),
+        is_active=True,
+        created_at=current_time,
+        updated_at=current_time
+    )
+
+def test_has_permission():
+    registry = PermissionRegistry()
+    editor = make_role(1, ["read", "write"])
+    viewer = make_role(2, ["read"])
+
+    assert registry.has_permission(editor, "write")
+    assert registry.has_permission(viewer, "read")
+    assert not registry.has_permission(viewer, "write")
+    assert not registry.has_permission(viewer, "never_registered")
+
+def test_masks_share_bits_across_roles():
+    registry = PermissionRegistry()
+
+    assert registry.compile(["read", "write"]) == 0b11
+    assert registry.compile(["write"]) == 0b10
+    assert registry.compile([]) == 0
+
+def test_reloaded_role_is_recompiled():
+    registry = PermissionRegistry()
+    assert registry.has_permission(make_role(1, ["read", "admin"]), "admin")
+
+    assert not registry.has_permission(make_role(1, ["read"]), "admin")
@@ -0,0 +1,73 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+from database.pool_metrics import Histogram, InstrumentedQueuePool
+from main import app
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+def metrics(engine) -> dict:
+    return engine.pool.metrics.snapshot(engine.pool)
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.01, 0.1))
+    for value in (0.005, 0.05, 0.05, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert [bucket["count"] for bucket in snapshot["buckets"]] == [1, 3, 4]
+    assert snapshot["buckets"][-1]["le"] == "+Inf"
+    assert snapshot["max_seconds"] == 3.0
+
+def test_checkouts_overflow_and_timeouts(engine):
+    first = engine.connect()
+    second = engine.connect()
+
+    snapshot = metrics(engine)
+    assert (snapshot["in_use"], snapshot["overflow"], snapshot["peak_in_use"]) == (2, 1, 2)
+    assert snapshot["overflow_checkouts"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    first.close()
+    second.close()
+
+    snapshot = metrics(engine)
+    assert snapshot["checkouts"] == 2
+    assert snapshot["checkout_timeouts"] == 1
+    assert snapshot["checkout_wait"]["count"] == 3
+    assert snapshot["checkout_wait"]["max_seconds"] >= 0.05
+    assert snapshot["connects"] == 2
+    assert snapshot["in_use"] == 0
+    assert snapshot["suggested_pool_size"] == 2
+
+def test_invalidations_counted_and_kept_across_dispose(engine):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.invalidate()
+
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    snapshot = metrics(engine)
+    assert snapshot["invalidations"] == 1
+    assert snapshot["checkouts"] == 2
+    assert snapshot["connects"] == 2
+
+def test_pool_metrics_endpoint():
+    response = TestClient(app).get("/internal/metrics/pool")
+
+    assert response.status_code == 200
+    assert {"in_use", "overflow", "checkout_wait", "connects"} <= response.json()["sync"].keys()
@@ -0,0 +1,170 @@
+import logging
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from core.dependencies import get_session_factory
+from core.metrics import timed
+from core.query_profiler import QueryProfiler, fingerprint, query_profiler
+from database.connection import Base
+from database.models import Role, User
+from main import app
+from repositories.role_repository import role_cache
+
+def test_fingerprint_normalizes_values():
+    assert fingerprint("SELECT * FROM tasks WHERE id = 42 AND title = 'It''s'") == \
+        "SELECT * FROM tasks WHERE id = ? AND title = ?"
+    assert fingerprint("SELECT * FROM tasks\n  WHERE id IN (?, ?, ?)") == "SELECT * FROM tasks WHERE id IN (...)"
+    assert fingerprint("SELECT * FROM tasks WHERE id IN (%(id_1)s, %(id_2)s)") == fingerprint(
+        "SELECT * FROM tasks WHERE id IN ($1, $2, $3, $4)"
+    )
+    assert fingerprint("INSERT INTO tags (name, kind) VALUES (?, ?), (?, ?), (?, ?)") == \
+        "INSERT INTO tags (name, kind) VALUES (...)"
+    assert fingerprint("SELECT task_1.id FROM task_1") == "SELECT task_1.id FROM task_1"
+
+def test_top_orders_by_total_and_p99():
+    profiler = QueryProfiler(sample_rate=1.0, slow_query_threshold_ms=10_000)
+    for _ in range(100):
+        profiler.record("SELECT * FROM tasks WHERE id = 1", 0.002)
+    for seconds in [0.001] * 9 + [0.5]:
+        profiler.record("SELECT * FROM sessions WHERE id = 1", seconds)
+
+    by_total = profiler.top(order_by="total")
+    by_p99 = profiler.top(order_by="p99")
+
+    assert [entry["fingerprint"] for entry in by_total] == [
+        "SELECT * FROM sessions WHERE id = ?", "SELECT * FROM tasks WHERE id = ?"
+    ]
+    assert by_total[1]["count"] == 100
+    assert by_p99[0]["p99_ms"] == pytest.approx(500)
+    assert profiler.top(limit=1, order_by="count")[0]["fingerprint"] == "SELECT * FROM tasks WHERE id = ?"
+    with pytest.raises(ValueError):
+        profiler.top(order_by="name")
+
+def test_fingerprints_and_samples_are_bounded():
+    profiler = QueryProfiler(sample_rate=1.0, max_fingerprints=3, reservoir_size=10)
+    for _ in range(50):
+        profiler.record("SELECT * FROM tasks", 0.01)
+    for table in ("a", "b", "c"):
+        profiler.record(f"SELECT * FROM {table}", 0.001)
+
+    fingerprints = {entry["fingerprint"] for entry in profiler.top()}
+
+    assert len(fingerprints) == 3
+    assert "SELECT * FROM tasks" in fingerprints
+    assert len(profiler._stats["SELECT * FROM tasks"].samples) == 10
+
+def test_sampling_and_toggle():
+    profiler = QueryProfiler(sample_rate=0.0)
+    profiler.record("SELECT 1", 0.001)
+    assert profiler.top() == []
+
+    profiler.configure(enabled=False, sample_rate=1.0)
+    profiler.record("SELECT 1", 0.001)
+    assert profiler.top() == []
+
+    profiler.configure(enabled=True)
+    profiler.record("SELECT 1", 0.001)
+    assert profiler.top()[0]["count"] == 1
+    with pytest.raises(ValueError):
+        profiler.configure(sample_rate=2)
+
+def test_counts_and_totals_are_scaled_by_sample_rate(monkeypatch):
+    monkeypatch.setattr("core.query_profiler.random.random", lambda: 0.0)
+    profiler = QueryProfiler(sample_rate=0.25)
+    for _ in range(2):
+        profiler.record("SELECT * FROM tasks", 0.01)
+    profiler.configure(sample_rate=1.0)
+    profiler.record("SELECT * FROM tasks", 0.01)
+
+    entry = profiler.top()[0]
+
+    assert (entry["count"], entry["sampled"]) == (9, 3)
+    assert entry["total_ms"] == pytest.approx(90)
+    assert entry["mean_ms"] == pytest.approx(10)
+
+def test_slow_queries_are_logged_with_service_method(caplog):
+    profiler = QueryProfiler(sample_rate=0.0, slow_query_threshold_ms=100)
+
+    class ReportService:
+        @timed
+        def build(self):
+            profiler.record("SELECT * FROM reports WHERE id = 7", 0.25)
+            profiler.record("SELECT * FROM reports WHERE id = 8", 0.05)
+
+    with caplog.at_level(logging.WARNING, logger="core.query_profiler"):
+        ReportService().build()
+        profiler.record("SELECT 1", 0.3)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Slow query 250.0ms in ReportService.build: SELECT * FROM reports WHERE id = ?",
+        "Slow query 300.0ms in unknown: SELECT ?"
+    ]
+
+def test_engine_statements_are_profiled(engine):
+    query_profiler.reset()
+    sample_rate = query_profiler.sample_rate
+    query_profiler.configure(sample_rate=1.0)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1 + 41"))
+    finally:
+        query_profiler.configure(sample_rate=sample_rate)
+
+    assert [entry["fingerprint"] for entry in query_profiler.top()] == ["SELECT ? + ?"]
+
+@pytest.fixture
+def client():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    current_time = datetime(2024, 1, 1)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        admin_role = Role(name="admin", description="Administrators", permissions=["admin"],
+                          created_at=current_time, updated_at=current_time, is_active=True)
+        db.add(admin_role)
+        db.flush()
+        db.add_all([
+            User(username="admin", email="admin@test.com", password="hashed_password", role_id=admin_role.id,
+                 created_at=current_time, updated_at=current_time),
+            User(username="member", email="member@test.com", password="hashed_password",
+                 created_at=current_time, updated_at=current_time)
+        ])
+        db.commit()
+    role_cache.invalidate()
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    settings = query_profiler.status()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        query_profiler.configure(settings["enabled"], settings["sample_rate"], settings["slow_query_threshold_ms"])
+        role_cache.invalidate()
+        engine.dispose()
+
+def test_admin_endpoint_requires_admin(client):
+    assert client.get("/api/v1/admin/query-profiler").status_code == 401
+    assert client.get("/api/v1/admin/query-profiler", headers={"X-User-Id": "2"}).status_code == 403
+
+def test_admin_endpoint_reports_and_configures(client):
+    admin = {"X-User-Id": "1"}
+
+    response = client.patch(
+        "/api/v1/admin/query-profiler",
+        json={"sample_rate": 1.0, "slow_query_threshold_ms": 500, "reset": True},
+        headers=admin
+    )
+    assert response.status_code == 200
+    assert response.json()["sample_rate"] == 1.0
+    assert response.json()["slow_query_threshold_ms"] == 500
+
+    response = client.get("/api/v1/admin/query-profiler?order_by=p99&limit=5", headers=admin)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["order_by"] == "p99"
+    assert any(entry["fingerprint"].startswith("SELECT users.") for entry in body["queries"])
+
+    invalid = client.patch("/api/v1/admin/query-profiler", json={"sample_rate": 3}, headers=admin)
+    assert invalid.status_code == 422
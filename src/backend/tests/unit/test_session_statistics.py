@@ -0,0 +1,77 @@
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+from utils.session_statistics import compute_session_statistics, daily_totals, streaks
+
+def epoch(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+def python_daily_totals(sessions):
+    totals = defaultdict(int)
+    for start, end in sessions:
+        cursor = start
+        while cursor < end:
+            chunk_end = min(end, datetime.combine(cursor.date() + timedelta(days=1), datetime.min.time()))
+            totals[cursor.date()] += int((chunk_end - cursor).total_seconds())
+            cursor = chunk_end
+    return totals
+
+def test_daily_totals_match_python_loop():
+    rng = random.Random(7)
+    base = datetime(2024, 1, 1)
+    sessions = []
+    for _ in range(500):
+        start = base + timedelta(seconds=rng.randrange(90 * 86400))
+        sessions.append((start, start + timedelta(seconds=rng.randrange(1, 3 * 86400))))
+
+    first_day, totals = daily_totals(
+        np.array([int(epoch(s)) for s, _ in sessions]),
+        np.array([int(epoch(e)) for _, e in sessions])
+    )
+    first = date(1970, 1, 1) + timedelta(days=first_day)
+    vectorized = {first + timedelta(days=i): int(s) for i, s in enumerate(totals) if s}
+
+    assert vectorized == dict(python_daily_totals(sessions))
+
+def test_session_ending_at_midnight_stays_on_its_day():
+    start = datetime(2024, 3, 10, 23, 0)
+    first_day, totals = daily_totals(np.array([int(epoch(start))]), np.array([int(epoch(start + timedelta(hours=1)))]))
+
+    assert date(1970, 1, 1) + timedelta(days=first_day) == date(2024, 3, 10)
+    assert totals.tolist() == [3600]
+
+def test_streaks():
+    daily = np.array([1, 1, 0, 1, 1, 1, 0, 0, 1, 1])
+    assert streaks(daily, 9) == (3, 2)
+    assert streaks(daily, 10) == (3, 2)
+    assert streaks(daily, 11) == (3, 0)
+    assert streaks(np.zeros(3), 2) == (0, 0)
+
+def test_compute_session_statistics():
+    sessions = [
+        (datetime(2024, 3, 11, 9, 0), timedelta(minutes=30)),
+        (datetime(2024, 3, 12, 9, 0), timedelta(minutes=60)),
+        (datetime(2024, 3, 13, 23, 0), timedelta(minutes=120)),
+        (datetime(2024, 3, 20, 9, 0), timedelta(minutes=0)),
+    ]
+    statistics = compute_session_statistics(
+        [epoch(start) for start, _ in sessions],
+        [epoch(start + length) for start, length in sessions],
+        today=date(2024, 3, 14)
+    )
+
+    assert statistics.session_count == 3
+    assert statistics.total_seconds == 210 * 60
+    assert statistics.percentiles[50] == 3600
+    assert statistics.first_day == date(2024, 3, 11)
+    assert statistics.daily_seconds == [1800, 3600, 3600, 3600]
+    assert (statistics.longest_streak, statistics.current_streak) == (4, 4)
+    # 2024-03-13 was a Wednesday
+    assert statistics.heatmap[2][23] == 7200
+    assert sum(map(sum, statistics.heatmap)) == statistics.total_seconds
+
+def test_compute_session_statistics_empty():
+    statistics = compute_session_statistics([], [])
+    assert statistics.session_count == 0
+    assert statistics.daily_seconds == []
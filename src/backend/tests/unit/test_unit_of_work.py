@@ -0,0 +1,107 @@
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import event
+from database.models import Notification
+from database.unit_of_work import unit_of_work, in_unit_of_work, after_commit
+from repositories.notification_repository import NotificationRepository
+
+def notification_data(title: str) -> dict:
+    return {
+        "title": title,
+        "message": "Message",
+        "user_id": 1,
+        "created_at_utc": datetime.now(timezone.utc)
+    }
+
+@pytest.fixture(autouse=True)
+def cleanup_database(db_session):
+    yield
+    db_session.rollback()
+    db_session.query(Notification).delete()
+    db_session.commit()
+
+@pytest.fixture
+def commit_counter(db_session):
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(db_session, "after_commit", listener)
+    yield commits
+    event.remove(db_session, "after_commit", listener)
+
+def test_repositories_commit_per_call_by_default(db_session, commit_counter):
+    repository = NotificationRepository(db_session)
+
+    repository.create_notification(notification_data("first"))
+    repository.create_notification(notification_data("second"))
+
+    assert len(commit_counter) == 2
+
+def test_unit_of_work_commits_once(db_session, commit_counter):
+    repository = NotificationRepository(db_session)
+
+    with unit_of_work(db_session):
+        assert in_unit_of_work(db_session)
+        first = repository.create_notification(notification_data("first"))
+        repository.mark_read([first.id], user_id=1)
+        repository.create_notifications_bulk({"title": "bulk", "message": "Message",
+                                              "created_at_utc": datetime.now(timezone.utc)}, [2, 3])
+        assert first.id is not None
+        assert commit_counter == []
+
+    assert len(commit_counter) == 1
+    assert not in_unit_of_work(db_session)
+    assert db_session.query(Notification).count() == 3
+
+def test_unit_of_work_rolls_back_every_step(db_session):
+    repository = NotificationRepository(db_session)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(db_session):
+            repository.create_notification(notification_data("first"))
+            repository.create_notification(notification_data("second"))
+            raise RuntimeError("step failed")
+
+    assert db_session.query(Notification).count() == 0
+
+def test_nested_unit_of_work_joins_outer_transaction(db_session, commit_counter):
+    repository = NotificationRepository(db_session)
+
+    with unit_of_work(db_session):
+        with unit_of_work(db_session):
+            repository.create_notification(notification_data("inner"))
+        assert commit_counter == []
+        repository.create_notification(notification_data("outer"))
+
+    assert len(commit_counter) == 1
+
+def test_after_commit_waits_for_outermost_commit(db_session):
+    repository = NotificationRepository(db_session)
+    calls = []
+
+    with unit_of_work(db_session):
+        with unit_of_work(db_session):
+            repository.create_notification(notification_data("inner"))
+            after_commit(db_session, lambda: calls.append("inner"))
+        assert calls == []
+
+    assert calls == ["inner"]
+
+def test_after_commit_dropped_on_rollback(db_session):
+    repository = NotificationRepository(db_session)
+    calls = []
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(db_session):
+            repository.create_notification(notification_data("first"))
+            after_commit(db_session, lambda: calls.append("first"))
+            raise RuntimeError("step failed")
+    repository.create_notification(notification_data("second"))
+
+    assert calls == []
+
+def test_after_commit_runs_immediately_outside_unit_of_work(db_session):
+    calls = []
+
+    after_commit(db_session, lambda: calls.append("now"))
+
+    assert calls == ["now"]
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ttl seconds
+
+    Keeps hit/miss/eviction counters so callers can expose cache health.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries)
+            }
+
+class LocalInvalidationBackend:
+    """Invalidation stays inside the current process"""
+
+    def publish(self) -> None:
+        pass
+
+    def changed(self) -> bool:
+        return False
+
+class FileInvalidationBackend:
+    """
+    Shares invalidations between worker processes through a shared file
+
+    publish() appends a line to the file; every process polls the file's
+    size and mtime at most once per poll_interval and reports a change when
+    either moved. A process also sees its own publishes, which only costs
+    one extra local clear.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 1.0, max_size: int = 64 * 1024):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.max_size = max_size
+        self._next_poll = 0.0
+        self._signature = self._read_signature()
+        self._lock = threading.Lock()
+
+    def _read_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat_result.st_size, stat_result.st_mtime_ns
+
+    def publish(self) -> None:
+        try:
+            # Start over instead of growing forever; shrinking is a change too
+            mode = "w" if (self._read_signature() or (0, 0))[0] >= self.max_size else "a"
+            with open(self.path, mode) as invalidation_file:
+                invalidation_file.write(f"{os.getpid()} {time.time()}\n")
+        except OSError as error:
+            logger.error(f"Error publishing cache invalidation: {error}")
+
+    def changed(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_poll:
+                return False
+            self._next_poll = now + self.poll_interval
+            signature = self._read_signature()
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            return True
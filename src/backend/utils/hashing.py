@@ -1,12 +1,210 @@
 from passlib.context import CryptContext
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from core.config import settings
+import asyncio
 import logging
-from typing import Optional
+import multiprocessing
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 # Create password context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+def get_bcrypt_rounds() -> int:
+    """Cost used for new hashes"""
+    return pwd_context.handler("bcrypt").default_rounds
+
+def configure_bcrypt_rounds(rounds: int) -> None:
+    """Use a new cost for hashes created from now on"""
+    pwd_context.update(bcrypt__default_rounds=rounds)
+    logger.info(f"bcrypt cost set to {rounds}")
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 15
+) -> int:
+    """
+    Find the highest bcrypt cost whose hash time stays within target_ms
+
+    The work factor doubles with every extra round, so only the minimum
+    cost is measured and higher costs are extrapolated from it.
+    """
+    started = time.perf_counter()
+    pwd_context.hash("calibration-password", rounds=min_rounds)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+        elapsed_ms *= 2
+        rounds += 1
+
+    logger.info(f"Calibrated bcrypt cost {rounds} (~{elapsed_ms:.0f} ms per hash)")
+    return rounds
+
+def configure_password_hashing() -> int:
+    """Apply the configured or calibrated bcrypt cost; called at startup"""
+    rounds = settings.PASSWORD_HASH_ROUNDS or calibrate_bcrypt_rounds(
+        settings.PASSWORD_HASH_TARGET_MS,
+        settings.PASSWORD_HASH_MIN_ROUNDS,
+        settings.PASSWORD_HASH_MAX_ROUNDS
+    )
+    configure_bcrypt_rounds(rounds)
+    return rounds
+
+def _hash_cost(hashed_password: str) -> Optional[int]:
+    # bcrypt hashes look like $2b$<cost>$<salt+checksum>
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+def _hash_password(password: str, rounds: Optional[int] = None) -> str:
+    # Runs inside a pool worker process, which has its own pwd_context
+    if rounds is None:
+        return pwd_context.hash(password)
+    return pwd_context.hash(password, rounds=rounds)
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Runs inside a pool worker process
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _verify_and_update(
+    plain_password: str,
+    hashed_password: str,
+    rounds: int
+) -> Tuple[bool, Optional[str]]:
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False, None
+    if _hash_cost(hashed_password) == rounds and not pwd_context.needs_update(hashed_password):
+        return True, None
+    return True, pwd_context.hash(plain_password, rounds=rounds)
+
+class PasswordHashingPool:
+    """
+    Bounded process pool for bcrypt work
+
+    bcrypt is CPU bound and holds the GIL for part of each call, so hashing
+    runs in worker processes. At most max_concurrency calls from run are
+    handed to the pool at once, and likewise at most max_concurrency calls
+    of each map; the rest wait and are reported as queue_depth. Stats count
+    individual calls.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_concurrency: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.max_workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # map runs on worker threads and completes in executor callbacks
+        self._counters_lock = threading.Lock()
+        self._waiting = 0
+        self._in_flight = 0
+        self._completed = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn avoids forking a process that already runs threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free slot"""
+        return self._waiting
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._waiting,
+            "in_flight": self._in_flight,
+            "completed": self._completed
+        }
+
+    def _count(self, waiting: int = 0, in_flight: int = 0, completed: int = 0) -> None:
+        with self._counters_lock:
+            self._waiting += waiting
+            self._in_flight += in_flight
+            self._completed += completed
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        self._count(waiting=1)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._count(waiting=-1)
+
+        self._count(in_flight=1)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, function, *args)
+        finally:
+            self._count(in_flight=-1, completed=1)
+            self._semaphore.release()
+
+    def map(self, function: Callable[..., Any], *iterables: Iterable[Any]) -> List[Any]:
+        """
+        Run function over the iterables on every worker; blocks until all results are in
+
+        Calls are submitted as earlier ones finish, so a batch import never
+        queues more than max_concurrency calls ahead of logins going through run.
+        """
+        calls = list(zip(*iterables))
+        futures: List[Future] = []
+        pending: Set[Future] = set()
+
+        def settle(return_when: str) -> None:
+            nonlocal pending
+            done, pending = wait(pending, return_when=return_when)
+            self._count(in_flight=-len(done), completed=len(done))
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+
+        self._count(waiting=len(calls))
+        try:
+            for args in calls:
+                if len(pending) >= self.max_concurrency:
+                    settle(FIRST_COMPLETED)
+                self._count(waiting=-1, in_flight=1)
+                future = self.executor.submit(function, *args)
+                futures.append(future)
+                pending.add(future)
+            settle(ALL_COMPLETED)
+            return [future.result() for future in futures]
+        finally:
+            for future in pending:
+                future.cancel()
+            self._count(waiting=len(futures) - len(calls), in_flight=-len(pending))
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+_hashing_pool: Optional[PasswordHashingPool] = None
+
+def get_password_hashing_pool() -> PasswordHashingPool:
+    global _hashing_pool
+    if _hashing_pool is None:
+        _hashing_pool = PasswordHashingPool(
+            settings.PASSWORD_HASH_WORKERS,
+            settings.PASSWORD_HASH_MAX_CONCURRENCY
+        )
+    return _hashing_pool
+
 class PasswordHasher:
     """Utility class for password hashing and verification"""
     
@@ -44,6 +242,102 @@ class PasswordHasher:
             logger.error(f"Error hashing password: {error}")
             return None
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password in the hashing pool without blocking the event loop
+
+        Args:
+            plain_password: The password in plain text
+            hashed_password: The hashed password to compare against
+
+        Returns:
+            bool: True if password matches, False otherwise
+        """
+        try:
+            return await get_password_hashing_pool().run(
+                _verify_password, plain_password, hashed_password
+            )
+        except Exception as error:
+            logger.error(f"Error verifying password: {error}")
+            return False
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> Optional[str]:
+        """
+        Hash a password in the hashing pool without blocking the event loop
+
+        Args:
+            password: The plain text password to hash
+
+        Returns:
+            str: The hashed password
+            None: If hashing fails
+        """
+        try:
+            return await get_password_hashing_pool().run(
+                _hash_password, password, get_bcrypt_rounds()
+            )
+        except Exception as error:
+            logger.error(f"Error hashing password: {error}")
+            return None
+
+    @staticmethod
+    def get_password_hashes(passwords: List[str]) -> List[str]:
+        """
+        Hash many passwords in parallel across the hashing pool workers
+
+        Args:
+            passwords: Plain text passwords
+
+        Returns:
+            list: Hashes in the same order as the passwords
+        """
+        if not passwords:
+            return []
+        rounds = get_bcrypt_rounds()
+        return get_password_hashing_pool().map(_hash_password, passwords, [rounds] * len(passwords))
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """Check if a stored hash was made with a different cost than the current one"""
+        return (
+            _hash_cost(hashed_password) != get_bcrypt_rounds()
+            or pwd_context.needs_update(hashed_password)
+        )
+
+    @staticmethod
+    def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if the stored cost is outdated
+
+        Args:
+            plain_password: The password in plain text
+            hashed_password: The stored hash
+
+        Returns:
+            tuple: (True if password matches, new hash to store or None)
+        """
+        try:
+            return _verify_and_update(plain_password, hashed_password, get_bcrypt_rounds())
+        except Exception as error:
+            logger.error(f"Error verifying password: {error}")
+            return False, None
+
+    @staticmethod
+    async def verify_and_update_async(
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Async counterpart of verify_and_update, run in the hashing pool"""
+        try:
+            return await get_password_hashing_pool().run(
+                _verify_and_update, plain_password, hashed_password, get_bcrypt_rounds()
+            )
+        except Exception as error:
+            logger.error(f"Error verifying password: {error}")
+            return False, None
+
     @staticmethod
     def is_password_safe(password: str) -> bool:
         """
@@ -0,0 +1,27 @@
+import csv
+import json
+from typing import Any, Iterator, TextIO
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+def read_records(stream: TextIO, import_format: str) -> Iterator[Any]:
+    """
+    Lazily read records from a CSV (with header) or NDJSON stream
+
+    Empty CSV cells are dropped so model defaults apply. NDJSON lines that
+    aren't valid JSON are yielded as the raw line, leaving it to the
+    importer to reject them.
+    """
+    if import_format == "csv":
+        for record in csv.DictReader(stream):
+            yield {key: value for key, value in record.items() if value not in ("", None)}
+    elif import_format == "ndjson":
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield line
+    else:
+        raise ValueError(f"Unsupported import format: {import_format}")
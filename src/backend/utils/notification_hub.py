@@ -0,0 +1,127 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Set, Tuple
+from core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce")
+
+class Subscription:
+    """
+    Bounded queue of events for one connected client
+
+    When a slow client lets the queue fill up, "drop_oldest" discards the
+    oldest event, while "coalesce" replaces everything queued with a single
+    resync event telling the client to refetch its notifications.
+    """
+    __slots__ = ("user_id", "maxsize", "policy", "dropped", "_events", "_ready")
+
+    def __init__(self, user_id: int, maxsize: int, policy: str):
+        self.user_id = user_id
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """Queue an event; must be called on the event loop"""
+        if len(self._events) >= self.maxsize:
+            if self.policy == "drop_oldest":
+                self._events.popleft()
+                self.dropped += 1
+            else:
+                self.dropped += len(self._events) + 1
+                self._events.clear()
+                event = {"event": "resync", "data": {"dropped": self.dropped}}
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrived within timeout seconds"""
+        while not self._events:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        event = self._events.popleft()
+        if event["event"] == "resync":
+            self.dropped = 0
+        return event
+
+class NotificationHub:
+    """
+    In-process pub/sub of notification events to connected clients
+
+    Subscriptions live on the event loop; publish may be called from any
+    thread, e.g. from sync request handlers running in the threadpool, and
+    hands the events to the loop in a single callback. Users without an open
+    connection cost a dict lookup. Events only reach clients connected to
+    the same worker process.
+    """
+    def __init__(self, queue_size: int = 100, overflow_policy: str = "coalesce"):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}'")
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Open a subscription for user_id; must be called on the event loop"""
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(user_id, self.queue_size, self.overflow_policy)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id: int, data: Dict[str, Any], event: str = "notification") -> None:
+        self.publish_many([(user_id, data)], event)
+
+    def publish_many(self, messages: Iterable[Tuple[int, Dict[str, Any]]], event: str = "notification") -> None:
+        """Queue (user_id, data) messages for every connection of their users"""
+        # Reading the dict from another thread is safe; it is only mutated on the loop
+        pending = [
+            (user_id, {"event": event, "data": data})
+            for user_id, data in messages
+            if user_id in self._subscriptions
+        ]
+        if not pending or self._loop is None or self._loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._deliver(pending)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, pending)
+
+    def _deliver(self, pending) -> None:
+        for user_id, event in pending:
+            for subscription in self._subscriptions.get(user_id, ()):
+                subscription.put(event)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "users": len(self._subscriptions),
+            "connections": sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+        }
+
+notification_hub = NotificationHub(
+    settings.NOTIFICATION_STREAM_QUEUE_SIZE,
+    settings.NOTIFICATION_STREAM_OVERFLOW_POLICY
+)
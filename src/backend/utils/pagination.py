@@ -0,0 +1,87 @@
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from pydantic import BaseModel
+from exceptions import InvalidDataException
+
+T = TypeVar("T")
+
+@dataclass
+class Page(Generic[T]):
+    """A single page of keyset-paginated results"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+class PageResponse(BaseModel, Generic[T]):
+    """Response model of a Page; items are validated from ORM objects"""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_page(cls, page: Page) -> "PageResponse":
+        return cls.model_validate({"items": page.items, "next_cursor": page.next_cursor}, from_attributes=True)
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque token
+
+    Args:
+        sort_value: Value of the ordering column (datetime or None)
+        row_id: Primary key of the row, used as a tie-breaker
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    if isinstance(sort_value, datetime):
+        raw_value = sort_value.isoformat()
+    elif sort_value is None:
+        raw_value = ""
+    else:
+        raw_value = str(sort_value)
+    raw = f"{raw_value}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(token: str) -> Tuple[str, int]:
+    """
+    Decode a cursor token produced by encode_cursor
+
+    Returns:
+        tuple: (raw sort value, row id)
+
+    Raises:
+        InvalidDataException: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+        raw_value, _, raw_id = raw.rpartition("|")
+        return raw_value, int(raw_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise InvalidDataException("Invalid pagination cursor")
+
+def decode_datetime_cursor(token: str) -> Tuple[datetime, int]:
+    """Decode a cursor whose sort value is a datetime"""
+    raw_value, row_id = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(raw_value), row_id
+    except ValueError:
+        raise InvalidDataException("Invalid pagination cursor")
+
+def decode_optional_datetime_cursor(token: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor whose sort value is a datetime or None"""
+    raw_value, row_id = decode_cursor(token)
+    if raw_value == "":
+        return None, row_id
+    try:
+        return datetime.fromisoformat(raw_value), row_id
+    except ValueError:
+        raise InvalidDataException("Invalid pagination cursor")
+
+def decode_int_cursor(token: str) -> Tuple[int, int]:
+    """Decode a cursor whose sort value is an integer"""
+    raw_value, row_id = decode_cursor(token)
+    try:
+        return int(raw_value), row_id
+    except ValueError:
+        raise InvalidDataException("Invalid pagination cursor")
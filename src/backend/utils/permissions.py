@@ -0,0 +1,65 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+import threading
+
+ADMIN_PERMISSION = "admin"
+
+class PermissionRegistry:
+    """
+    Compiles role permission lists into integer bitmasks
+
+    Every permission name gets a bit the first time it is seen. A role's
+    mask is computed once and cached per role id, so has_permission is a
+    dict lookup plus a bitwise AND instead of a scan over the JSON list.
+    A cached mask is reused only while the role still carries the very same
+    permissions object; a reloaded role (e.g. a fresh RoleSnapshot after a
+    cache invalidation) is recompiled automatically.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._role_masks: Dict[int, Tuple[Any, int]] = {}
+        self._lock = threading.Lock()
+
+    def bit(self, permission: str) -> int:
+        bit = self._bits.get(permission)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.setdefault(permission, 1 << len(self._bits))
+        return bit
+
+    def compile(self, permissions: Iterable[str]) -> int:
+        mask = 0
+        for permission in permissions:
+            mask |= self.bit(permission)
+        return mask
+
+    def mask_for_role(self, role: Any) -> int:
+        permissions = role.permissions
+        cached = self._role_masks.get(role.id)
+        if cached is not None and cached[0] is permissions:
+            return cached[1]
+        mask = self.compile(permissions or ())
+        self._role_masks[role.id] = (permissions, mask)
+        return mask
+
+    def has_permission(self, role: Any, permission: str) -> bool:
+        bit = self._bits.get(permission)
+        if bit is None:
+            # No role has ever been compiled with this permission
+            self.mask_for_role(role)
+            bit = self._bits.get(permission)
+            if bit is None:
+                return False
+        return bool(self.mask_for_role(role) & bit)
+
+    def invalidate(self, role_id: Optional[int] = None) -> None:
+        if role_id is None:
+            self._role_masks.clear()
+        else:
+            self._role_masks.pop(role_id, None)
+
+permission_registry = PermissionRegistry()
+
+def has_permission(role: Any, permission: str) -> bool:
+    """Check if a role (Role or RoleSnapshot) grants a permission"""
+    return permission_registry.has_permission(role, permission)
@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+EPOCH_DAY = date(1970, 1, 1)
+DEFAULT_PERCENTILES = (50, 75, 90, 95)
+
+@dataclass
+class SessionStatistics:
+    """Aggregated session history of a user; all times are UTC"""
+    session_count: int = 0
+    total_seconds: int = 0
+    mean_seconds: float = 0.0
+    percentiles: Dict[int, float] = field(default_factory=dict)
+    first_day: Optional[date] = None
+    # seconds studied per day, starting at first_day
+    daily_seconds: List[int] = field(default_factory=list)
+    active_days: int = 0
+    longest_streak: int = 0
+    current_streak: int = 0
+    # 7x24 seconds by weekday (Monday first) and hour the session started
+    heatmap: List[List[int]] = field(default_factory=lambda: [[0] * 24 for _ in range(7)])
+
+def daily_totals(starts: np.ndarray, ends: np.ndarray) -> tuple:
+    """
+    Seconds per UTC day, splitting sessions that cross midnight
+
+    Args:
+        starts: Session start times as epoch seconds
+        ends: Session end times as epoch seconds, same length as starts
+
+    Returns:
+        tuple: (first epoch day, int64 array of seconds per day)
+    """
+    if starts.size == 0:
+        return 0, np.zeros(0, dtype=np.int64)
+
+    start_days = starts // SECONDS_PER_DAY
+    end_days = (ends - 1) // SECONDS_PER_DAY
+    first_day = int(start_days.min())
+    length = int(end_days.max()) - first_day + 1
+    start_index = start_days - first_day
+    end_index = end_days - first_day
+
+    same_day = start_index == end_index
+    totals = np.bincount(start_index[same_day], weights=(ends - starts)[same_day], minlength=length)
+
+    crossing = ~same_day
+    if crossing.any():
+        first_index, last_index = start_index[crossing], end_index[crossing]
+        head = (start_days[crossing] + 1) * SECONDS_PER_DAY - starts[crossing]
+        tail = ends[crossing] - end_days[crossing] * SECONDS_PER_DAY
+        totals += np.bincount(first_index, weights=head, minlength=length)
+        totals += np.bincount(last_index, weights=tail, minlength=length)
+        # Whole days in between via a difference array
+        steps = np.zeros(length + 1)
+        np.add.at(steps, first_index + 1, SECONDS_PER_DAY)
+        np.add.at(steps, last_index, -SECONDS_PER_DAY)
+        totals += np.cumsum(steps[:length])
+
+    return first_day, np.rint(totals).astype(np.int64)
+
+def streaks(daily_seconds: np.ndarray, last_index: int) -> tuple:
+    """
+    Longest and current run of consecutive active days
+
+    Args:
+        daily_seconds: Seconds per day
+        last_index: Index of today in daily_seconds; the current streak may
+            end today or yesterday
+
+    Returns:
+        tuple: (longest streak, current streak)
+    """
+    active = daily_seconds > 0
+    if not active.any():
+        return 0, 0
+
+    edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    longest = int((run_ends - run_starts).max())
+
+    current = 0
+    last_run_end = run_ends[-1] - 1
+    if last_index - last_run_end <= 1:
+        current = int(run_ends[-1] - run_starts[-1])
+    return longest, current
+
+def compute_session_statistics(
+    starts: Sequence[float],
+    ends: Sequence[float],
+    today: Optional[date] = None,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> SessionStatistics:
+    """
+    Vectorized statistics over session start/end epoch seconds
+
+    Args:
+        starts: Session start times as epoch seconds
+        ends: Session end times as epoch seconds
+        today: Day the current streak is measured against; defaults to the
+            last day with a session
+        percentiles: Session length percentiles to compute
+
+    Returns:
+        SessionStatistics: Totals, percentiles, daily buckets, streaks and heatmap
+    """
+    starts = np.rint(np.asarray(starts, dtype=np.float64)).astype(np.int64)
+    ends = np.rint(np.asarray(ends, dtype=np.float64)).astype(np.int64)
+    valid = ends > starts
+    starts, ends = starts[valid], ends[valid]
+
+    statistics = SessionStatistics()
+    if starts.size == 0:
+        return statistics
+
+    durations = ends - starts
+    statistics.session_count = int(durations.size)
+    statistics.total_seconds = int(durations.sum())
+    statistics.mean_seconds = float(durations.mean())
+    statistics.percentiles = dict(zip(
+        percentiles,
+        np.percentile(durations, percentiles).tolist()
+    ))
+
+    first_day, daily_seconds = daily_totals(starts, ends)
+    statistics.first_day = EPOCH_DAY + timedelta(days=first_day)
+    statistics.daily_seconds = daily_seconds.tolist()
+    statistics.active_days = int(np.count_nonzero(daily_seconds))
+
+    last_index = daily_seconds.size - 1 if today is None else (today - statistics.first_day).days
+    statistics.longest_streak, statistics.current_streak = streaks(daily_seconds, last_index)
+
+    # 1970-01-01 was a Thursday
+    weekdays = (starts // SECONDS_PER_DAY + 3) % 7
+    hours = starts % SECONDS_PER_DAY // 3600
+    heatmap = np.bincount(weekdays * 24 + hours, weights=durations, minlength=7 * 24)
+    statistics.heatmap = heatmap.astype(np.int64).reshape(7, 24).tolist()
+    return statistics